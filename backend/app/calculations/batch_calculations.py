@@ -0,0 +1,306 @@
+import numpy as np
+from dataclasses import dataclass, fields
+from .eigenvalues import ROOT_RESOLUTION, eigenvalue_provider
+from .series import DEFAULT_ACCURACY, DISPLAY_TERMS, MAX_TERMS, evaluate_series, required_terms
+from .semi_infinite import (
+    SHORT_TIME_GEOMETRIES,
+    semi_infinite_heat,
+    semi_infinite_theta,
+    short_time_error,
+    short_time_limit
+)
+from ..models.convection_models import GEOMETRIES
+
+
+@dataclass
+class BatchArrays:
+    """
+    Column-oriented input for a batch of convection calculations.
+
+    Every attribute is a 1-D NumPy array with one entry per row of the batch, so a whole group of
+    rows can be evaluated with array operations instead of one scalar chain per row.
+
+    Attributes:
+        thickness (np.ndarray): Thickness of the material.
+        thermal_diffusivity (np.ndarray): Thermal diffusivity of the material.
+        conductivity_coefficient (np.ndarray): Conductivity coefficient of the material.
+        convection_coefficient (np.ndarray): Convection coefficient of the material.
+        initial_temperature (np.ndarray): Initial temperature of the material.
+        ambient_temperature (np.ndarray): Ambient temperature.
+        density (np.ndarray): Density of the material.
+        specific_heat (np.ndarray): Specific heat capacity of the material.
+        distance (np.ndarray): Distance for calculation.
+        time (np.ndarray): Time for calculation.
+        iterations (np.ndarray): Maximum number of iterations per lambda value of each row.
+        biot (np.ndarray): Biot number of each row (NaN or 0 when it must be calculated).
+        absolute_tolerance (np.ndarray): Absolute tolerance of the lambda values (NaN for the default).
+        relative_tolerance (np.ndarray): Relative tolerance of the lambda values (NaN for the default).
+        accuracy (np.ndarray): Maximum truncation error of the series (NaN for the default).
+    """
+
+    thickness: np.ndarray
+    thermal_diffusivity: np.ndarray
+    conductivity_coefficient: np.ndarray
+    convection_coefficient: np.ndarray
+    initial_temperature: np.ndarray
+    ambient_temperature: np.ndarray
+    density: np.ndarray
+    specific_heat: np.ndarray
+    distance: np.ndarray
+    time: np.ndarray
+    iterations: np.ndarray
+    biot: np.ndarray
+    absolute_tolerance: np.ndarray
+    relative_tolerance: np.ndarray
+    accuracy: np.ndarray
+
+    def subset(self, mask: np.ndarray) -> "BatchArrays":
+        # Las filas seleccionadas por una máscara (por ejemplo, las de una geometría)
+        return BatchArrays(**{field.name: getattr(self, field.name)[mask] for field in fields(self)})
+
+
+@dataclass
+class BatchResults:
+    """
+    Column-oriented results of a batch of convection calculations for one geometry.
+
+    Every row is summed with the terms that its own accuracy and Fourier number need, so the rows
+    of a group can use different numbers of terms. The lambda arrays have one column per term of
+    the row with the most terms, and the columns after a row's own terms are NaN (0 for the
+    iterations). The per-term value arrays keep the first DISPLAY_TERMS columns, which mirror
+    calc1, calc2 and calc3 of the scalar calculation (NaN after the first in one-term rows). Rows
+    solved with the short-time solution
+    have no terms: their per-term values and lambda values are NaN and their terms 0. The
+    remaining arrays have one entry per row.
+
+    Attributes:
+        thermal_diffusivity (np.ndarray): Thermal diffusivity used (calculated when not provided).
+        biot (np.ndarray): Biot number used (calculated when not provided).
+        q_max (np.ndarray): Maximum heat transfer.
+        model (np.ndarray): Model of each row, 'series', 'one_term' or 'semi_infinite'.
+        terms (np.ndarray): Number of terms summed in each row (0 with the short-time solution).
+        lambdas (np.ndarray): Lambda values, shape (rows, most terms).
+        iterations (np.ndarray): Solver iterations used for each lambda value, shape (rows, most terms).
+        residuals (np.ndarray): Residual of the characteristic equation, shape (rows, most terms).
+        value_a (np.ndarray): Amplitude factor of the first terms, shape (rows, DISPLAY_TERMS).
+        value_theta_o (np.ndarray): Center temperature ratio of the first terms, shape
+            (rows, DISPLAY_TERMS).
+        value_theta (np.ndarray): Temperature ratio at the distance of the first terms, shape
+            (rows, DISPLAY_TERMS).
+        value_q (np.ndarray): Heat ratio of the first terms, shape (rows, DISPLAY_TERMS).
+        summation_a (np.ndarray): Sum of the amplitude factors of all the terms.
+        summation_theta_o (np.ndarray): Center temperature ratio.
+        summation_theta (np.ndarray): Temperature ratio at the distance.
+        summation_q (np.ndarray): 1 - Q / Qmax.
+        tem (np.ndarray): Final temperature.
+        q (np.ndarray): Final heat transfer.
+        truncation_error (np.ndarray): Upper bound of the terms left out of the series (NaN with
+            the short-time solution).
+        model_error (np.ndarray): Bound of the error of the short-time solution (NaN with the
+            series).
+    """
+
+    thermal_diffusivity: np.ndarray
+    biot: np.ndarray
+    q_max: np.ndarray
+    model: np.ndarray
+    terms: np.ndarray
+    lambdas: np.ndarray
+    iterations: np.ndarray
+    residuals: np.ndarray
+    value_a: np.ndarray
+    value_theta_o: np.ndarray
+    value_theta: np.ndarray
+    value_q: np.ndarray
+    summation_a: np.ndarray
+    summation_theta_o: np.ndarray
+    summation_theta: np.ndarray
+    summation_q: np.ndarray
+    tem: np.ndarray
+    q: np.ndarray
+    truncation_error: np.ndarray
+    model_error: np.ndarray
+
+
+def _short_time_rows(geometry, dimensionless_time, accuracy):
+    # Filas en que se usa la solución de sólido semi-infinito, como uses_short_time_model pero con
+    # la precisión de cada fila
+    if geometry not in SHORT_TIME_GEOMETRIES:
+        return np.zeros(dimensionless_time.shape, dtype=bool)
+    levels, inverse = np.unique(accuracy, return_inverse=True)
+    limits = np.array([short_time_limit(level) for level in levels.tolist()])[inverse.reshape(-1)]
+    return (dimensionless_time > 0) & (dimensionless_time <= limits)
+
+
+def batch_terms(dimensionless_time, accuracy):
+    """
+    Chooses how many terms each row of a batch sums.
+
+    As in the scalar calculation, a row whose first term alone meets the accuracy sums only that
+    term (one-term mode). The terms that the other rows need are rounded up to DISPLAY_TERMS
+    times a power of two (at most MAX_TERMS), so the rows of a group fall into a few sets that are
+    summed together, and a few rows at small Fourier numbers do not make every row sum their
+    terms. Rows at Fo = 0, whose result is the initial condition, and invalid rows (a negative or
+    not finite Fourier number) use DISPLAY_TERMS.
+
+    Parameters:
+        dimensionless_time (np.ndarray): Fourier number of each row.
+        accuracy (np.ndarray): Maximum truncation error of each row.
+
+    Returns:
+        np.ndarray: The number of terms of each row.
+    """
+    terms = np.full(dimensionless_time.shape, DISPLAY_TERMS, dtype=np.int64)
+    summed = np.isfinite(dimensionless_time) & (dimensionless_time > 0)
+    needed = required_terms(dimensionless_time[summed], accuracy[summed])
+    padded = np.maximum(needed, DISPLAY_TERMS)
+    rounded = DISPLAY_TERMS * 2 ** np.ceil(np.log2(padded / DISPLAY_TERMS))
+    terms[summed] = np.where(needed == 1, 1, np.minimum(rounded, MAX_TERMS)).astype(np.int64)
+    return terms
+
+
+def calc_qmax_batch(arrays, characteristic_length, geometry):
+    """
+    Vectorized equivalent of calc_qmax.
+
+    Parameters:
+        arrays (BatchArrays): Input columns of the batch.
+        characteristic_length (np.ndarray): Characteristic length of each row.
+        geometry (str): The geometry of the batch ('plate', 'cylinder' or 'sphere').
+
+    Returns:
+        np.ndarray: The maximum heat transfer of each row.
+    """
+    capacity = arrays.density * arrays.specific_heat * \
+        (arrays.ambient_temperature - arrays.initial_temperature)
+    if geometry == "plate":
+        return arrays.thickness * capacity
+    if geometry == "cylinder":
+        return capacity * np.pi * characteristic_length ** 2
+    return capacity * (4 / 3) * np.pi * characteristic_length ** 3
+
+
+def evaluate_batch(arrays, geometry):
+    """
+    Evaluates a whole group of rows sharing the same geometry in one pass.
+
+    Follows the same steps as the scalar calculation (InitialCalcs, calc_biot, calc_alpha, the
+    eigenvalues, evaluate_series and ConvectionResults), but over NumPy arrays. The rows are
+    summed in sets with the same number of terms (see batch_terms), including the one-term mode
+    of the scalar calculation, and rows at Fo = 0 return the initial condition exactly. For the plate and the sphere, rows at short times use the
+    semi-infinite solid solution, as the scalar calculation does, instead of summing the series
+    with many terms. Rows with invalid values produce NaN or infinite results instead of
+    raising, so the caller can report them individually.
+
+    Parameters:
+        arrays (BatchArrays): Input columns of the batch.
+        geometry (str): The geometry of the batch ('plate', 'cylinder' or 'sphere').
+
+    Returns:
+        BatchResults: The results of every row of the batch.
+    """
+    with np.errstate(all="ignore"):
+        characteristic_length = arrays.thickness / 2
+
+        biot = arrays.biot.copy()
+        missing = np.isnan(biot) | (biot == 0)
+        biot[missing] = (arrays.convection_coefficient * characteristic_length /
+                         arrays.conductivity_coefficient)[missing]
+
+        thermal_diffusivity = arrays.thermal_diffusivity.copy()
+        missing = np.isnan(thermal_diffusivity) | (thermal_diffusivity == 0)
+        thermal_diffusivity[missing] = (arrays.conductivity_coefficient /
+                                        (arrays.density * arrays.specific_heat))[missing]
+
+        dimensionless_distance = arrays.distance / characteristic_length
+        dimensionless_time = arrays.time * thermal_diffusivity / characteristic_length ** 2
+        q_max = calc_qmax_batch(arrays, characteristic_length, geometry)
+
+        absolute_tolerance = np.where(np.isnan(arrays.absolute_tolerance), 0.0,
+                                      arrays.absolute_tolerance)
+        relative_tolerance = np.where(np.isnan(arrays.relative_tolerance), ROOT_RESOLUTION,
+                                      arrays.relative_tolerance)
+        accuracy = np.where(np.isnan(arrays.accuracy), DEFAULT_ACCURACY, arrays.accuracy)
+
+    count = dimensionless_time.size
+    terms = batch_terms(dimensionless_time, accuracy)
+    width = int(terms.max(initial=DISPLAY_TERMS))
+    lambdas = np.full((count, width), np.nan)
+    iterations = np.zeros((count, width), dtype=np.int64)
+    residuals = np.full((count, width), np.nan)
+    values = {name: np.full((count, DISPLAY_TERMS), np.nan)
+              for name in ("value_a", "value_theta_o", "value_theta", "value_q")}
+    summations = {name: np.full(count, np.nan)
+                  for name in ("summation_a", "summation_theta_o", "summation_theta", "summation_q")}
+    truncation_error = np.full(count, np.nan)
+
+    # Fo negativo o no finito: la fila es inválida y queda en NaN
+    short = _short_time_rows(geometry, dimensionless_time, accuracy)
+    start = dimensionless_time == 0
+    summed = start | (np.isfinite(dimensionless_time) & (dimensionless_time > 0) & ~short)
+    terms[short] = 0
+    for size in np.unique(terms[summed]).tolist():
+        rows = summed & (terms == size)
+        # Los lambdas solo dependen de Biot y de los criterios de convergencia: se buscan una vez
+        # por combinación distinta, en la caché compartida con los cálculos individuales
+        keys = np.stack([biot[rows], arrays.iterations[rows], absolute_tolerance[rows],
+                         relative_tolerance[rows]], axis=1)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        solution = eigenvalue_provider.get_many(geometry, unique_keys[:, 0],
+                                                unique_keys[:, 1].astype(np.int64),
+                                                unique_keys[:, 2], unique_keys[:, 3], size)
+        lambdas[rows, :size] = solution.roots[inverse]
+        iterations[rows, :size] = solution.iterations[inverse]
+        residuals[rows, :size] = solution.residuals[inverse]
+
+        series = evaluate_series(geometry, lambdas[rows, :size], dimensionless_time[rows],
+                                 dimensionless_distance[rows])
+        shown = min(size, DISPLAY_TERMS)
+        for name, value in values.items():
+            value[rows, :shown] = getattr(series, name)[:, :shown]
+        for name, value in summations.items():
+            value[rows] = getattr(series, name)
+        truncation_error[rows] = series.truncation_error
+
+    # En Fo = 0 la serie no converge: se devuelve la condición inicial exacta, como evaluate_grid
+    summations["summation_theta_o"][start] = 1.0
+    summations["summation_theta"][start] = 1.0
+    summations["summation_q"][start] = 1.0
+    truncation_error[start] = 0.0
+
+    # Tiempos cortos de la placa y la esfera: solución de sólido semi-infinito, sin valores lambda
+    model_error = np.full(count, np.nan)
+    if short.any():
+        with np.errstate(all="ignore"):
+            short_time = dimensionless_time[short]
+            summations["summation_theta_o"][short] = semi_infinite_theta(
+                geometry, biot[short], short_time, 0.0)
+            summations["summation_theta"][short] = semi_infinite_theta(
+                geometry, biot[short], short_time, dimensionless_distance[short])
+            summations["summation_q"][short] = 1 - semi_infinite_heat(geometry, biot[short],
+                                                                      short_time)
+            model_error[short] = short_time_error(short_time)
+
+    with np.errstate(all="ignore"):
+        tem = summations["summation_theta"] * (arrays.initial_temperature -
+                                               arrays.ambient_temperature) + \
+            arrays.ambient_temperature
+        q = (1 - summations["summation_q"]) * q_max
+
+    return BatchResults(
+        thermal_diffusivity=thermal_diffusivity,
+        biot=biot,
+        q_max=q_max,
+        model=np.where(short, "semi_infinite", np.where(terms == 1, "one_term", "series")),
+        terms=terms,
+        lambdas=lambdas,
+        iterations=iterations,
+        residuals=residuals,
+        **values,
+        **summations,
+        tem=tem,
+        q=q,
+        truncation_error=truncation_error,
+        model_error=model_error,
+    )
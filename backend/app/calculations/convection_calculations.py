@@ -1,10 +1,12 @@
+import logging
 import math
-import numpy as np
-import scipy.special as sp
-import sympy as sy
 from dataclasses import dataclass
+from typing import Optional
+from .eigenvalues import eigenvalue_provider
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class InitialCalcsData:
     thickness: float
     thermal_diffusivity: float
@@ -19,6 +21,9 @@ class InitialCalcsData:
     iterations: int
     biot: float
     geometry: str
+    absolute_tolerance: Optional[float] = None
+    relative_tolerance: Optional[float] = None
+    accuracy: Optional[float] = None
 
 class InitialCalcs:
     """
@@ -38,11 +43,21 @@ class InitialCalcs:
         specific_heat (float): Specific heat capacity of the material.
         distance (float): Distance for calculation.
         time (float): Time for calculation.
+        absolute_tolerance (float): Absolute tolerance of the lambda values (None for the default).
+        relative_tolerance (float): Relative tolerance of the lambda values (None for the default).
+        accuracy (float): Maximum truncation error of the series (None for the default).
 
     Methods:
         __init__(self, initial_parameters): Initializes the InitialCalcs object with a list of initial values.
     """
 
+    __slots__ = (
+        "thickness", "thermal_diffusivity", "conductivity_coefficient", "convection_coefficient",
+        "initial_temperature", "ambient_temperature", "density", "specific_heat", "distance",
+        "time", "iterations", "biot", "geometry", "absolute_tolerance", "relative_tolerance",
+        "accuracy", "characteristic_length", "dimensionless_distance", "dimensionless_time",
+    )
+
     def __init__(self, initial_parameters):
         # thickness, thermal_diffusivity, conductivity_coefficient, convection_coefficient, initial_temperature, ambient_temperature, density, specific_heat, distance, time, iterations, biot, geometry = initial_parameters
         self.thickness = initial_parameters.thickness
@@ -58,6 +73,9 @@ class InitialCalcs:
         self.iterations = initial_parameters.iterations
         self.biot = initial_parameters.biot
         self.geometry = initial_parameters.geometry
+        self.absolute_tolerance = initial_parameters.absolute_tolerance
+        self.relative_tolerance = initial_parameters.relative_tolerance
+        self.accuracy = initial_parameters.accuracy
         characteristic_length = self.thickness / 2
         self.characteristic_length = characteristic_length
 
@@ -141,46 +159,41 @@ class LambdaPlate:
     """
     A class for calculating the lambda values in the context of thermal analysis for a plate.
 
-    This class calculates three lambda values based on the Biot number and a specified number of iterations. These lambda values are crucial for solving heat transfer problems in plates, especially when dealing with transient heat conduction.
+    This class calculates three lambda values based on the Biot number. These lambda values are crucial for solving heat transfer problems in plates, especially when dealing with transient heat conduction.
+
+    The lambda values are the roots of the characteristic equation lambda * tan(lambda) = Bi. They only depend on the Biot number, so they are taken from the shared eigenvalue provider, which caches exact solves and polishes an interpolated guess otherwise.
 
     Attributes:
-        lambda1 (float): The first lambda value calculated using the Biot number and iterative approach.
-        lambda2 (float): The second lambda value, incorporating an additional pi to the iterative calculation.
-        lambda3 (float): The third lambda value, incorporating an additional 2*pi to the iterative calculation.
+        lambda1 (float): The first lambda value, between 0 and pi/2.
+        lambda2 (float): The second lambda value, between pi and 3*pi/2.
+        lambda3 (float): The third lambda value, between 2*pi and 5*pi/2.
+        iterations (tuple): Number of solver iterations used for each lambda value.
+        residuals (tuple): Absolute value of the characteristic equation at each lambda value.
 
     Parameters:
         biot (float): The Biot number, a dimensionless number important in heat transfer calculations.
-        n (int): The number of iterations to use in the calculation of lambda values.
+        n (int): The maximum number of iterations for each lambda value. The solver stops earlier as soon as the tolerance is met.
+        absolute_tolerance (float, optional): Absolute tolerance on the lambda values.
+        relative_tolerance (float, optional): Tolerance on the lambda values relative to their size (defaults to the floating point resolution).
 
     Methods:
-        __init__(self, biot, n):
-            Initializes the LambdaPlate object by calculating lambda1, lambda2, and lambda3 based on the provided Biot number and number of iterations.
+        __init__(self, biot, n, absolute_tolerance=None, relative_tolerance=None):
+            Initializes the LambdaPlate object by calculating lambda1, lambda2, and lambda3 based on the provided Biot number.
     """
 
-    def __init__(self, biot, n):
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = math.atan(biot / lambda_val)
-            lambda_val = lambda_new
-        self.lambda1 = lambda_val
-
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = math.atan(biot / lambda_val) + math.pi
-            lambda_val = lambda_new
-        self.lambda2 = lambda_val
-
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = math.atan(biot / lambda_val) + (2 * math.pi)
-            lambda_val = lambda_new
-        self.lambda3 = lambda_val
+    def __init__(self, biot, n, absolute_tolerance=None, relative_tolerance=None):
+        solution = eigenvalue_provider.get('plate', biot, n, absolute_tolerance, relative_tolerance)
+        self.lambda1, self.lambda2, self.lambda3 = solution.roots
+        self.iterations = solution.iterations
+        self.residuals = solution.residuals
     
     def to_dict(self):
         return {
             'lambda1': self.lambda1,
             'lambda2': self.lambda2,
-            'lambda3': self.lambda3
+            'lambda3': self.lambda3,
+            'iterations': list(self.iterations),
+            'residuals': list(self.residuals)
         }
 
 
@@ -188,55 +201,43 @@ class LambdaCylinder:
     """
     A class for calculating the lambda values for a cylindrical geometry in thermal analysis.
 
-    This class calculates three lambda values based on the Biot number and a specified number of iterations. These lambda values are essential for analyzing heat transfer in cylindrical objects, particularly in the context of transient heat conduction problems.
+    This class calculates three lambda values based on the Biot number. These lambda values are essential for analyzing heat transfer in cylindrical objects, particularly in the context of transient heat conduction problems.
 
-    The calculation uses the properties of Bessel functions, which are crucial in the thermal analysis of cylindrical geometries. The iterative method refines the lambda values to achieve a more accurate solution.
+    The lambda values are the roots of the characteristic equation lambda * J1(lambda) = Bi * J0(lambda), built on the Bessel functions of the first kind. As in LambdaPlate, they come from the shared eigenvalue provider.
 
     Attributes:
-        lambda1 (float): The first lambda value, starting from an initial guess of 1.
-        lambda2 (float): The second lambda value, starting from an initial guess of 4.
-        lambda3 (float): The third lambda value, starting from an initial guess of 8.
+        lambda1 (float): The first lambda value, below the first zero of J0.
+        lambda2 (float): The second lambda value, between the first zero of J1 and the second zero of J0.
+        lambda3 (float): The third lambda value, between the second zero of J1 and the third zero of J0.
+        iterations (tuple): Number of solver iterations used for each lambda value.
+        residuals (tuple): Absolute value of the characteristic equation at each lambda value.
 
     Parameters:
         biot (float): The Biot number, a dimensionless number representing the ratio of conductive to convective heat transfer rates across a boundary.
-        n (int): The number of iterations to refine the lambda values.
+        n (int): The maximum number of iterations for each lambda value. The solver stops earlier as soon as the tolerance is met.
+        absolute_tolerance (float, optional): Absolute tolerance on the lambda values.
+        relative_tolerance (float, optional): Tolerance on the lambda values relative to their size (defaults to the floating point resolution).
 
     Methods:
-        __init__(self, biot, n):
-            Initializes the LambdaCylinder object by calculating lambda1, lambda2, and lambda3 based on the provided Biot number and number of iterations.
+        __init__(self, biot, n, absolute_tolerance=None, relative_tolerance=None):
+            Initializes the LambdaCylinder object by calculating lambda1, lambda2, and lambda3 based on the provided Biot number.
     """
 
-    def __init__(self, biot, n):
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = lambda_val - (lambda_val * sp.jv(1, lambda_val) - biot * sp.jv(
-                0, lambda_val)) / (lambda_val * sp.jv(0, lambda_val) + biot * sp.jv(1, lambda_val))
-            lambda_val = lambda_new
-        self.lambda1 = lambda_val
-
-        lambda_val = 4
-        for i in range(n):
-            lambda_new = lambda_val - (lambda_val * sp.jv(1, lambda_val) - biot * sp.jv(
-                0, lambda_val)) / (lambda_val * sp.jv(0, lambda_val) + biot * sp.jv(1, lambda_val))
-            lambda_val = lambda_new
-        self.lambda2 = lambda_val
-
-        lambda_val = 8
-        for i in range(n):
-            lambda_new = lambda_val - (lambda_val * sp.jv(1, lambda_val) - biot * sp.jv(
-                0, lambda_val)) / (lambda_val * sp.jv(0, lambda_val) + biot * sp.jv(1, lambda_val))
-            lambda_val = lambda_new
-        self.lambda3 = lambda_val
-
-        print("Lambda1 Cilindro: ", self.lambda1)
-        print("Lambda2: ", self.lambda2)
-        print("Lambda3: ", self.lambda3)
+    def __init__(self, biot, n, absolute_tolerance=None, relative_tolerance=None):
+        solution = eigenvalue_provider.get('cylinder', biot, n, absolute_tolerance, relative_tolerance)
+        self.lambda1, self.lambda2, self.lambda3 = solution.roots
+        self.iterations = solution.iterations
+        self.residuals = solution.residuals
+
+        logger.debug("Lambdas cilindro: %s, %s, %s", self.lambda1, self.lambda2, self.lambda3)
 
     def to_dict(self):
         return {
             'lambda1': self.lambda1,
             'lambda2': self.lambda2,
-            'lambda3': self.lambda3
+            'lambda3': self.lambda3,
+            'iterations': list(self.iterations),
+            'residuals': list(self.residuals)
         }
 
 
@@ -244,239 +245,44 @@ class LambdaSphere:
     """
     A class for calculating the lambda values for a spherical geometry in thermal analysis.
 
-    This class calculates three lambda values based on the Biot number and a specified number of iterations. These lambda values are crucial for solving heat transfer problems in spherical objects, especially in the context of transient heat conduction.
+    This class calculates three lambda values based on the Biot number. These lambda values are crucial for solving heat transfer problems in spherical objects, especially in the context of transient heat conduction.
 
-    The iterative method used for calculation adjusts the lambda values based on the inverse cotangent function, reflecting the unique thermal properties and challenges associated with spherical geometries.
+    The lambda values are the roots of the characteristic equation 1 - lambda * cot(lambda) = Bi, solved on floats by the shared eigenvalue provider (see LambdaPlate).
 
     Attributes:
-        lambda1 (float): The first lambda value, refined through iterations starting from an initial guess.
-        lambda2 (float): The second lambda value, incorporating an additional pi to the iterative calculation for phase adjustment.
-        lambda3 (float): The third lambda value, incorporating an additional 2*pi for further phase adjustment.
+        lambda1 (float): The first lambda value, between 0 and pi.
+        lambda2 (float): The second lambda value, between pi and 2*pi.
+        lambda3 (float): The third lambda value, between 2*pi and 3*pi.
+        iterations (tuple): Number of solver iterations used for each lambda value.
+        residuals (tuple): Absolute value of the characteristic equation at each lambda value.
 
     Parameters:
         biot (float): The Biot number, a dimensionless number important in heat transfer calculations, representing the ratio of conductive to convective heat transfer rates across a boundary.
-        n (int): The number of iterations to use in the calculation of lambda values.
+        n (int): The maximum number of iterations for each lambda value. The solver stops earlier as soon as the tolerance is met.
+        absolute_tolerance (float, optional): Absolute tolerance on the lambda values.
+        relative_tolerance (float, optional): Tolerance on the lambda values relative to their size (defaults to the floating point resolution).
 
     Methods:
-        __init__(self, biot, n):
-            Initializes the LambdaSphere object by calculating lambda1, lambda2, and lambda3 based on the provided Biot number and number of iterations.
+        __init__(self, biot, n, absolute_tolerance=None, relative_tolerance=None):
+            Initializes the LambdaSphere object by calculating lambda1, lambda2, and lambda3 based on the provided Biot number.
     """
     
-    def __init__(self, biot, n):
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = sy.acot((1 - biot) / lambda_val)
-            lambda_val = lambda_new
-        self.lambda1 = np.float64(lambda_val) # Convert to float64 to avoid JSON serialization issues
-
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = sy.acot((1 - biot) / lambda_val) + math.pi
-            lambda_val = lambda_new
-        self.lambda2 = np.float64(lambda_val) # Convert to float64 to avoid JSON serialization issues
-
-        lambda_val = 1
-        for i in range(n):
-            lambda_new = sy.acot((1 - biot) / lambda_val) + (2 * math.pi)
-            lambda_val = lambda_new
-        self.lambda3 = np.float64(lambda_val) # Convert to float64 to avoid JSON serialization issues
+    def __init__(self, biot, n, absolute_tolerance=None, relative_tolerance=None):
+        solution = eigenvalue_provider.get('sphere', biot, n, absolute_tolerance, relative_tolerance)
+        self.lambda1, self.lambda2, self.lambda3 = solution.roots
+        self.iterations = solution.iterations
+        self.residuals = solution.residuals
     
     def to_dict(self):
         return {
             'lambda1': self.lambda1,
             'lambda2': self.lambda2,
-            'lambda3': self.lambda3
-        }
-
-
-class Plate:
-    """
-    A class for calculating various thermal properties of a plate based on given lambda values and calculated values.
-
-    This class computes specific thermal properties such as the amplitude factor (a), the initial temperature distribution (theta_o), the temperature distribution at a given time and position (theta), and the heat flux (q) for a plate. These calculations are essential for understanding the thermal behavior of the plate under given conditions.
-
-    Attributes:
-        value_a (float): The amplitude factor 'a', calculated based on the lambda value.
-        value_theta_o (float): The initial temperature distribution 'theta_o', calculated using the amplitude factor and the exponential decay of temperature over time.
-        value_theta (float): The temperature distribution 'theta' at a given time and position, calculated using the initial temperature distribution and the cosine of the product of lambda value and dimensionless distance.
-        value_q (float): The heat flux 'q', calculated using the initial temperature distribution and the sine of lambda value divided by lambda value itself.
-
-    Parameters:
-        calc_values (CalculatedValues): An object of CalculatedValues class containing the dimensionless time and distance used in the calculations.
-        lambda_val (float): The lambda value used in the calculations, typically determined from the solution of the characteristic equation for the plate.
-
-    Methods:
-        __init__(self, calc_values, lambda_val):
-            Initializes the Plate object with calculated thermal properties based on the provided lambda value and calculated values object.
-    """
-
-    def __init__(self, calc_values, lambda_val):
-        lambda_a = (4 * math.sin(lambda_val)) / \
-            (2 * lambda_val + math.sin(2 * lambda_val))
-        self.value_a = lambda_a
-
-        lambda_theta_o = lambda_a * \
-            math.exp(-(lambda_val ** 2 * calc_values.dimensionless_time))
-        self.value_theta_o = lambda_theta_o
-
-        lambda_theta = lambda_theta_o * \
-            math.cos(lambda_val * calc_values.dimensionless_distance)
-        self.value_theta = lambda_theta
-
-        lambda_q = (lambda_theta_o * math.sin(lambda_val)) / lambda_val
-        self.value_q = lambda_q
-
-    def to_dict(self):
-        return {
-            'value_a': self.value_a,
-            'value_theta_o': self.value_theta_o,
-            'value_theta': self.value_theta,
-            'value_q': self.value_q
-        }
-
-
-class Cylinder:
-    """
-    A class for calculating various thermal properties of a cylinder based on given lambda values and calculated values.
-
-    This class computes specific thermal properties such as the amplitude factor (a), the initial temperature distribution (theta_o), the temperature distribution at a given time and position (theta), and the heat flux (q) for a cylinder. These calculations are essential for understanding the thermal behavior of the cylinder under given conditions.
-
-    The calculations utilize Bessel functions, reflecting the cylindrical geometry's influence on the heat transfer process.
-
-    Attributes:
-        value_a (float): The amplitude factor 'a', calculated based on the lambda value and Bessel functions.
-        value_theta_o (float): The initial temperature distribution 'theta_o', calculated using the amplitude factor and the exponential decay of temperature over time.
-        value_theta (float): The temperature distribution 'theta' at a given time and position, calculated using the initial temperature distribution and the Bessel function of the first kind.
-        value_q (float): The heat flux 'q', calculated using the initial temperature distribution and the derivative of the Bessel function of the first kind.
-
-    Parameters:
-        calc_values (CalculatedValues): An object of CalculatedValues class containing the dimensionless time and distance used in the calculations.
-        lambda_val (float): The lambda value used in the calculations, typically determined from the solution of the characteristic equation for the cylinder.
-
-    Methods:
-        __init__(self, calc_values, lambda_val):
-            Initializes the Cylinder object with calculated thermal properties based on the provided lambda value and calculated values object.
-    """
-
-    def __init__(self, calc_values, lambda_val):
-        lambda_a = (2 / lambda_val) * sp.jv(1, lambda_val) / (sp.jv(0, lambda_val) ** 2 + sp.jv(1, lambda_val) ** 2)
-        self.value_a = np.float64(lambda_a)
-        print(lambda_a, "aaa")
-
-        lambda_theta_o = lambda_a * math.exp(-(lambda_val ** 2 * calc_values.dimensionless_time))
-        self.value_theta_o = np.float64(lambda_theta_o)
-        print(lambda_theta_o, "ooo")
-
-        lambda_theta = lambda_theta_o * sp.jv(0, lambda_val * calc_values.dimensionless_distance)
-        self.value_theta = np.float64(lambda_theta)
-        print(lambda_theta, "tttt")
-
-        lambda_q = 2 * lambda_theta_o * sp.jv(1, lambda_val) / lambda_val
-        self.value_q = np.float64(lambda_q)
-        print(lambda_q, "qqqq")
-    
-    def to_dict(self):
-        return {
-            'value_a': self.value_a,
-            'value_theta_o': self.value_theta_o,
-            'value_theta': self.value_theta,
-            'value_q': self.value_q
-        }
-
-
-
-class Sphere:
-    """
-    A class for calculating various thermal properties of a sphere based on given lambda values and calculated values.
-
-    This class computes specific thermal properties such as the amplitude factor (a), the initial temperature distribution (theta_o), the temperature distribution at a given time and position (theta), and the heat flux (q) for a sphere. These calculations are essential for understanding the thermal behavior of the sphere under given conditions.
-
-    The calculations are based on spherical coordinates and take into account the unique aspects of heat transfer in spherical geometries, such as the distribution of temperature and heat flux over the sphere's surface.
-
-    Attributes:
-        value_a (float): The amplitude factor 'a', calculated based on the lambda value and its trigonometric functions, representing the initial amplitude of temperature variation.
-        value_theta_o (float): The initial temperature distribution 'theta_o', calculated using the amplitude factor and the exponential decay of temperature over time.
-        value_theta (float): The temperature distribution 'theta' at a given time and position, calculated using the initial temperature distribution and the sine of lambda value times the dimensionless distance, divided by the product of lambda value and dimensionless distance.
-        value_q (float): The heat flux 'q', calculated using the initial temperature distribution and the trigonometric functions of lambda value, representing the rate of heat transfer per unit area.
-
-    Parameters:
-        calc_values (CalculatedValues): An object of CalculatedValues class containing the dimensionless time and distance used in the calculations.
-        lambda_val (float): The lambda value used in the calculations, typically determined from the solution of the characteristic equation for the sphere.
-
-    Methods:
-        __init__(self, calc_values, lambda_val):
-            Initializes the Sphere object with calculated thermal properties based on the provided lambda value and calculated values object.
-    """
-
-    def __init__(self, calc_values, lambda_val):
-        lambda_a = 4 * (math.sin(lambda_val) - lambda_val * math.cos(lambda_val)
-                        ) / (2 * lambda_val - math.sin(2 * lambda_val))
-        self.value_a = np.float64(lambda_a)
-
-        lambda_theta_o = lambda_a * \
-            math.exp(-(lambda_val ** 2 * calc_values.dimensionless_time))
-        self.value_theta_o = np.float64(lambda_theta_o)
-
-        if(calc_values.dimensionless_distance == 0):
-            parte_espacial = 1
-        else:
-            parte_espacial = math.sin(lambda_val * calc_values.dimensionless_distance) / (lambda_val * calc_values.dimensionless_distance)
-
-        lambda_theta = lambda_theta_o * parte_espacial
-
-        self.value_theta = np.float64(lambda_theta)
-
-        lambda_q = 3 * lambda_theta_o * \
-            (math.sin(lambda_val) - lambda_val *
-             math.cos(lambda_val)) / lambda_val ** 3
-        self.value_q = np.float64(lambda_q)
-
-    def to_dict(self):
-        return {
-            'value_a': self.value_a,
-            'value_theta_o': self.value_theta_o,
-            'value_theta': self.value_theta,
-            'value_q': self.value_q
+            'lambda3': self.lambda3,
+            'iterations': list(self.iterations),
+            'residuals': list(self.residuals)
         }
 
 
-
-class SumTable:
-    """
-    SumTable class to calculate the summation of values from three objects.
-
-    This class takes three objects that are expected to have the attributes value_a, value_theta_o,
-    value_theta, and value_q. It calculates the summation of these values for each attribute and
-    stores them as attributes of the SumTable instance.
-
-    Attributes:
-        summation_a (float): Summation of the 'value_a' values from the three objects.
-        summation_theta_o (float): Summation of the 'value_theta_o' values from the three objects.
-        summation_theta (float): Summation of the 'value_theta' values from the three objects.
-        summation_q (float): Summation of the 'value_q' values from the three objects.
-
-    Args:
-        lambda_1: The first object with the attributes value_a, value_theta_o         value_theta, and value_q.
-        lambda_2: The second object with the attributes value_a, value_theta_o, value_theta, and value_q.
-        lambda_3: The third object with the attributes value_a, value_theta_o, value_theta, and value_q.
-    """
-
-    def __init__(self, lambda_1, lambda_2, lambda_3):
-        summation_a = lambda_1.value_a + lambda_2.value_a + lambda_3.value_a
-        self.summation_a = summation_a
-
-        summation_theta_o = lambda_1.value_theta_o + \
-            lambda_2.value_theta_o + lambda_3.value_theta_o
-        self.summation_theta_o = summation_theta_o
-
-        summation_theta = lambda_1.value_theta + \
-            lambda_2.value_theta + lambda_3.value_theta
-        self.summation_theta = summation_theta
-
-        summation_q = lambda_1.value_q + lambda_2.value_q + lambda_3.value_q
-        self.summation_q = summation_q
-        print(summation_a, summation_theta_o, summation_theta, summation_q)
-
 class ConvectionResults:
     """
     ConvectionResults class to calculate and store convection results.
@@ -503,95 +309,3 @@ class ConvectionResults:
 
         q = (1 - summation_results.summation_q) * q_max
         self.q = q
-
-
-class FinalValues:
-    """
-    Class for storing and managing the final calculated values.
-
-    Attributes:
-        thickness (float): Thickness of the material.
-        thermal_diffusivity (float): Thermal diffusivity of the material.
-        conductivity_coefficient (float): Conductivity coefficient of the material.
-        convection_coefficient (float): Convection coefficient of the material.
-        initial_temperature (float): Initial temperature of the material.
-        ambient_temperature (float): Ambient temperature.
-        density (float): Density of the material.
-        specific_heat (float): Specific heat capacity of the material.
-        distance (float): Distance considered for the calculation.
-        time (float): Total analysis time.
-        iterations (int): Number of iterations performed.
-        biot (float): Biot number of the analysis.
-        geometry (str): Geometry of the analyzed object.
-        q_max (float): Maximum heat flux.
-        calc1, calc2, calc3 (float): Intermediate calculation results.
-        lambda (float): Lambda value used in the calculations.
-        value_a (float): Summation of 'a' calculated.
-        value_theta_o (float): Summation of initial theta calculated.
-        value_theta (float): Summation of theta calculated.
-        value_q (float): Summation of heat flux calculated.
-        tem (float): Final temperature calculated.
-        q (float): Final heat flux calculated.
-
-    Parameters:
-        calcs (obj): Object containing the initial calculations and attributes.
-        q_max (float): Maximum heat flux.
-        calc1, calc2, calc3 (float): Intermediate calculation results.
-        lambda_val (float): Lambda value used in the calculations.
-        summation (obj): Object containing the calculated summations.
-        results (obj): Object containing the final temperature and heat flux results.
-    """
-
-    def __init__(self, calcs, q_max, calc1, calc2, calc3, lambda_val, summation, results):
-        self.thickness = calcs.thickness
-        self.thermal_diffusivity = calcs.thermal_diffusivity
-        self.conductivity_coefficient = calcs.conductivity_coefficient
-        self.convection_coefficient = calcs.convection_coefficient
-        self.initial_temperature = calcs.initial_temperature
-        self.ambient_temperature = calcs.ambient_temperature
-        self.density = calcs.density
-        self.specific_heat = calcs.specific_heat
-        self.distance = calcs.distance
-        self.time = calcs.time
-        self.iterations = calcs.iterations
-        self.biot = calcs.biot
-        self.geometry = calcs.geometry
-        self.q_max = q_max
-        self.calc1 = calc1
-        self.calc2 = calc2
-        self.calc3 = calc3
-        self.lambda_val = lambda_val
-        self.value_a = summation.summation_a
-        self.value_theta_o = summation.summation_theta_o
-        self.value_theta = summation.summation_theta
-        self.value_q = summation.summation_q
-        self.tem = results.tem
-        self.q = results.q
-
-    def to_dict(self):
-        return {
-            'thickness': self.thickness,
-            'thermal_diffusivity': self.thermal_diffusivity,
-            'conductivity_coefficient': self.conductivity_coefficient,
-            'convection_coefficient': self.convection_coefficient,
-            'initial_temperature': self.initial_temperature,
-            'ambient_temperature': self.ambient_temperature,
-            'density': self.density,
-            'specific_heat': self.specific_heat,
-            'distance': self.distance,
-            'time': self.time,
-            'iterations': self.iterations,
-            'biot': self.biot,
-            'geometry': self.geometry,
-            'q_max': self.q_max,
-            'calc1': self.calc1.to_dict(),
-            'calc2': self.calc2.to_dict(),
-            'calc3': self.calc3.to_dict(),
-            'lambda_val': self.lambda_val.to_dict(),
-            'value_a': self.value_a,
-            'value_theta_o': self.value_theta_o,
-            'value_theta': self.value_theta,
-            'value_q': self.value_q,
-            'tem': self.tem,
-            'q': self.q
-        }
@@ -0,0 +1,529 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from .lazy import scipy_special
+
+# Tolerancia relativa por defecto: la resolución de un float de doble precisión
+ROOT_RESOLUTION = 4 * np.finfo(float).eps
+DEFAULT_MAX_ITERATIONS = 100
+# Por debajo de este paso relativo, un paso de Newton que no disminuye solo es ruido de redondeo
+NOISE_STEP = 1e-8
+
+
+def plate_characteristic(lambdas, biot):
+    """
+    Evaluates the characteristic equation of the plate and its derivative.
+
+    The equation lambda * tan(lambda) = Bi is multiplied by cos(lambda) to remove its poles, giving
+    f(lambda) = lambda * sin(lambda) - Bi * cos(lambda), which has exactly one root in each interval
+    ((n - 1) * pi, (n - 1/2) * pi).
+
+    Parameters:
+        lambdas (np.ndarray): Values of lambda where the equation is evaluated.
+        biot (np.ndarray): Biot number, broadcastable against lambdas.
+
+    Returns:
+        tuple: Arrays f(lambda) and f'(lambda).
+    """
+    sin = np.sin(lambdas)
+    cos = np.cos(lambdas)
+    return lambdas * sin - biot * cos, (1 + biot) * sin + lambdas * cos
+
+
+@lru_cache(maxsize=None)
+def plate_brackets(count):
+    """
+    Returns the interval that contains each root of the plate characteristic equation.
+
+    Parameters:
+        count (int): Number of roots.
+
+    Returns:
+        tuple: Arrays lower and upper of shape (count,), with root n inside
+            ((n - 1) * pi, (n - 1/2) * pi).
+    """
+    lower = np.arange(count) * np.pi
+    return lower, lower + np.pi / 2
+
+
+def cylinder_characteristic(lambdas, biot):
+    """
+    Evaluates the characteristic equation of the cylinder and its derivative.
+
+    The equation lambda * J1(lambda) / J0(lambda) = Bi is multiplied by J0(lambda), giving
+    f(lambda) = lambda * J1(lambda) - Bi * J0(lambda), which has exactly one root between each zero
+    of J1 and the next zero of J0.
+
+    Parameters:
+        lambdas (np.ndarray): Values of lambda where the equation is evaluated.
+        biot (np.ndarray): Biot number, broadcastable against lambdas.
+
+    Returns:
+        tuple: Arrays f(lambda) and f'(lambda).
+    """
+    sp = scipy_special()
+    j0 = sp.j0(lambdas)
+    j1 = sp.j1(lambdas)
+    return lambdas * j1 - biot * j0, lambdas * j0 + biot * j1
+
+
+@lru_cache(maxsize=None)
+def cylinder_brackets(count):
+    """
+    Returns the interval that contains each root of the cylinder characteristic equation.
+
+    The zeros of the Bessel functions are computed once per count and reused.
+
+    Parameters:
+        count (int): Number of roots.
+
+    Returns:
+        tuple: Arrays lower and upper of shape (count,). Root n lies between the (n - 1)-th zero of
+            J1 (0 for the first root) and the n-th zero of J0.
+    """
+    sp = scipy_special()
+    lower = np.concatenate(([0.0], sp.jn_zeros(1, count - 1))) if count > 1 else np.zeros(1)
+    return lower, sp.jn_zeros(0, count)
+
+
+def sphere_characteristic(lambdas, biot):
+    """
+    Evaluates the characteristic equation of the sphere and its derivative.
+
+    The equation 1 - lambda * cot(lambda) = Bi is multiplied by sin(lambda) to remove its poles,
+    giving f(lambda) = (1 - Bi) * sin(lambda) - lambda * cos(lambda), which has exactly one root in
+    each interval ((n - 1) * pi, n * pi).
+
+    Parameters:
+        lambdas (np.ndarray): Values of lambda where the equation is evaluated.
+        biot (np.ndarray): Biot number, broadcastable against lambdas.
+
+    Returns:
+        tuple: Arrays f(lambda) and f'(lambda).
+    """
+    sin = np.sin(lambdas)
+    cos = np.cos(lambdas)
+    # sin(lambda) - lambda * cos(lambda) = lambda^2 * j1(lambda) sin la cancelación cerca de cero
+    return lambdas ** 2 * scipy_special().spherical_jn(1, lambdas) - biot * sin, lambdas * sin - biot * cos
+
+
+@lru_cache(maxsize=None)
+def sphere_brackets(count):
+    """
+    Returns the interval that contains each root of the sphere characteristic equation.
+
+    Parameters:
+        count (int): Number of roots.
+
+    Returns:
+        tuple: Arrays lower and upper of shape (count,), with root n inside ((n - 1) * pi, n * pi).
+    """
+    lower = np.arange(count) * np.pi
+    return lower, lower + np.pi
+
+
+@dataclass
+class EigenvalueSolution:
+    """
+    The roots of a characteristic equation together with how they were obtained.
+
+    Attributes:
+        roots (np.ndarray or tuple): The roots.
+        iterations (np.ndarray or tuple): Number of solver iterations used for each root.
+        residuals (np.ndarray or tuple): Absolute value of the characteristic equation at each root.
+    """
+
+    roots: np.ndarray
+    iterations: np.ndarray
+    residuals: np.ndarray
+
+
+def solve_bracketed(characteristic, biot, lower, upper, max_iterations,
+                    absolute_tolerance=0.0, relative_tolerance=ROOT_RESOLUTION, initial=None):
+    """
+    Finds one root of a characteristic equation inside each bracket.
+
+    Uses Newton's method safeguarded by bisection: every iteration shrinks the bracket around the
+    root, and a Newton step that would leave the bracket (or is not finite) is replaced by the
+    midpoint. Iterations start from the initial guess when one is given and lies inside the bracket,
+    otherwise from the midpoint. All brackets are solved at once as NumPy arrays and each one stops
+    being iterated as soon as its Newton step is below absolute_tolerance + relative_tolerance * root,
+    when the steps stop decreasing at the rounding noise of the equation, or after max_iterations
+    iterations.
+
+    At lambda = 0 every characteristic equation tends to -Bi (after removing the common factor), so
+    that sign is used for brackets starting at zero.
+
+    Parameters:
+        characteristic (callable): Function (lambdas, biot) returning f(lambda) and f'(lambda).
+        biot (np.ndarray): Biot number, broadcastable against the brackets.
+        lower (np.ndarray): Lower end of each bracket.
+        upper (np.ndarray): Upper end of each bracket.
+        max_iterations (int or np.ndarray): Maximum number of iterations, broadcastable against the
+            brackets.
+        absolute_tolerance (float or np.ndarray): Absolute tolerance on the root.
+        relative_tolerance (float or np.ndarray): Tolerance on the root relative to its value.
+        initial (np.ndarray, optional): Initial guess of each root, broadcastable against the brackets.
+
+    Returns:
+        EigenvalueSolution: The roots, iterations and residuals, one per bracket.
+    """
+    biot, lower, upper, max_iterations, absolute_tolerance, relative_tolerance, initial = \
+        np.broadcast_arrays(
+            np.asarray(biot, dtype=float), np.asarray(lower, dtype=float),
+            np.asarray(upper, dtype=float), np.asarray(max_iterations),
+            np.asarray(absolute_tolerance, dtype=float), np.asarray(relative_tolerance, dtype=float),
+            np.asarray(np.nan if initial is None else initial, dtype=float))
+    shape = biot.shape
+    biot = biot.ravel()
+    lower = lower.ravel().copy()
+    upper = upper.ravel().copy()
+    max_iterations = max_iterations.ravel()
+    absolute_tolerance = absolute_tolerance.ravel()
+    relative_tolerance = relative_tolerance.ravel()
+    initial = initial.ravel()
+
+    with np.errstate(all="ignore"):
+        lower_sign = np.sign(np.where(lower == 0, -biot, characteristic(lower, biot)[0]))
+        # Si el extremo inferior ya es raíz (por ejemplo Bi = 0) no hay nada que iterar
+        roots = np.where((initial > lower) & (initial < upper), initial, 0.5 * (lower + upper))
+        roots = np.where(lower_sign == 0, lower, roots)
+        iterations = np.zeros(roots.shape, dtype=np.int64)
+        previous_step = np.full(roots.shape, np.inf)
+        active = np.flatnonzero((lower_sign != 0) & (max_iterations > 0))
+
+        while active.size:
+            current = roots[active]
+            value, derivative = characteristic(current, biot[active])
+
+            below = np.sign(value) == lower_sign[active]
+            active_lower = np.where(below, current, lower[active])
+            active_upper = np.where(below, upper[active], current)
+            lower[active] = active_lower
+            upper[active] = active_upper
+
+            delta = value / derivative
+            size = np.abs(delta)
+            tolerance = absolute_tolerance[active] + relative_tolerance[active] * current
+            converged = (value == 0) | (size <= tolerance)
+            # Newton converge cuadráticamente: si un paso ya pequeño deja de disminuir, la raíz
+            # está en el límite de precisión de la ecuación
+            converged |= (size >= previous_step[active]) & (size <= NOISE_STEP * current)
+            previous_step[active] = size
+            step = current - delta
+            # Un paso de Newton fuera del intervalo (o no finito) se reemplaza por bisección
+            outside = ~converged & ~((step >= active_lower) & (step <= active_upper))
+            step = np.where(outside, 0.5 * (active_lower + active_upper), step)
+            # Un intervalo que ya no se puede partir tampoco puede mejorar la raíz
+            converged |= step == current
+            roots[active] = np.where(value == 0, current, step)
+
+            iterations[active] += 1
+            active = active[~converged & (iterations[active] < max_iterations[active])]
+
+        residuals = np.abs(characteristic(roots, biot)[0])
+
+    return EigenvalueSolution(
+        roots=roots.reshape(shape),
+        iterations=iterations.reshape(shape),
+        residuals=residuals.reshape(shape),
+    )
+
+
+EQUATIONS = {
+    "plate": (plate_characteristic, plate_brackets),
+    "cylinder": (cylinder_characteristic, cylinder_brackets),
+    "sphere": (sphere_characteristic, sphere_brackets),
+}
+
+
+def solve_eigenvalues(geometry, biot, count=3, max_iterations=DEFAULT_MAX_ITERATIONS,
+                      absolute_tolerance=0.0, relative_tolerance=ROOT_RESOLUTION, initial=None):
+    """
+    Solves the first roots of the characteristic equation of a geometry.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        biot (float or np.ndarray): Biot number, or an array of Biot numbers.
+        count (int): Number of roots per Biot number.
+        max_iterations (int or np.ndarray): Maximum number of iterations per root, broadcastable
+            against biot.
+        absolute_tolerance (float or np.ndarray): Absolute tolerance, broadcastable against biot.
+        relative_tolerance (float or np.ndarray): Relative tolerance, broadcastable against biot.
+        initial (np.ndarray, optional): Initial guess of the roots, with shape biot.shape + (count,).
+
+    Returns:
+        EigenvalueSolution: The roots, iterations and residuals, with shape biot.shape + (count,).
+    """
+    characteristic, brackets = EQUATIONS[geometry]
+    lower, upper = brackets(count)
+    biot = np.asarray(biot, dtype=float)[..., None]
+    max_iterations, absolute_tolerance, relative_tolerance = (
+        np.asarray(value)[..., None] if np.ndim(value) else value
+        for value in (max_iterations, absolute_tolerance, relative_tolerance))
+    return solve_bracketed(characteristic, biot, lower, upper, max_iterations,
+                           absolute_tolerance, relative_tolerance, initial)
+
+
+class EigenvalueTable:
+    """
+    A precomputed table of the roots of a characteristic equation over a log-spaced range of Biot numbers.
+
+    Interpolating the table in log(Bi) gives a starting guess that is already close to the root, so
+    only one or two Newton steps are needed to polish it to full precision.
+
+    Attributes:
+        geometry (str): The geometry of the table.
+        log_biot (np.ndarray): Base 10 logarithm of the Biot numbers of the table.
+        roots (np.ndarray): The roots at each Biot number, shape (len(log_biot), terms).
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        terms (int): Number of roots stored for each Biot number.
+        points (int): Number of Biot numbers in the table.
+        min_exponent (float): Base 10 exponent of the smallest Biot number.
+        max_exponent (float): Base 10 exponent of the largest Biot number.
+    """
+
+    def __init__(self, geometry, terms=3, points=2001, min_exponent=-6, max_exponent=4):
+        self.geometry = geometry
+        self.log_biot = np.linspace(min_exponent, max_exponent, points)
+        self.roots = solve_eigenvalues(geometry, 10 ** self.log_biot, terms).roots
+
+    def guess(self, biot, count):
+        """
+        Interpolates the table to estimate the roots of the given Biot numbers.
+
+        Roots beyond the ones stored in the table are returned as NaN, so the solver starts them
+        from the middle of their bracket.
+
+        Parameters:
+            biot (np.ndarray): Biot numbers.
+            count (int): Number of roots per Biot number.
+
+        Returns:
+            np.ndarray: The estimated roots, with shape biot.shape + (count,).
+        """
+        with np.errstate(all="ignore"):
+            log_biot = np.log10(np.asarray(biot, dtype=float))
+        guess = np.full(log_biot.shape + (count,), np.nan)
+        for term in range(min(count, self.roots.shape[1])):
+            guess[..., term] = np.interp(log_biot, self.log_biot, self.roots[:, term])
+        return guess
+
+
+class EigenvalueProvider:
+    """
+    Provides the roots of the characteristic equations of plate, cylinder and sphere.
+
+    The roots only depend on the geometry, the Biot number, how many are needed and the
+    convergence settings, so solves are kept in a bounded LRU cache keyed by all of them. Cache
+    misses start from a guess interpolated in a precomputed EigenvalueTable (built the first time
+    each geometry is used) and are polished with the safeguarded Newton solver until they meet the tolerance.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept in the cache.
+        terms (int): Number of roots returned by default, and stored in the tables.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required a solve.
+
+    Parameters:
+        max_size (int): Maximum number of entries kept in the cache.
+        terms (int): Number of roots returned by default, and stored in the tables.
+    """
+
+    def __init__(self, max_size=1024, terms=3):
+        self.max_size = max_size
+        self.terms = terms
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def table(self, geometry):
+        """
+        Returns the precomputed table of a geometry, building it on first use.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+
+        Returns:
+            EigenvalueTable: The table of the geometry.
+        """
+        table = self._tables.get(geometry)
+        if table is None:
+            table = EigenvalueTable(geometry, self.terms)
+            self._tables[geometry] = table
+        return table
+
+    def solve(self, geometry, biot, count=None, max_iterations=DEFAULT_MAX_ITERATIONS,
+              absolute_tolerance=0.0, relative_tolerance=ROOT_RESOLUTION):
+        """
+        Solves the roots for an array of Biot numbers, without going through the cache.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+            biot (float or np.ndarray): Biot number, or an array of Biot numbers.
+            count (int, optional): Number of roots per Biot number (defaults to terms).
+            max_iterations (int or np.ndarray): Maximum number of iterations per root.
+            absolute_tolerance (float or np.ndarray): Absolute tolerance on the roots.
+            relative_tolerance (float or np.ndarray): Relative tolerance on the roots.
+
+        Returns:
+            EigenvalueSolution: The roots, iterations and residuals, with shape
+                biot.shape + (count,).
+        """
+        count = self.terms if count is None else count
+        initial = self.table(geometry).guess(biot, count)
+        return solve_eigenvalues(geometry, biot, count, max_iterations, absolute_tolerance,
+                                 relative_tolerance, initial)
+
+    def get(self, geometry, biot, max_iterations=DEFAULT_MAX_ITERATIONS, absolute_tolerance=None,
+            relative_tolerance=None, count=None):
+        """
+        Returns the roots for a single Biot number, using the cache.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+            biot (float): The Biot number.
+            max_iterations (int): Maximum number of iterations per root.
+            absolute_tolerance (float, optional): Absolute tolerance on the roots (default 0).
+            relative_tolerance (float, optional): Relative tolerance on the roots (default
+                ROOT_RESOLUTION).
+            count (int, optional): Number of roots (defaults to terms).
+
+        Returns:
+            EigenvalueSolution: The first count roots, iterations and residuals, as tuples.
+        """
+        absolute_tolerance = 0.0 if absolute_tolerance is None else float(absolute_tolerance)
+        relative_tolerance = ROOT_RESOLUTION if relative_tolerance is None else float(relative_tolerance)
+        count = self.terms if count is None else int(count)
+        key = (geometry, float(biot), count, int(max_iterations), absolute_tolerance,
+               relative_tolerance)
+        with self._lock:
+            solution = self._cache.get(key)
+            if solution is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return solution
+            self.misses += 1
+
+        solution = self.solve(geometry, biot, count, max_iterations, absolute_tolerance,
+                              relative_tolerance)
+        solution = EigenvalueSolution(
+            roots=tuple(solution.roots.tolist()),
+            iterations=tuple(solution.iterations.tolist()),
+            residuals=tuple(solution.residuals.tolist()),
+        )
+
+        with self._lock:
+            self._store(key, solution)
+        return solution
+
+    def get_many(self, geometry, biot, max_iterations=DEFAULT_MAX_ITERATIONS,
+                 absolute_tolerance=None, relative_tolerance=None, count=None):
+        """
+        Returns the roots for an array of Biot numbers, using the cache.
+
+        Each Biot number is looked up with the same key as get, so batches and single
+        calculations share the cache. The misses are solved together in one vectorized solve,
+        seeded from the tables, and stored; Biot numbers that are not finite are solved but never
+        stored.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+            biot (np.ndarray): 1-D array of Biot numbers.
+            max_iterations (int or np.ndarray): Maximum number of iterations per root, one per
+                Biot number or shared.
+            absolute_tolerance (float or np.ndarray, optional): Absolute tolerance on the roots
+                (default 0).
+            relative_tolerance (float or np.ndarray, optional): Relative tolerance on the roots
+                (default ROOT_RESOLUTION).
+            count (int, optional): Number of roots (defaults to terms).
+
+        Returns:
+            EigenvalueSolution: The roots, iterations and residuals, with shape (len(biot), count).
+        """
+        count = self.terms if count is None else int(count)
+        biot = np.asarray(biot, dtype=float).reshape(-1)
+        max_iterations = np.broadcast_to(np.asarray(max_iterations, dtype=np.int64), biot.shape)
+        absolute_tolerance = np.broadcast_to(np.asarray(
+            0.0 if absolute_tolerance is None else absolute_tolerance, dtype=float), biot.shape)
+        relative_tolerance = np.broadcast_to(np.asarray(
+            ROOT_RESOLUTION if relative_tolerance is None else relative_tolerance, dtype=float),
+            biot.shape)
+
+        keys = [(geometry, value, count, iterations, absolute, relative)
+                for value, iterations, absolute, relative in zip(
+                    biot.tolist(), max_iterations.tolist(), absolute_tolerance.tolist(),
+                    relative_tolerance.tolist())]
+        roots = np.empty((biot.size, count))
+        iterations = np.zeros((biot.size, count), dtype=np.int64)
+        residuals = np.empty((biot.size, count))
+        missing = []
+        with self._lock:
+            for index, key in enumerate(keys):
+                solution = self._cache.get(key)
+                if solution is None:
+                    missing.append(index)
+                    continue
+                self._cache.move_to_end(key)
+                roots[index], iterations[index], residuals[index] = \
+                    solution.roots, solution.iterations, solution.residuals
+            self.hits += biot.size - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            missing = np.array(missing)
+            solution = self.solve(geometry, biot[missing], count, max_iterations[missing],
+                                  absolute_tolerance[missing], relative_tolerance[missing])
+            roots[missing] = solution.roots
+            iterations[missing] = solution.iterations
+            residuals[missing] = solution.residuals
+            with self._lock:
+                for index in missing[np.isfinite(biot[missing])].tolist():
+                    self._store(keys[index], EigenvalueSolution(
+                        roots=tuple(roots[index].tolist()),
+                        iterations=tuple(iterations[index].tolist()),
+                        residuals=tuple(residuals[index].tolist()),
+                    ))
+        return EigenvalueSolution(roots=roots, iterations=iterations, residuals=residuals)
+
+    def _store(self, key, solution):
+        # Guarda una solución como la más reciente y descarta las más antiguas (con el cerrojo tomado)
+        self._cache[key] = solution
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def stats(self):
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            dict: hits, misses, size, max_size and hit_ratio of the cache.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._cache),
+                'max_size': self.max_size,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+eigenvalue_provider = EigenvalueProvider()
@@ -0,0 +1,367 @@
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import numpy as np
+from .eigenvalues import solve_eigenvalues
+from .series import coefficients, heat_modes, required_terms, spatial_modes
+
+logger = logging.getLogger(__name__)
+
+# Directorio de las tablas (compartido por los procesos de la máquina)
+HEISLER_TABLES_PATH = os.environ.get("HEISLER_TABLES_PATH",
+                                     os.path.join(tempfile.gettempdir(), "convection-heisler"))
+# Malla de las tablas: log10(Bi) y log10(Fo) de 1e-3 a 1e3 y distancias adimensionales de 0 a 1
+LOG_BIOT_RANGE = (-3.0, 3.0, 601)
+LOG_FOURIER_RANGE = (-3.0, 3.0, 601)
+DISTANCE_POINTS = 101
+# Términos de la serie al construir las tablas: los que pide el menor Fo con esta precisión
+TABLE_ACCURACY = 1e-12
+# Filas de Biot por bloque al construir las tablas
+BUILD_ROWS = 32
+# La corrección de posición de las cartas de Heisler es la del primer término de la serie, que
+# solo vale desde este número de Fourier (con Fo = 0.2 el error en theta es menor que 0.03)
+ONE_TERM_FOURIER = 0.2
+# Cambiar la versión reconstruye las tablas guardadas con una malla o un formato anterior
+TABLE_VERSION = 1
+TABLE_NAMES = ("log_theta_o", "log_remaining_heat", "position")
+INTERPOLATION_METHODS = ("linear", "cubic")
+
+
+def build_tables(geometry: str) -> dict:
+    """
+    Computes the Heisler surfaces of a geometry from the series.
+
+    The center temperature ratio and the fraction of heat left to transfer, 1 - Q / Qmax, are
+    stored as natural logarithms on the (log10 Bi, log10 Fo) grid: both decay exponentially with
+    Fo, so their logarithms are smooth enough for cubic interpolation, and the logarithm is
+    computed as -lambda_1^2 * Fo + log(sum), so it does not underflow at large Fo. The position
+    correction theta / theta_o of the first term is stored on the (log10 Bi, x) grid.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+
+    Returns:
+        dict: The arrays of TABLE_NAMES.
+    """
+    log_biot = np.linspace(*LOG_BIOT_RANGE)
+    log_fourier = np.linspace(*LOG_FOURIER_RANGE)
+    distance = np.linspace(0.0, 1.0, DISTANCE_POINTS)
+    fourier = 10 ** log_fourier
+
+    terms = int(required_terms(fourier[0], TABLE_ACCURACY))
+    lambdas = solve_eigenvalues(geometry, 10 ** log_biot, terms).roots
+    value_a = coefficients(geometry, lambdas)
+    heat = value_a * heat_modes(geometry, lambdas)
+
+    log_theta_o = np.empty((log_biot.size, fourier.size))
+    log_remaining_heat = np.empty((log_biot.size, fourier.size))
+    # Por bloques de Biot, para no crear el arreglo completo (Biot, Fo, términos)
+    for start in range(0, log_biot.size, BUILD_ROWS):
+        rows = slice(start, start + BUILD_ROWS)
+        # Términos relativos al primero: exp(-(lambda_n^2 - lambda_1^2) * Fo)
+        first = lambdas[rows, :1] ** 2
+        decay = np.exp(-(lambdas[rows] ** 2 - first)[:, None, :] * fourier[None, :, None])
+        leading = -first * fourier[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_theta_o[rows] = leading + np.log(np.einsum("bft,bt->bf", decay, value_a[rows]))
+            log_remaining_heat[rows] = leading + np.log(np.einsum("bft,bt->bf", decay,
+                                                                  heat[rows]))
+
+    position = spatial_modes(geometry, lambdas[:, :1], distance[None, :])
+    return {
+        "log_theta_o": log_theta_o,
+        "log_remaining_heat": log_remaining_heat,
+        "position": position,
+    }
+
+
+def _cubic_weights(t: np.ndarray) -> np.ndarray:
+    # Pesos de Lagrange de los puntos i - 1, i, i + 1 e i + 2 en la posición i + t
+    return np.stack((-t * (t - 1) * (t - 2) / 6,
+                     (t + 1) * (t - 1) * (t - 2) / 2,
+                     -(t + 1) * t * (t - 2) / 2,
+                     (t + 1) * t * (t - 1) / 6), axis=-1)
+
+
+def interpolate(table: np.ndarray, start: tuple, stop: tuple, u: np.ndarray, v: np.ndarray,
+                method: str = "cubic") -> np.ndarray:
+    """
+    Interpolates a table sampled on a uniform grid at the points (u, v).
+
+    Only the 4 (linear) or 16 (cubic) entries around each point are read, so with a memory-mapped
+    table only those pages are touched. The cubic method is the tensor product of 4-point
+    Lagrange polynomials, fourth-order accurate; next to the edges of the grid the 4 points are
+    shifted inwards instead of repeating entries, so the order holds up to the edges.
+
+    Parameters:
+        table (np.ndarray): The table, shape (rows, columns).
+        start (tuple): First value of the row and column coordinates.
+        stop (tuple): Last value of the row and column coordinates.
+        u (np.ndarray): Row coordinates, within the grid.
+        v (np.ndarray): Column coordinates, within the grid, same shape as u.
+        method (str): 'linear' or 'cubic'.
+
+    Returns:
+        np.ndarray: The interpolated values.
+    """
+    rows, columns = table.shape
+    position_u = (u - start[0]) / (stop[0] - start[0]) * (rows - 1)
+    position_v = (v - start[1]) / (stop[1] - start[1]) * (columns - 1)
+    if method == "linear":
+        index_u = np.clip(np.floor(position_u).astype(np.int64), 0, rows - 2)
+        index_v = np.clip(np.floor(position_v).astype(np.int64), 0, columns - 2)
+        t_u = position_u - index_u
+        t_v = position_v - index_v
+        top = table[index_u, index_v] * (1 - t_v) + table[index_u, index_v + 1] * t_v
+        bottom = table[index_u + 1, index_v] * (1 - t_v) + table[index_u + 1, index_v + 1] * t_v
+        return top * (1 - t_u) + bottom * t_u
+
+    # Los 4 puntos i - 1 a i + 2 siempre dentro de la malla (t queda fuera de [0, 1] en los bordes)
+    index_u = np.clip(np.floor(position_u).astype(np.int64), 1, rows - 3)
+    index_v = np.clip(np.floor(position_v).astype(np.int64), 1, columns - 3)
+    t_u = position_u - index_u
+    t_v = position_v - index_v
+    offsets = np.arange(-1, 3)
+    near_u = index_u[..., None] + offsets
+    near_v = index_v[..., None] + offsets
+    values = table[near_u[..., :, None], near_v[..., None, :]]
+    return np.einsum("...i,...ij,...j->...", _cubic_weights(t_u), values, _cubic_weights(t_v))
+
+
+def interpolate_point(table: np.ndarray, start: tuple, stop: tuple, u: float, v: float,
+                      method: str = "cubic") -> float:
+    """
+    Interpolates a table at one point, like interpolate, with Python floats.
+
+    A single lookup is dominated by the overhead of the array operations; reading the 2 x 2 or
+    4 x 4 block as a list and weighting it with plain arithmetic takes a few microseconds.
+
+    Parameters:
+        table (np.ndarray): The table, shape (rows, columns).
+        start (tuple): First value of the row and column coordinates.
+        stop (tuple): Last value of the row and column coordinates.
+        u (float): Row coordinate, within the grid.
+        v (float): Column coordinate, within the grid.
+        method (str): 'linear' or 'cubic'.
+
+    Returns:
+        float: The interpolated value.
+    """
+    rows, columns = table.shape
+    position_u = (u - start[0]) / (stop[0] - start[0]) * (rows - 1)
+    position_v = (v - start[1]) / (stop[1] - start[1]) * (columns - 1)
+    if method == "linear":
+        index_u = min(max(math.floor(position_u), 0), rows - 2)
+        index_v = min(max(math.floor(position_v), 0), columns - 2)
+        t_u = position_u - index_u
+        t_v = position_v - index_v
+        (a, b), (c, d) = table[index_u:index_u + 2, index_v:index_v + 2].tolist()
+        return (a * (1 - t_v) + b * t_v) * (1 - t_u) + (c * (1 - t_v) + d * t_v) * t_u
+
+    index_u = min(max(math.floor(position_u), 1), rows - 3)
+    index_v = min(max(math.floor(position_v), 1), columns - 3)
+    block = table[index_u - 1:index_u + 3, index_v - 1:index_v + 3].tolist()
+    weights_u = _point_weights(position_u - index_u)
+    weights_v = _point_weights(position_v - index_v)
+    return sum(weight * (row[0] * weights_v[0] + row[1] * weights_v[1] + row[2] * weights_v[2] +
+                         row[3] * weights_v[3])
+               for weight, row in zip(weights_u, block))
+
+
+def _point_weights(t: float) -> tuple:
+    return (-t * (t - 1) * (t - 2) / 6,
+            (t + 1) * (t - 1) * (t - 2) / 2,
+            -(t + 1) * t * (t - 2) / 2,
+            (t + 1) * t * (t - 1) / 6)
+
+
+class HeislerTables:
+    """
+    Precomputed Heisler charts (center temperature, position correction and Q / Qmax) of plate,
+    cylinder and sphere, stored as .npy files and memory-mapped.
+
+    With mmap_mode the arrays are pages of the files in the operating system cache, so every
+    worker process of the host shares one copy and a process only reads the pages its lookups
+    touch. Missing or outdated files are built from the series the first time they are needed
+    and written atomically (a temporary file renamed into place), so workers that start together
+    do not read half-written tables.
+
+    Attributes:
+        directory (str): Directory of the .npy files.
+
+    Parameters:
+        directory (str): Directory of the .npy files.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _metadata(self):
+        return {
+            "version": TABLE_VERSION,
+            "log_biot": list(LOG_BIOT_RANGE),
+            "log_fourier": list(LOG_FOURIER_RANGE),
+            "distance_points": DISTANCE_POINTS,
+            "accuracy": TABLE_ACCURACY,
+        }
+
+    def _current(self) -> bool:
+        try:
+            with open(self._path("metadata.json")) as file:
+                return json.load(file) == self._metadata()
+        except (OSError, ValueError):
+            return False
+
+    def _write(self, name, writer):
+        # Escribir en un archivo temporal del mismo directorio y renombrarlo: os.replace es atómico
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                writer(file)
+            os.replace(temporary, self._path(name))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def build(self, geometries=("plate", "cylinder", "sphere")):
+        """
+        Builds the tables of the geometries and writes them to the directory.
+
+        Parameters:
+            geometries (tuple): The geometries to build.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        for geometry in geometries:
+            for name, array in build_tables(geometry).items():
+                self._write(f"{geometry}_{name}.npy",
+                            lambda file, array=array: np.save(file, np.ascontiguousarray(array)))
+        metadata = json.dumps(self._metadata()).encode()
+        self._write("metadata.json", lambda file: file.write(metadata))
+
+    def load(self, geometry: str) -> dict:
+        """
+        Returns the memory-mapped tables of a geometry, building them if they are missing.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+
+        Returns:
+            dict: The arrays of TABLE_NAMES.
+        """
+        tables = self._tables.get(geometry)
+        if tables is not None:
+            return tables
+        with self._lock:
+            tables = self._tables.get(geometry)
+            if tables is None:
+                paths = [self._path(f"{geometry}_{name}.npy") for name in TABLE_NAMES]
+                if not self._current() or not all(os.path.exists(path) for path in paths):
+                    logger.info("Construyendo las tablas de Heisler en %s", self.directory)
+                    self.build()
+                # Vistas ndarray de los mapas: comparten las páginas pero se indexan más rápido
+                tables = {name: np.load(path, mmap_mode="r").view(np.ndarray)
+                          for name, path in zip(TABLE_NAMES, paths)}
+                self._tables[geometry] = tables
+        return tables
+
+    def loaded(self, geometry: str) -> bool:
+        return geometry in self._tables
+
+    def lookup(self, geometry: str, biot: np.ndarray, dimensionless_time: np.ndarray,
+               dimensionless_distance: np.ndarray, method: str = "cubic") -> dict:
+        """
+        Reads the charts at the given points by interpolation.
+
+        A point is on the grid when its Biot and Fourier numbers are within the ranges of the
+        tables and, away from the center, its Fourier number is at least ONE_TERM_FOURIER, where
+        the position correction of the charts applies. Off-grid points are NaN.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+            biot (np.ndarray): Biot numbers.
+            dimensionless_time (np.ndarray): Fourier numbers, same shape as biot.
+            dimensionless_distance (np.ndarray): Dimensionless distances from the center, between
+                0 and 1, same shape as biot.
+            method (str): 'linear' or 'cubic'.
+
+        Returns:
+            dict: on_grid, theta_o, theta and heat_ratio (Q / Qmax), as arrays.
+        """
+        tables = self.load(geometry)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_biot = np.log10(biot)
+            log_fourier = np.log10(dimensionless_time)
+        on_grid = (
+            (log_biot >= LOG_BIOT_RANGE[0]) & (log_biot <= LOG_BIOT_RANGE[1]) &
+            (log_fourier >= LOG_FOURIER_RANGE[0]) & (log_fourier <= LOG_FOURIER_RANGE[1]) &
+            ((dimensionless_distance == 0) | (dimensionless_time >= ONE_TERM_FOURIER))
+        )
+        # Fuera de la malla se interpola en un punto cualquiera y el resultado se descarta
+        log_biot = np.where(on_grid, log_biot, LOG_BIOT_RANGE[0])
+        log_fourier = np.where(on_grid, log_fourier, LOG_FOURIER_RANGE[0])
+        grid = (LOG_BIOT_RANGE[0], LOG_FOURIER_RANGE[0]), (LOG_BIOT_RANGE[1], LOG_FOURIER_RANGE[1])
+
+        theta_o = np.exp(interpolate(tables["log_theta_o"], *grid, log_biot, log_fourier, method))
+        heat_ratio = -np.expm1(interpolate(tables["log_remaining_heat"], *grid, log_biot,
+                                           log_fourier, method))
+        position = interpolate(tables["position"], (LOG_BIOT_RANGE[0], 0.0),
+                               (LOG_BIOT_RANGE[1], 1.0), log_biot, dimensionless_distance, method)
+        theta = theta_o * np.where(dimensionless_distance == 0, 1.0, position)
+        nan = np.nan
+        return {
+            "on_grid": on_grid,
+            "theta_o": np.where(on_grid, theta_o, nan),
+            "theta": np.where(on_grid, theta, nan),
+            "heat_ratio": np.where(on_grid, heat_ratio, nan),
+        }
+
+    def lookup_point(self, geometry: str, biot: float, dimensionless_time: float,
+                     dimensionless_distance: float, method: str = "cubic") -> dict:
+        """
+        Reads the charts at one point, like lookup, with Python floats.
+
+        Parameters:
+            geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+            biot (float): Biot number.
+            dimensionless_time (float): Fourier number.
+            dimensionless_distance (float): Dimensionless distance from the center, 0 to 1.
+            method (str): 'linear' or 'cubic'.
+
+        Returns:
+            dict: on_grid, theta_o, theta and heat_ratio (Q / Qmax); NaN when off the grid.
+        """
+        tables = self.load(geometry)
+        on_grid = biot > 0 and dimensionless_time > 0
+        if on_grid:
+            log_biot = math.log10(biot)
+            log_fourier = math.log10(dimensionless_time)
+            on_grid = (
+                LOG_BIOT_RANGE[0] <= log_biot <= LOG_BIOT_RANGE[1] and
+                LOG_FOURIER_RANGE[0] <= log_fourier <= LOG_FOURIER_RANGE[1] and
+                (dimensionless_distance == 0 or dimensionless_time >= ONE_TERM_FOURIER)
+            )
+        if not on_grid:
+            return {"on_grid": False, "theta_o": math.nan, "theta": math.nan,
+                    "heat_ratio": math.nan}
+        grid = (LOG_BIOT_RANGE[0], LOG_FOURIER_RANGE[0]), (LOG_BIOT_RANGE[1], LOG_FOURIER_RANGE[1])
+        theta_o = math.exp(interpolate_point(tables["log_theta_o"], *grid, log_biot, log_fourier,
+                                             method))
+        heat_ratio = -math.expm1(interpolate_point(tables["log_remaining_heat"], *grid, log_biot,
+                                                   log_fourier, method))
+        theta = theta_o
+        if dimensionless_distance != 0:
+            theta *= interpolate_point(tables["position"], (LOG_BIOT_RANGE[0], 0.0),
+                                       (LOG_BIOT_RANGE[1], 1.0), log_biot, dimensionless_distance,
+                                       method)
+        return {"on_grid": True, "theta_o": theta_o, "theta": theta, "heat_ratio": heat_ratio}
+
+
+heisler_tables = HeislerTables(HEISLER_TABLES_PATH)
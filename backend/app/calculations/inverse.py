@@ -0,0 +1,268 @@
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, Optional
+from .semi_infinite import (
+    SHORT_TIME_GEOMETRIES,
+    semi_infinite_theta,
+    short_time_error,
+    short_time_limit
+)
+from .series import (
+    DEFAULT_ACCURACY,
+    DISPLAY_TERMS,
+    MAX_TERMS,
+    TERM_BOUND,
+    coefficients,
+    required_terms,
+    spatial_modes,
+    truncation_bound
+)
+
+# Iteraciones máximas de la búsqueda de cada número de Fourier
+MAX_CROSSING_ITERATIONS = 100
+# Tolerancia relativa del número de Fourier encontrado
+CROSSING_TOLERANCE = 1e-12
+# Duplicaciones máximas del extremo superior del intervalo
+MAX_EXPANSIONS = 200
+# Amplitud en ln(Fo) de la búsqueda con la solución de tiempos cortos, por debajo de su límite
+SHORT_TIME_RANGE = 690.0
+
+
+@dataclass
+class CrossingTimes:
+    """
+    Fourier numbers at which the temperature ratio at a point reaches each target.
+
+    Attributes:
+        dimensionless_time (np.ndarray): Fourier number of each target; 0 for a target equal to the
+            initial temperature, NaN when it is never reached or is reached before shortest_time.
+        iterations (np.ndarray): Newton and bisection iterations of the last search of each target.
+        residual (np.ndarray): |theta(Fo) - target| at the Fourier number found (NaN if not found).
+        model (np.ndarray): Solution used for each target, 'series' or 'semi_infinite'.
+        model_error (np.ndarray): Bound of the error of the short-time solution at the Fourier
+            number found (NaN with the series).
+        lambdas (np.ndarray): Lambda values of the terms used.
+        shortest_time (float): Smallest Fourier number that the series searches: where it meets
+            the accuracy with MAX_TERMS terms, or the short-time limit when the short-time
+            solution covers the earlier times.
+        truncation_error (float): Bound of the terms left out at the smallest Fourier number found
+            with the series.
+    """
+
+    dimensionless_time: np.ndarray
+    iterations: np.ndarray
+    residual: np.ndarray
+    model: np.ndarray
+    model_error: np.ndarray
+    lambdas: np.ndarray
+    shortest_time: float
+    truncation_error: float
+
+
+def shortest_time(accuracy=DEFAULT_ACCURACY, max_terms=MAX_TERMS):
+    """
+    Returns the smallest Fourier number at which max_terms terms meet the accuracy.
+
+    Solves truncation_bound(max_terms, Fo) = accuracy by fixed-point iteration on the denominator
+    of the bound, which changes slowly with Fo.
+
+    Parameters:
+        accuracy (float): Maximum truncation error of the temperature ratio.
+        max_terms (int): Maximum number of terms.
+
+    Returns:
+        float: The Fourier number.
+    """
+    exponent = (max_terms * math.pi) ** 2
+    dimensionless_time = math.log(TERM_BOUND / accuracy) / exponent
+    for _ in range(20):
+        denominator = 1 - math.exp(-2 * max_terms * math.pi ** 2 * dimensionless_time)
+        dimensionless_time = math.log(TERM_BOUND / (accuracy * denominator)) / exponent
+    return dimensionless_time
+
+
+def _solve_crossings(lambdas, weights, target, lower, max_iterations):
+    # Busca Fo con theta(Fo) = theta*, con theta(Fo) = sum(c_n * exp(-lambda_n^2 * Fo)), que
+    # decrece con el tiempo. Newton sobre ln(theta), exacto cuando domina el primer término, con
+    # bisección geométrica cuando el paso sale del intervalo que contiene la raíz
+    squared = lambdas ** 2
+
+    def evaluate(dimensionless_time):
+        decay = np.exp(-np.outer(dimensionless_time, squared)) * weights
+        return decay.sum(axis=-1), -(decay * squared).sum(axis=-1)
+
+    count = target.size
+    found = np.full(count, np.nan)
+    iterations = np.zeros(count, dtype=np.int64)
+
+    # Objetivos alcanzados antes del menor Fo que la serie resuelve: no tienen solución aquí
+    lower = np.full(count, lower)
+    value, _ = evaluate(lower)
+    valid = value > target
+    if not valid.any():
+        return found, iterations
+    target = target[valid]
+    lower = lower[valid]
+
+    # Estimación con el primer término; el extremo superior se duplica hasta pasar el objetivo
+    with np.errstate(all="ignore"):
+        estimate = np.log(weights[0] / target) / squared[0]
+    estimate = np.where(np.isfinite(estimate) & (estimate > lower), estimate, lower)
+    upper = 2 * estimate
+    for _ in range(MAX_EXPANSIONS):
+        value, _ = evaluate(upper)
+        above = value > target
+        if not above.any():
+            break
+        upper = np.where(above, 2 * upper, upper)
+
+    dimensionless_time = np.where(estimate > lower, estimate, np.sqrt(lower * upper))
+    log_target = np.log(target)
+    active = np.ones(target.size, dtype=bool)
+    valid_iterations = np.zeros(target.size, dtype=np.int64)
+    for _ in range(max_iterations):
+        value, slope = evaluate(dimensionless_time)
+        above = value > target
+        lower = np.where(above, dimensionless_time, lower)
+        upper = np.where(above, upper, dimensionless_time)
+        with np.errstate(all="ignore"):
+            # Paso de Newton sobre ln(theta): (ln(theta) - ln(theta*)) / (theta' / theta)
+            step = (np.log(value) - log_target) * value / slope
+            candidate = dimensionless_time - step
+        # Un paso menor que la tolerancia termina la búsqueda aunque caiga en un extremo
+        converged = np.abs(step) <= CROSSING_TOLERANCE * dimensionless_time
+        outside = ~np.isfinite(candidate) | (candidate <= lower) | (candidate >= upper)
+        candidate = np.where(outside & ~converged, np.sqrt(lower * upper), candidate)
+
+        valid_iterations += active
+        dimensionless_time = np.where(active, candidate, dimensionless_time)
+        active &= ~converged
+        if not active.any():
+            break
+
+    found[valid] = dimensionless_time
+    iterations[valid] = valid_iterations
+    return found, iterations
+
+
+def _short_time_crossings(geometry, biot, target, dimensionless_distance, upper, max_iterations):
+    # Busca Fo con theta(Fo) = theta* en la solución de sólido semi-infinito, por bisección en
+    # ln(Fo) entre upper * exp(-SHORT_TIME_RANGE) y upper: theta decrece con el tiempo desde 1
+    count = target.size
+    low = np.full(count, math.log(upper) - SHORT_TIME_RANGE)
+    high = np.full(count, math.log(upper))
+    iterations = np.zeros(count, dtype=np.int64)
+    with np.errstate(all="ignore"):
+        # Objetivos tan cerca de la temperatura inicial que no se alcanzan en el intervalo
+        reachable = semi_infinite_theta(geometry, biot, np.exp(low), dimensionless_distance) > target
+        active = reachable.copy()
+        for _ in range(max_iterations):
+            if not active.any():
+                break
+            middle = (low + high) / 2
+            above = semi_infinite_theta(geometry, biot, np.exp(middle), dimensionless_distance) > \
+                target
+            low = np.where(active & above, middle, low)
+            high = np.where(active & ~above, middle, high)
+            iterations += active
+            active &= high - low > CROSSING_TOLERANCE
+        found = np.where(reachable, np.exp((low + high) / 2), np.nan)
+        residual = np.abs(semi_infinite_theta(geometry, biot, found, dimensionless_distance) -
+                          target)
+    return found, iterations, residual
+
+
+def crossing_times(geometry: str, roots: Callable[[int], np.ndarray], theta: np.ndarray,
+                   dimensionless_distance: float, accuracy=DEFAULT_ACCURACY,
+                   max_iterations=MAX_CROSSING_ITERATIONS,
+                   biot: Optional[float] = None) -> CrossingTimes:
+    """
+    Finds the Fourier numbers at which the temperature ratio at a point reaches each target.
+
+    The coefficients of the series at the point are computed once, so every evaluation during the
+    search is a single exponential per term; the series and its time derivative are evaluated
+    analytically. The number of terms is chosen for the smallest Fourier number found, and the
+    search is repeated with more terms while that number grows.
+
+    For the plate and the sphere, when the Biot number is given, the series is only searched from
+    the short-time limit on (so it needs few terms); targets reached earlier are found by
+    bisection on the semi-infinite solid solution, as the forward calculation does at those times.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        roots (Callable[[int], np.ndarray]): Returns the first lambda values of the geometry and
+            Biot number, given how many are needed.
+        theta (np.ndarray): Target temperature ratios (T - T_inf) / (T_i - T_inf).
+        dimensionless_distance (float): Dimensionless distance from the center.
+        accuracy (float): Maximum truncation error of the temperature ratio.
+        max_iterations (int): Maximum number of iterations per target.
+        biot (float, optional): Biot number, needed for the short-time solution.
+
+    Returns:
+        CrossingTimes: The Fourier numbers found and the terms used.
+    """
+    theta = np.asarray(theta, dtype=float)
+    lower = shortest_time(accuracy)
+    switch = geometry in SHORT_TIME_GEOMETRIES and biot is not None
+    terms = DISPLAY_TERMS
+    if switch:
+        # Antes del límite de tiempos cortos se usa la solución de sólido semi-infinito, y la serie
+        # solo necesita los términos de ese límite
+        lower = max(lower, short_time_limit(accuracy))
+        terms = max(int(required_terms(lower, accuracy)), DISPLAY_TERMS)
+    # Solo se buscan los objetivos entre la temperatura inicial y la ambiente (sin incluirlas)
+    solvable = (theta > 0) & (theta < 1)
+    short = np.zeros(theta.shape, dtype=bool)
+    dimensionless_time = np.where(theta == 1, 0.0, np.nan)
+    iterations = np.zeros(theta.shape, dtype=np.int64)
+
+    while True:
+        lambdas = np.asarray(roots(terms), dtype=float)
+        with np.errstate(all="ignore"):
+            weights = coefficients(geometry, lambdas) * \
+                spatial_modes(geometry, lambdas, dimensionless_distance)
+        if switch:
+            # Los objetivos por encima de la temperatura en el límite se alcanzan antes
+            short = solvable & (theta > (weights * np.exp(-lambdas ** 2 * lower)).sum())
+        series = solvable & ~short
+        found, found_iterations = _solve_crossings(lambdas, weights, theta[series], lower,
+                                                   max_iterations)
+        dimensionless_time[series] = found
+        iterations[series] = found_iterations
+
+        # El menor Fo (o el límite inferior, si algún objetivo quedó antes) fija los términos
+        smallest = np.where(np.isnan(found), lower, found).min() if found.size else None
+        needed = DISPLAY_TERMS if smallest is None else \
+            max(int(required_terms(smallest, accuracy)), DISPLAY_TERMS)
+        if needed <= terms:
+            break
+        terms = needed
+
+    residual = np.full(theta.shape, np.nan)
+    model_error = np.full(theta.shape, np.nan)
+    if short.any():
+        found, found_iterations, found_residual = _short_time_crossings(
+            geometry, biot, theta[short], dimensionless_distance, lower, max_iterations)
+        dimensionless_time[short] = found
+        iterations[short] = found_iterations
+        residual[short] = found_residual
+        model_error[short] = short_time_error(found)
+    reached = np.isfinite(dimensionless_time) & ~short
+    if reached.any():
+        decay = np.exp(-np.outer(dimensionless_time[reached], lambdas ** 2)) * weights
+        residual[reached] = np.abs(decay.sum(axis=-1) - theta[reached])
+        # En Fo = 0 la serie no converge: el resultado exacto no tiene residuo
+        residual[reached & (dimensionless_time == 0)] = 0.0
+    error = float(truncation_bound(lambdas.size, smallest)) if smallest is not None else 0.0
+
+    return CrossingTimes(
+        dimensionless_time=dimensionless_time,
+        iterations=iterations,
+        residual=residual,
+        model=np.where(short, "semi_infinite", "series"),
+        model_error=model_error,
+        lambdas=lambdas,
+        shortest_time=lower,
+        truncation_error=error,
+    )
@@ -0,0 +1,24 @@
+def scipy_special():
+    """
+    Returns scipy.special, importing it the first time a geometry needs it.
+
+    Only the cylinder (Bessel functions) and the characteristic equation of the sphere use SciPy, so
+    a process that only solves plates never pays for its import. After the first call the import is
+    a lookup in sys.modules.
+
+    Returns:
+        module: The scipy.special module.
+    """
+    import scipy.special
+    return scipy.special
+
+
+def scipy_linalg():
+    """
+    Returns scipy.linalg, importing it the first time the finite-difference solver needs it.
+
+    Returns:
+        module: The scipy.linalg module.
+    """
+    import scipy.linalg
+    return scipy.linalg
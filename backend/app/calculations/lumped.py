@@ -0,0 +1,78 @@
+import math
+from dataclasses import dataclass
+
+# Área por unidad de volumen por la longitud característica (r o L/2) de cada geometría: el
+# exponente del modelo concentrado es este factor por Bi * Fo
+SHAPE_FACTORS = {"plate": 1.0, "cylinder": 2.0, "sphere": 3.0}
+
+# Desarrollos para Bi pequeño del primer término de la serie: lambda_1^2 = p1 * Bi + p2 * Bi^2,
+# A_1 = 1 + a1 * Bi, y los modos espacial y de calor 1 - lambda_1^2 * x^2 / s y 1 - lambda_1^2 / m
+SMALL_BIOT_EXPANSIONS = {
+    "plate": (1.0, -1 / 3, 1 / 6, 2.0, 6.0),
+    "cylinder": (2.0, -1 / 2, 1 / 4, 4.0, 8.0),
+    "sphere": (3.0, -3 / 5, 3 / 10, 6.0, 10.0),
+}
+
+
+@dataclass(slots=True)
+class LumpedSolution:
+    """
+    Lumped-capacitance solution at a point, valid when the Biot number is small.
+
+    The summation_* properties mirror those of the series, so the object can be passed to
+    ConvectionResults.
+
+    Attributes:
+        value_theta (float): Temperature ratio (T - T_inf) / (T_i - T_inf), uniform in the body.
+        value_q (float): Heat ratio left to transfer, equal to value_theta.
+        model_error (float): Estimate of the difference with the series solution, in the
+            temperature or the heat ratio, whichever is larger.
+    """
+
+    value_theta: float
+    value_q: float
+    model_error: float
+
+    @property
+    def value_theta_o(self):
+        # La temperatura es uniforme: en el centro es la misma
+        return self.value_theta
+
+    @property
+    def summation_theta(self):
+        return self.value_theta
+
+    @property
+    def summation_q(self):
+        return self.value_q
+
+
+def lumped_point(geometry: str, biot: float, dimensionless_time: float,
+                 dimensionless_distance: float) -> LumpedSolution:
+    """
+    Evaluates the lumped-capacitance model, theta = exp(-(A / V) * L * Bi * Fo).
+
+    The error estimate compares it with the first term of the series, whose lambda value,
+    amplitude and spatial modes are replaced by their expansions for small Biot numbers, so no
+    characteristic equation is solved. The first term is the one the lumped model approximates:
+    the others only matter at short times, while the body has not yet felt the surface.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        biot (float): Biot number based on the half thickness or the radius.
+        dimensionless_time (float): Fourier number.
+        dimensionless_distance (float): Dimensionless distance from the center.
+
+    Returns:
+        LumpedSolution: The temperature and heat ratios and the error estimate.
+    """
+    theta = math.exp(-SHAPE_FACTORS[geometry] * biot * dimensionless_time)
+
+    p1, p2, a1, spatial, heat = SMALL_BIOT_EXPANSIONS[geometry]
+    squared = p1 * biot + p2 * biot ** 2
+    decay = (1 + a1 * biot) * math.exp(-squared * dimensionless_time)
+    theta_series = decay * (1 - squared * dimensionless_distance ** 2 / spatial)
+    q_series = decay * (1 - squared / heat)
+    error = max(abs(theta_series - theta), abs(q_series - theta))
+
+    return LumpedSolution(value_theta=theta, value_q=theta, model_error=error)
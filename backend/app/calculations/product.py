@@ -0,0 +1,57 @@
+import math
+import numpy as np
+from typing import List, Sequence
+
+# Factores unidimensionales de cada geometría de PRODUCT_GEOMETRIES: una placa por cada par de
+# caras planas y un cilindro infinito para la superficie lateral del cilindro corto
+PRODUCT_FACTORS = {
+    "short_cylinder": ("cylinder", "plate"),
+    "bar": ("plate", "plate"),
+    "box": ("plate", "plate", "plate"),
+}
+# Letras de los ejes espaciales en einsum (el tiempo es 't')
+_AXES = "abcdefgh"
+
+
+def product_volume(geometry: str, thicknesses: Sequence[float]) -> float:
+    """
+    Returns the volume of the body (per unit length for the bar), used for q_max.
+
+    Parameters:
+        geometry (str): The geometry ('short_cylinder', 'bar' or 'box').
+        thicknesses (Sequence[float]): Thickness in each direction; the diameter and the height
+            for the short cylinder.
+
+    Returns:
+        float: The volume.
+    """
+    if geometry == "short_cylinder":
+        diameter, height = thicknesses
+        return math.pi * (diameter / 2) ** 2 * height
+    return math.prod(thicknesses)
+
+
+def combine_factors(thetas: List[np.ndarray], heat_ratios: List[np.ndarray],
+                    truncation_errors: List[np.ndarray]):
+    """
+    Combines the 1-D solutions of each direction into the solution of the body.
+
+    The temperature ratio is the product of the ratios of each direction, evaluated on the grid
+    of all their distances by broadcasting; the fraction of heat left to transfer is the product
+    of the fractions of each direction (the volume average of a product of independent factors),
+    and the truncation errors add up, since every factor is at most 1 in absolute value.
+
+    Parameters:
+        thetas (List[np.ndarray]): Temperature ratio of each direction, shape (times, distances_i).
+        heat_ratios (List[np.ndarray]): Q / Qmax of each direction, shape (times,).
+        truncation_errors (List[np.ndarray]): Truncation bound of each direction, shape (times,).
+
+    Returns:
+        tuple: theta of shape (times, distances_1, ..., distances_n), Q / Qmax of shape (times,)
+            and the bound of the truncation error of shape (times,).
+    """
+    axes = _AXES[:len(thetas)]
+    subscripts = ",".join("t" + axis for axis in axes) + "->t" + axes
+    theta = np.einsum(subscripts, *thetas)
+    remaining = np.prod([1 - heat_ratio for heat_ratio in heat_ratios], axis=0)
+    return theta, 1 - remaining, np.sum(truncation_errors, axis=0)
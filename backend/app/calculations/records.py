@@ -0,0 +1,193 @@
+import math
+import pydantic_core
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+from .convection_calculations import InitialCalcs
+from .lumped import LumpedSolution
+from .semi_infinite import SemiInfinitePoint
+from .series import DISPLAY_TERMS, PointTerms
+
+
+def _input_fields(calcs: InitialCalcs) -> dict:
+    # Campos de entrada de DataResult, con la difusividad y el número de Biot resueltos
+    return {
+        "thickness": calcs.thickness,
+        "thermal_diffusivity": calcs.thermal_diffusivity,
+        "conductivity_coefficient": calcs.conductivity_coefficient,
+        "convection_coefficient": calcs.convection_coefficient,
+        "initial_temperature": calcs.initial_temperature,
+        "ambient_temperature": calcs.ambient_temperature,
+        "density": calcs.density,
+        "specific_heat": calcs.specific_heat,
+        "distance": calcs.distance,
+        "time": calcs.time,
+        "iterations": calcs.iterations,
+        "biot": calcs.biot,
+        "geometry": calcs.geometry,
+        "absolute_tolerance": calcs.absolute_tolerance,
+        "relative_tolerance": calcs.relative_tolerance,
+        "accuracy": calcs.accuracy,
+    }
+
+
+@dataclass(slots=True)
+class ConvectionRecord:
+    """
+    Compact result of a single convection calculation.
+
+    Holds references to what the calculation produced (the initial parameters, the roots and the
+    terms) instead of copies, and is serialized directly to the JSON of DataResult, without building
+    and validating the nested Pydantic models. A record with a single term is reported as the
+    one-term model.
+
+    Attributes:
+        calcs (InitialCalcs): Initial parameters, with the resolved thermal diffusivity and Biot number.
+        q_max (float): Maximum heat transfer.
+        lambdas (Tuple[float, ...]): Lambda values of every term.
+        iterations (Tuple[int, ...]): Solver iterations used for each lambda value.
+        residuals (Tuple[float, ...]): Residual of the characteristic equation for each lambda value.
+        terms (PointTerms): Terms of the series and their sums.
+        tem (float): Final temperature.
+        q (float): Final heat transfer.
+    """
+
+    calcs: InitialCalcs
+    q_max: float
+    lambdas: Tuple[float, ...]
+    iterations: Tuple[int, ...]
+    residuals: Tuple[float, ...]
+    terms: PointTerms
+    tem: float
+    q: float
+
+    @property
+    def truncation_error(self) -> Optional[float]:
+        error = self.terms.truncation_error
+        return error if math.isfinite(error) else None
+
+    def to_dict(self) -> dict:
+        """
+        Returns the result with the fields and nesting of DataResult.
+
+        Returns:
+            dict: JSON-ready dictionary following the DataResult schema.
+        """
+        terms = self.terms
+        count = len(self.lambdas)
+        # En el modo de un término, calc2, calc3, lambda2 y lambda3 quedan en null
+        calc1, calc2, calc3 = (
+            {
+                "value_a": terms.value_a[term],
+                "value_theta_o": terms.value_theta_o[term],
+                "value_theta": terms.value_theta[term],
+                "value_q": terms.value_q[term],
+            } if term < count else None
+            for term in range(DISPLAY_TERMS)
+        )
+        lambda1, lambda2, lambda3 = (self.lambdas[term] if term < count else None
+                                     for term in range(DISPLAY_TERMS))
+        return {
+            **_input_fields(self.calcs),
+            "q_max": self.q_max,
+            "calc1": calc1,
+            "calc2": calc2,
+            "calc3": calc3,
+            "lamb": {
+                "lambda1": lambda1,
+                "lambda2": lambda2,
+                "lambda3": lambda3,
+                "iterations": list(self.iterations),
+                "residuals": list(self.residuals),
+            },
+            "value_a": terms.summation_a,
+            "value_theta_o": terms.summation_theta_o,
+            "value_theta": terms.summation_theta,
+            "value_q": terms.summation_q,
+            "tem": self.tem,
+            "q": self.q,
+            "terms": count,
+            "truncation_error": self.truncation_error,
+            "model": "one_term" if count == 1 else "series",
+            "model_error": None,
+        }
+
+    def to_json(self, message: str = "Success") -> bytes:
+        """
+        Encodes the result as the JSON body of ApiResponse.
+
+        Parameters:
+            message (str): The message of the response.
+
+        Returns:
+            bytes: The UTF-8 encoded body.
+        """
+        # El serializador de pydantic_core, sin validar modelos; infinitos y NaN como null, igual
+        # que model_dump_json
+        return pydantic_core.to_json({"message": message, "data": self.to_dict()},
+                                     inf_nan_mode="null")
+
+
+@dataclass(slots=True)
+class ClosedFormRecord:
+    """
+    Result of a convection calculation solved with a closed-form model instead of the series.
+
+    Serialized to the same DataResult schema as ConvectionRecord; the fields that only exist for
+    the series (the terms and the lambda values) are null.
+
+    Attributes:
+        calcs (InitialCalcs): Initial parameters, with the resolved thermal diffusivity and Biot number.
+        q_max (float): Maximum heat transfer.
+        model (str): 'lumped' (lumped capacitance) or 'semi_infinite' (short times).
+        solution (LumpedSolution or SemiInfinitePoint): Center and point temperature ratios, heat
+            ratio and the error estimate.
+        tem (float): Final temperature.
+        q (float): Final heat transfer.
+    """
+
+    calcs: InitialCalcs
+    q_max: float
+    model: str
+    solution: Union[LumpedSolution, SemiInfinitePoint]
+    tem: float
+    q: float
+
+    def to_dict(self) -> dict:
+        """
+        Returns the result with the fields and nesting of DataResult.
+
+        Returns:
+            dict: JSON-ready dictionary following the DataResult schema.
+        """
+        solution = self.solution
+        return {
+            **_input_fields(self.calcs),
+            "q_max": self.q_max,
+            "calc1": None,
+            "calc2": None,
+            "calc3": None,
+            "lamb": None,
+            "value_a": None,
+            "value_theta_o": solution.value_theta_o,
+            "value_theta": solution.value_theta,
+            "value_q": solution.value_q,
+            "tem": self.tem,
+            "q": self.q,
+            "terms": None,
+            "truncation_error": None,
+            "model": self.model,
+            "model_error": solution.model_error,
+        }
+
+    def to_json(self, message: str = "Success") -> bytes:
+        """
+        Encodes the result as the JSON body of ApiResponse.
+
+        Parameters:
+            message (str): The message of the response.
+
+        Returns:
+            bytes: The UTF-8 encoded body.
+        """
+        return pydantic_core.to_json({"message": message, "data": self.to_dict()},
+                                     inf_nan_mode="null")
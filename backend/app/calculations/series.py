@@ -0,0 +1,352 @@
+import math
+import numpy as np
+from dataclasses import dataclass
+from typing import List
+from .lazy import scipy_special
+
+# Términos que se muestran siempre en la respuesta (calc1, calc2 y calc3)
+DISPLAY_TERMS = 3
+DEFAULT_ACCURACY = 1e-8
+MAX_TERMS = 200
+# Cota de |a_n| por el modo espacial o de calor, válida para placa, cilindro y esfera
+TERM_BOUND = 2.0
+
+
+@dataclass
+class SeriesTerms:
+    """
+    The terms of the eigenfunction series of a transient conduction problem.
+
+    The per-term arrays have shape (..., terms): one entry per lambda value, with any leading
+    dimensions of the evaluation (for example one row per batch case). The summation_* properties
+    add up the terms, so the object can be passed to ConvectionResults.
+
+    Attributes:
+        lambdas (np.ndarray): Lambda values of the terms.
+        value_a (np.ndarray): Amplitude factor 'a' of each term.
+        value_theta_o (np.ndarray): Center temperature ratio of each term.
+        value_theta (np.ndarray): Temperature ratio at the distance of each term.
+        value_q (np.ndarray): Heat ratio of each term.
+        truncation_error (np.ndarray): Upper bound of the terms left out of the series.
+    """
+
+    lambdas: np.ndarray
+    value_a: np.ndarray
+    value_theta_o: np.ndarray
+    value_theta: np.ndarray
+    value_q: np.ndarray
+    truncation_error: np.ndarray
+
+    @property
+    def summation_a(self):
+        return self.value_a.sum(axis=-1)
+
+    @property
+    def summation_theta_o(self):
+        return self.value_theta_o.sum(axis=-1)
+
+    @property
+    def summation_theta(self):
+        return self.value_theta.sum(axis=-1)
+
+    @property
+    def summation_q(self):
+        return self.value_q.sum(axis=-1)
+
+
+def coefficients(geometry, lambdas):
+    """
+    Calculates the amplitude factor 'a' of each term of the series.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        lambdas (np.ndarray): Lambda values.
+
+    Returns:
+        np.ndarray: The amplitude factors.
+    """
+    if geometry == "plate":
+        return 4 * np.sin(lambdas) / (2 * lambdas + np.sin(2 * lambdas))
+    if geometry == "cylinder":
+        sp = scipy_special()
+        j0 = sp.j0(lambdas)
+        j1 = sp.j1(lambdas)
+        return (2 / lambdas) * j1 / (j0 ** 2 + j1 ** 2)
+    return 4 * (np.sin(lambdas) - lambdas * np.cos(lambdas)) / (2 * lambdas - np.sin(2 * lambdas))
+
+
+def spatial_modes(geometry, lambdas, dimensionless_distance):
+    """
+    Calculates the spatial factor of each term at a dimensionless distance from the center.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        lambdas (np.ndarray): Lambda values.
+        dimensionless_distance (np.ndarray): Dimensionless distance, broadcastable against lambdas.
+
+    Returns:
+        np.ndarray: cos(lambda * x) for the plate, J0(lambda * r) for the cylinder and
+            sin(lambda * r) / (lambda * r) for the sphere.
+    """
+    argument = lambdas * dimensionless_distance
+    if geometry == "plate":
+        return np.cos(argument)
+    if geometry == "cylinder":
+        return scipy_special().j0(argument)
+    # sinc(x / pi) = sin(x) / x, con el límite 1 en el centro
+    return np.sinc(argument / np.pi)
+
+
+def heat_modes(geometry, lambdas):
+    """
+    Calculates the factor of each term in the heat ratio Q / Qmax.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        lambdas (np.ndarray): Lambda values.
+
+    Returns:
+        np.ndarray: sin(lambda) / lambda for the plate, 2 * J1(lambda) / lambda for the cylinder and
+            3 * (sin(lambda) - lambda * cos(lambda)) / lambda^3 for the sphere.
+    """
+    if geometry == "plate":
+        return np.sin(lambdas) / lambdas
+    if geometry == "cylinder":
+        return 2 * scipy_special().j1(lambdas) / lambdas
+    return 3 * (np.sin(lambdas) - lambdas * np.cos(lambdas)) / lambdas ** 3
+
+
+def truncation_bound(terms, dimensionless_time):
+    """
+    Bounds the sum of the terms left out when the series is cut after a number of terms.
+
+    Every term is at most TERM_BOUND * exp(-lambda_n^2 * Fo) in absolute value, and the n-th lambda
+    value is at least (n - 1) * pi for the three geometries, so the tail after N terms is below
+    TERM_BOUND * exp(-(N * pi)^2 * Fo) / (1 - exp(-2 * N * pi^2 * Fo)).
+
+    Parameters:
+        terms (int or np.ndarray): Number of terms kept.
+        dimensionless_time (float or np.ndarray): Fourier number.
+
+    Returns:
+        np.ndarray: The bound of the truncation error (infinite when Fo = 0).
+    """
+    terms = np.asarray(terms, dtype=float)
+    dimensionless_time = np.asarray(dimensionless_time, dtype=float)
+    with np.errstate(all="ignore"):
+        ratio = np.exp(-2 * terms * np.pi ** 2 * dimensionless_time)
+        return TERM_BOUND * np.exp(-(terms * np.pi) ** 2 * dimensionless_time) / (1 - ratio)
+
+
+def required_terms(dimensionless_time, accuracy=DEFAULT_ACCURACY, max_terms=MAX_TERMS):
+    """
+    Chooses the number of terms needed for the truncation error to be below the accuracy.
+
+    Uses the bound of truncation_bound with its denominator replaced by its smallest value
+    (N = 1), which gives a closed form for N.
+
+    Parameters:
+        dimensionless_time (float or np.ndarray): Fourier number.
+        accuracy (float or np.ndarray): Maximum truncation error of the temperature and heat ratios.
+        max_terms (int): Maximum number of terms.
+
+    Returns:
+        np.ndarray: The number of terms, between 1 and max_terms.
+    """
+    dimensionless_time = np.asarray(dimensionless_time, dtype=float)
+    with np.errstate(all="ignore"):
+        denominator = 1 - np.exp(-2 * np.pi ** 2 * dimensionless_time)
+        terms = np.sqrt(np.log(TERM_BOUND / (accuracy * denominator)) / dimensionless_time) / np.pi
+    terms = np.where(np.isfinite(terms), terms, max_terms)
+    return np.clip(np.ceil(terms), 1, max_terms).astype(np.int64)
+
+
+def evaluate_series(geometry, lambdas, dimensionless_time, dimensionless_distance):
+    """
+    Evaluates every term of the series in one pass.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        lambdas (np.ndarray): Lambda values, shape (..., terms).
+        dimensionless_time (float or np.ndarray): Fourier number, shape (...).
+        dimensionless_distance (float or np.ndarray): Dimensionless distance, shape (...).
+
+    Returns:
+        SeriesTerms: The terms of the series and the bound of the terms left out.
+    """
+    dimensionless_time = np.asarray(dimensionless_time, dtype=float)
+    dimensionless_distance = np.asarray(dimensionless_distance, dtype=float)
+    with np.errstate(all="ignore"):
+        value_a = coefficients(geometry, lambdas)
+        value_theta_o = value_a * np.exp(-(lambdas ** 2 * dimensionless_time[..., None]))
+        value_theta = value_theta_o * spatial_modes(geometry, lambdas,
+                                                    dimensionless_distance[..., None])
+        value_q = value_theta_o * heat_modes(geometry, lambdas)
+    return SeriesTerms(
+        lambdas=lambdas,
+        value_a=value_a,
+        value_theta_o=value_theta_o,
+        value_theta=value_theta,
+        value_q=value_q,
+        truncation_error=truncation_bound(lambdas.shape[-1], dimensionless_time),
+    )
+
+
+@dataclass(slots=True)
+class PointTerms:
+    """
+    The terms of the series at a single point, as plain Python floats.
+
+    Attributes:
+        value_a (List[float]): Amplitude factor 'a' of each term.
+        value_theta_o (List[float]): Center temperature ratio of each term.
+        value_theta (List[float]): Temperature ratio at the distance of each term.
+        value_q (List[float]): Heat ratio of each term.
+        summation_a (float): Sum of value_a.
+        summation_theta_o (float): Sum of value_theta_o.
+        summation_theta (float): Sum of value_theta.
+        summation_q (float): Sum of value_q.
+        truncation_error (float): Upper bound of the terms left out of the series.
+    """
+
+    value_a: List[float]
+    value_theta_o: List[float]
+    value_theta: List[float]
+    value_q: List[float]
+    summation_a: float
+    summation_theta_o: float
+    summation_theta: float
+    summation_q: float
+    truncation_error: float
+
+
+def required_terms_point(dimensionless_time, accuracy=DEFAULT_ACCURACY, max_terms=MAX_TERMS):
+    """
+    Scalar version of required_terms, without the NumPy overhead of a single-element array.
+
+    Parameters:
+        dimensionless_time (float): Fourier number.
+        accuracy (float): Maximum truncation error of the temperature and heat ratios.
+        max_terms (int): Maximum number of terms.
+
+    Returns:
+        int: The number of terms, between 1 and max_terms.
+    """
+    try:
+        denominator = 1 - math.exp(-2 * math.pi ** 2 * dimensionless_time)
+        terms = math.sqrt(math.log(TERM_BOUND / (accuracy * denominator)) / dimensionless_time) / math.pi
+    except (ArithmeticError, ValueError):
+        return max_terms
+    if not math.isfinite(terms):
+        return max_terms
+    return min(max(math.ceil(terms), 1), max_terms)
+
+
+def _truncation_bound_point(terms, dimensionless_time):
+    # Versión escalar de truncation_bound
+    try:
+        ratio = math.exp(-2 * terms * math.pi ** 2 * dimensionless_time)
+        return TERM_BOUND * math.exp(-(terms * math.pi) ** 2 * dimensionless_time) / (1 - ratio)
+    except (ArithmeticError, ValueError):
+        return math.inf
+
+
+def _point_term(geometry, lam, dimensionless_time, dimensionless_distance):
+    # Un término de la serie: (a, theta_o, theta, q)
+    sin = math.sin(lam)
+    if geometry == "plate":
+        value_a = 4 * sin / (2 * lam + math.sin(2 * lam))
+        spatial = math.cos(lam * dimensionless_distance)
+        heat = sin / lam
+    elif geometry == "cylinder":
+        sp = scipy_special()
+        j0 = float(sp.j0(lam))
+        j1 = float(sp.j1(lam))
+        value_a = (2 / lam) * j1 / (j0 ** 2 + j1 ** 2)
+        spatial = float(sp.j0(lam * dimensionless_distance))
+        heat = 2 * j1 / lam
+    else:
+        shape = sin - lam * math.cos(lam)
+        value_a = 4 * shape / (2 * lam - math.sin(2 * lam))
+        argument = lam * dimensionless_distance
+        spatial = math.sin(argument) / argument if argument != 0 else 1.0
+        heat = 3 * shape / lam ** 3
+    value_theta_o = value_a * math.exp(-(lam ** 2 * dimensionless_time))
+    return value_a, value_theta_o, value_theta_o * spatial, value_theta_o * heat
+
+
+def evaluate_point(geometry, lambdas, dimensionless_time, dimensionless_distance):
+    """
+    Evaluates every term of the series at a single point with Python floats.
+
+    For one point the series has a handful of terms, so the math module is several times faster
+    than NumPy calls on tiny arrays, and the results need no conversion before serialization.
+    Inputs that raise in the math module (overflow or division by zero) fall back to
+    evaluate_series, which returns infinite or NaN values instead.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        lambdas (Sequence[float]): Lambda values.
+        dimensionless_time (float): Fourier number.
+        dimensionless_distance (float): Dimensionless distance.
+
+    Returns:
+        PointTerms: The terms of the series, their sums and the bound of the terms left out.
+    """
+    try:
+        terms = [_point_term(geometry, lam, dimensionless_time, dimensionless_distance)
+                 for lam in lambdas]
+        value_a, value_theta_o, value_theta, value_q = (list(column) for column in zip(*terms))
+    except (ArithmeticError, ValueError):
+        series = evaluate_series(geometry, np.array(lambdas, dtype=float), dimensionless_time,
+                                 dimensionless_distance)
+        value_a = series.value_a.tolist()
+        value_theta_o = series.value_theta_o.tolist()
+        value_theta = series.value_theta.tolist()
+        value_q = series.value_q.tolist()
+
+    return PointTerms(
+        value_a=value_a,
+        value_theta_o=value_theta_o,
+        value_theta=value_theta,
+        value_q=value_q,
+        summation_a=sum(value_a),
+        summation_theta_o=sum(value_theta_o),
+        summation_theta=sum(value_theta),
+        summation_q=sum(value_q),
+        truncation_error=_truncation_bound_point(len(lambdas), dimensionless_time),
+    )
+
+
+def evaluate_grid(geometry, lambdas, dimensionless_time, dimensionless_distance):
+    """
+    Evaluates the series on every combination of a set of times and a set of distances.
+
+    The time factors a_n * exp(-lambda_n^2 * Fo) and the spatial modes are calculated once per time
+    and once per distance, and the grid is their matrix product, so the cost is one
+    (times, terms) x (terms, distances) product instead of one series per point. At Fo = 0 the
+    initial condition is returned exactly (theta = 1 and Q / Qmax = 0).
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        lambdas (np.ndarray): Lambda values, shape (terms,).
+        dimensionless_time (np.ndarray): Fourier numbers, shape (times,).
+        dimensionless_distance (np.ndarray): Dimensionless distances, shape (distances,).
+
+    Returns:
+        tuple: theta of shape (times, distances), Q / Qmax of shape (times,) and the bound of the
+            truncation error of shape (times,).
+    """
+    dimensionless_time = np.asarray(dimensionless_time, dtype=float)
+    dimensionless_distance = np.asarray(dimensionless_distance, dtype=float)
+    with np.errstate(all="ignore"):
+        decay = coefficients(geometry, lambdas) * np.exp(-np.outer(dimensionless_time, lambdas ** 2))
+        theta = decay @ spatial_modes(geometry, lambdas, dimensionless_distance[:, None]).T
+        heat_ratio = 1 - decay @ heat_modes(geometry, lambdas)
+        truncation_error = truncation_bound(lambdas.shape[-1], dimensionless_time)
+
+    start = dimensionless_time == 0
+    theta[start] = 1.0
+    heat_ratio[start] = 0.0
+    truncation_error[start] = 0.0
+    return theta, heat_ratio, truncation_error
@@ -0,0 +1,176 @@
+import math
+import numpy as np
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional
+from .batch_calculations import BatchArrays, evaluate_batch
+from ..models.convection_models import GEOMETRIES
+
+# Campos de ConvectionInput que pueden faltar (NaN en BatchArrays)
+OPTIONAL_FIELDS = ("thermal_diffusivity", "biot", "absolute_tolerance", "relative_tolerance",
+                   "accuracy")
+# Orden de los ejes, del más lento al más rápido: la geometría y lo que fija los valores lambda
+# primero, para que cada bloque abarque pocos grupos de geometría y Biot
+AXIS_PRIORITY = ("geometry", "biot", "thickness", "convection_coefficient",
+                 "conductivity_coefficient", "iterations", "absolute_tolerance",
+                 "relative_tolerance")
+
+
+@dataclass
+class SweepAxis:
+    """
+    One varying field of a sweep: an explicit list of values or an evenly spaced range.
+
+    Attributes:
+        name (str): Name of the ConvectionInput field.
+        values (list, optional): The values, when given as a list.
+        start (float): First value of the range.
+        stop (float): Last value of the range.
+        points (int): Number of values of the range.
+    """
+
+    name: str
+    values: Optional[list] = None
+    start: float = 0.0
+    stop: float = 0.0
+    points: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.values) if self.values is not None else self.points
+
+    def first(self):
+        return self.values[0] if self.values is not None else self.start
+
+    def take(self, index: np.ndarray) -> np.ndarray:
+        """
+        Returns the values at the given positions of the axis, without building the whole axis.
+
+        Parameters:
+            index (np.ndarray): Positions along the axis.
+
+        Returns:
+            np.ndarray: The values (strings for the geometry, floats otherwise).
+        """
+        if self.values is not None:
+            dtype = object if self.name == "geometry" else float
+            return np.asarray(self.values, dtype=dtype)[index]
+        if self.points == 1:
+            return np.full(index.shape, float(self.start))
+        step = (self.stop - self.start) / (self.points - 1)
+        values = self.start + step * index
+        # Igual que np.linspace, el último punto es exactamente stop
+        values[index == self.points - 1] = self.stop
+        return values
+
+
+@dataclass
+class SweepGrid:
+    """
+    Cartesian product of the values of several ConvectionInput fields, addressed by position.
+
+    The grid is never built: every point is identified by its flat index, and the values of a
+    block of indices are computed from the axes when the block is evaluated. The last axis varies
+    fastest.
+
+    Attributes:
+        base (dict): Values of the fields that do not vary.
+        axes (List[SweepAxis]): The varying fields, slowest first.
+    """
+
+    base: Dict[str, object]
+    axes: List[SweepAxis]
+
+    @property
+    def shape(self):
+        return tuple(axis.size for axis in self.axes)
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def first_point(self) -> dict:
+        # Primer punto de la malla, para validar la entrada antes de calcular
+        point = dict(self.base)
+        point.update({axis.name: axis.first() for axis in self.axes})
+        return point
+
+    def values(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        Returns the values of every varying field for the points start to stop - 1.
+
+        Parameters:
+            start (int): First flat index.
+            stop (int): Flat index after the last one.
+
+        Returns:
+            dict: One array per varying field, with stop - start entries.
+        """
+        positions = np.unravel_index(np.arange(start, stop), self.shape)
+        return {axis.name: axis.take(index) for axis, index in zip(self.axes, positions)}
+
+    def batch_arrays(self, values: Dict[str, np.ndarray], count: int) -> BatchArrays:
+        # Columnas de BatchArrays: los campos que varían y los fijos repetidos
+        columns = {}
+        for field in fields(BatchArrays):
+            if field.name in values:
+                column = values[field.name]
+            else:
+                value = self.base.get(field.name)
+                column = np.full(count, np.nan if value is None else value, dtype=float)
+            if field.name == "iterations":
+                column = column.astype(np.int64)
+            else:
+                column = column.astype(float)
+            columns[field.name] = column
+        return BatchArrays(**columns)
+
+
+def evaluate_sweep_chunk(grid: SweepGrid, start: int, stop: int) -> dict:
+    """
+    Evaluates the points start to stop - 1 of a sweep.
+
+    The points are grouped by geometry and every group goes through evaluate_batch, which solves
+    the eigenvalues once per distinct Biot number of the group. Invalid points give NaN results.
+
+    Parameters:
+        grid (SweepGrid): The sweep.
+        start (int): First flat index.
+        stop (int): Flat index after the last one.
+
+    Returns:
+        dict: start, stop, the values of the varying fields ('parameters') and, per point, the
+            model ('series', 'one_term' or 'semi_infinite'), the Biot number, the temperature,
+            the heat, the temperature ratio, the heat ratio and the error bound, as NumPy arrays.
+    """
+    count = stop - start
+    values = grid.values(start, stop)
+    arrays = grid.batch_arrays(values, count)
+    if "geometry" in values:
+        geometry = np.char.lower(values["geometry"].astype(str))
+    else:
+        geometry = np.full(count, str(grid.base["geometry"]).lower())
+
+    results = {name: np.full(count, np.nan) for name in
+               ("biot", "tem", "q", "value_theta", "value_q", "truncation_error")}
+    model = np.full(count, "series", dtype=object)
+    for name in GEOMETRIES:
+        mask = geometry == name
+        if not mask.any():
+            continue
+        output = evaluate_batch(arrays.subset(mask), name)
+        results["biot"][mask] = output.biot
+        results["tem"][mask] = output.tem
+        results["q"][mask] = output.q
+        results["value_theta"][mask] = output.summation_theta
+        results["value_q"][mask] = output.summation_q
+        # Como en el campo, la cota de la solución de tiempos cortos va en truncation_error
+        results["truncation_error"][mask] = np.where(output.model == "semi_infinite",
+                                                     output.model_error, output.truncation_error)
+        model[mask] = output.model
+
+    # Los puntos inválidos quedan en NaN en todas las salidas
+    invalid = ~(np.isfinite(results["tem"]) & np.isfinite(results["q"]))
+    for name in ("tem", "q", "value_theta", "value_q"):
+        results[name][invalid] = np.nan
+    model[invalid] = None
+    return {"start": start, "stop": stop, "parameters": values, "model": model, **results}
@@ -1,13 +1,55 @@
 # backend/app/main.py
 
-from fastapi import FastAPI
-from .routers import convection
+import time
+
+# Inicio de la importación de la aplicación (FastAPI, routers y servicios), reportado al arrancar
+IMPORT_START = time.perf_counter()
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from .routers import convection, health, metrics
+from .services.calculation_pool import calculation_pool, sweep_pool
+from .services.metrics import request_seconds
+from .services.run_history import run_history
+from .services.warmup import warm_up, warmup_state
 from fastapi.middleware.cors import CORSMiddleware
 
+# Nivel de log de la aplicación (DEBUG muestra los valores intermedios de los cálculos)
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Aplicación importada en %.3f s", warmup_state.app_import_seconds)
+    warmup = None
+    if warmup_state.enabled:
+        # El warm-up corre en un hilo: el servidor ya responde mientras tanto, y /health/ready
+        # indica cuándo terminó
+        warmup = asyncio.create_task(asyncio.to_thread(warm_up, warmup_state))
+    else:
+        warmup_state.ready = True
+    yield
+    if warmup is not None:
+        warmup.cancel()
+    # Liberar los workers de los pools al apagar el servidor
+    calculation_pool.shutdown()
+    sweep_pool.shutdown()
+    # Escribir las ejecuciones que quedan en cola
+    run_history.shutdown()
+
+
 app = FastAPI(
     title="Convection API",
     description="API para cálculos de convección",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configuración de CORS
@@ -19,4 +61,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.include_router(convection.router)
\ No newline at end of file
+
+
+@app.middleware("http")
+async def time_requests(request: Request, call_next):
+    # Duración total de cada solicitud, etiquetada con la ruta (no con la URL recibida)
+    start = time.perf_counter()
+    try:
+        return await call_next(request)
+    finally:
+        route = request.scope.get("route")
+        endpoint = route.path if route is not None else "unmatched"
+        request_seconds.observe(time.perf_counter() - start, endpoint=endpoint)
+
+
+app.include_router(convection.router)
+app.include_router(health.router)
+app.include_router(metrics.router)
+
+warmup_state.app_import_seconds = time.perf_counter() - IMPORT_START
@@ -1,6 +1,10 @@
 from pydantic import BaseModel
 from typing import Optional
 
+# Geometrías soportadas por los cálculos
+GEOMETRIES = ("plate", "cylinder", "sphere")
+
+
 class ConvectionInput(BaseModel):
     thickness: float
     thermal_diffusivity: Optional[float] = None # Puede ser opcional si se calcula internamente
@@ -12,6 +16,10 @@ class ConvectionInput(BaseModel):
     specific_heat: float
     distance: float
     time: float
-    iterations: int
+    iterations: int  # Máximo de iteraciones por valor lambda
     biot: Optional[float] = None  # Puede ser opcional si se calcula internamente
-    geometry: str  # Puede ser 'plate', 'cylinder' o 'sphere'
\ No newline at end of file
+    geometry: str  # Puede ser 'plate', 'cylinder' o 'sphere'
+    absolute_tolerance: Optional[float] = None  # Tolerancia absoluta de los valores lambda
+    relative_tolerance: Optional[float] = None  # Tolerancia relativa de los valores lambda
+    accuracy: Optional[float] = None  # Error de truncamiento máximo de la serie
+    allow_lumped: bool = True  # Permite el modelo concentrado cuando el número de Biot es pequeño
@@ -0,0 +1,54 @@
+# backend/app/models/field_models.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+
+# Tiempos por bloque en la salida por streaming
+DEFAULT_CHUNK_SIZE = 100
+STREAM_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+class GridRange(BaseModel):
+    start: float
+    stop: float
+    points: int  # Número de puntos, incluyendo start y stop
+
+
+class FieldInput(BaseModel):
+    thickness: float
+    thermal_diffusivity: Optional[float] = None  # Puede ser opcional si se calcula internamente
+    conductivity_coefficient: float
+    convection_coefficient: float
+    initial_temperature: float
+    ambient_temperature: float
+    density: float
+    specific_heat: float
+    distances: Optional[List[float]] = None  # Distancias al centro (o distance_range)
+    distance_range: Optional[GridRange] = None
+    times: Optional[List[float]] = None  # Tiempos (o time_range)
+    time_range: Optional[GridRange] = None
+    iterations: int  # Máximo de iteraciones por valor lambda
+    biot: Optional[float] = None  # Puede ser opcional si se calcula internamente
+    geometry: str  # Puede ser 'plate', 'cylinder' o 'sphere'
+    absolute_tolerance: Optional[float] = None  # Tolerancia absoluta de los valores lambda
+    relative_tolerance: Optional[float] = None  # Tolerancia relativa de los valores lambda
+    accuracy: Optional[float] = None  # Error de truncamiento máximo de la serie
+
+
+class FieldResult(BaseModel):
+    geometry: str
+    thermal_diffusivity: float
+    biot: float
+    q_max: float
+    lambdas: List[float]
+    terms: int  # Términos de la serie sumados
+    distances: List[float]
+    times: List[float]
+    temperature: List[List[float]]  # Una fila por tiempo y una columna por distancia
+    heat_ratio: List[float]  # Q / Qmax en cada tiempo
+    q: List[float]  # Calor transferido en cada tiempo
+    truncation_error: List[Optional[float]]  # Cota del error en cada tiempo
+    model: List[str]  # 'series' o 'semi_infinite' en cada tiempo
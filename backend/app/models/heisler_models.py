@@ -0,0 +1,25 @@
+# backend/app/models/heisler_models.py
+
+from pydantic import BaseModel
+from typing import List, Optional, Union
+
+
+class HeislerInput(BaseModel):
+    geometry: str  # Puede ser 'plate', 'cylinder' o 'sphere'
+    biot: Union[float, List[float]]  # Un valor o uno por punto
+    fourier: Union[float, List[float]]  # Número de Fourier, un valor o uno por punto
+    distance: Union[float, List[float]] = 0.0  # Distancia adimensional al centro (x / L), de 0 a 1
+    method: str = "cubic"  # Interpolación 'linear' o 'cubic'
+    exact_fallback: bool = False  # Calcular con la serie los puntos fuera de las tablas
+
+
+class HeislerResult(BaseModel):
+    geometry: str
+    method: str
+    biot: List[float]
+    fourier: List[float]
+    distance: List[float]
+    theta_o: List[Optional[float]]  # Cociente de temperaturas en el centro
+    theta: List[Optional[float]]  # Cociente de temperaturas en la distancia
+    heat_ratio: List[Optional[float]]  # Q / Qmax
+    source: List[str]  # 'table', 'exact' u 'off_grid' (sin valores) en cada punto
@@ -0,0 +1,33 @@
+# backend/app/models/history_models.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from .convection_models import ConvectionInput
+from .result_models import DataResult
+
+
+class HistoryRun(BaseModel):
+    id: int
+    input_hash: str  # Hash de la entrada canónica (el ETag sin comillas)
+    created_at: float  # Fecha del cálculo (segundos Unix)
+    geometry: str
+    time: Optional[float] = None
+    distance: Optional[float] = None
+    biot: Optional[float] = None
+    input: ConvectionInput
+    result: DataResult
+
+
+class HistoryPage(BaseModel):
+    runs: List[HistoryRun]  # Del más reciente al más antiguo
+    next_before: Optional[int] = None  # Valor de 'before' de la página siguiente (None al final)
+
+
+class HistoryStats(BaseModel):
+    enabled: bool
+    path: str
+    written: int  # Ejecuciones guardadas
+    pending: int  # Ejecuciones en cola para guardar
+    dropped: int  # Ejecuciones descartadas con la cola llena o por errores de escritura
+    hits: int  # Resultados servidos desde el historial
+    misses: int
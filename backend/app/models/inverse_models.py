@@ -0,0 +1,45 @@
+# backend/app/models/inverse_models.py
+
+from pydantic import BaseModel
+from typing import List, Optional, Union
+
+class TimeToTemperatureInput(BaseModel):
+    thickness: float
+    thermal_diffusivity: Optional[float] = None  # Puede ser opcional si se calcula internamente
+    conductivity_coefficient: float
+    convection_coefficient: float
+    initial_temperature: float
+    ambient_temperature: float
+    density: float
+    specific_heat: float
+    distance: float  # Distancia al centro donde se mide la temperatura
+    target_temperature: Union[float, List[float]]  # Temperatura objetivo o lista de objetivos
+    iterations: int  # Máximo de iteraciones por valor lambda
+    biot: Optional[float] = None  # Puede ser opcional si se calcula internamente
+    geometry: str  # Puede ser 'plate', 'cylinder' o 'sphere'
+    absolute_tolerance: Optional[float] = None  # Tolerancia absoluta de los valores lambda
+    relative_tolerance: Optional[float] = None  # Tolerancia relativa de los valores lambda
+    accuracy: Optional[float] = None  # Error de truncamiento máximo de la serie
+
+
+class CrossingResult(BaseModel):
+    target_temperature: float
+    theta: float  # (T - T_amb) / (T_i - T_amb) del objetivo
+    time: Optional[float] = None  # Tiempo en que se alcanza el objetivo
+    fourier: Optional[float] = None  # Número de Fourier en que se alcanza el objetivo
+    iterations: int  # Iteraciones de la búsqueda
+    residual: Optional[float] = None  # |theta(Fo) - theta objetivo|
+    model: str = "series"  # 'series' o 'semi_infinite' (tiempos cortos de placa y esfera)
+    model_error: Optional[float] = None  # Cota del error de la solución de tiempos cortos
+    error: Optional[str] = None
+
+
+class TimeToTemperatureResult(BaseModel):
+    geometry: str
+    thermal_diffusivity: float
+    biot: float
+    distance: float
+    lambdas: List[float]
+    terms: int  # Términos de la serie sumados
+    truncation_error: Optional[float] = None  # Cota del error en el menor tiempo encontrado
+    crossings: List[CrossingResult]  # Un resultado por objetivo, en el orden recibido
@@ -1,8 +1,19 @@
 # backend/app/models/lambda_model.py
 
 from pydantic import BaseModel
+from typing import List, Optional
 
 class LambdaValues(BaseModel):
     lambda1: float
-    lambda2: float
-    lambda3: float
+    lambda2: Optional[float] = None  # null en el modo de un término
+    lambda3: Optional[float] = None
+    iterations: Optional[List[int]] = None  # Iteraciones usadas por cada valor lambda
+    residuals: Optional[List[float]] = None  # Residuo de la ecuación característica
+
+
+class EigenvalueCacheStats(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    hit_ratio: float
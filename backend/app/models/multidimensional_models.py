@@ -0,0 +1,50 @@
+# backend/app/models/multidimensional_models.py
+
+from pydantic import BaseModel
+from typing import Any, List, Optional, Union
+from .field_models import GridRange
+
+# Geometrías que se calculan como producto de soluciones unidimensionales
+PRODUCT_GEOMETRIES = ("short_cylinder", "bar", "box")
+
+
+class MultidimensionalInput(BaseModel):
+    geometry: str  # Puede ser 'short_cylinder', 'bar' o 'box'
+    thicknesses: List[float]  # Espesor en cada dirección (diámetro y altura para el cilindro corto)
+    thermal_diffusivity: Optional[float] = None  # Puede ser opcional si se calcula internamente
+    conductivity_coefficient: float
+    convection_coefficient: Union[float, List[float]]  # Uno para todas las caras o uno por dirección
+    initial_temperature: float
+    ambient_temperature: float
+    density: float
+    specific_heat: float
+    distances: List[List[float]]  # Distancias al centro en cada dirección
+    times: Optional[List[float]] = None  # Tiempos (o time_range)
+    time_range: Optional[GridRange] = None
+    iterations: int  # Máximo de iteraciones por valor lambda
+    absolute_tolerance: Optional[float] = None  # Tolerancia absoluta de los valores lambda
+    relative_tolerance: Optional[float] = None  # Tolerancia relativa de los valores lambda
+    accuracy: Optional[float] = None  # Error de truncamiento máximo del producto
+
+
+class FactorResult(BaseModel):
+    geometry: str  # 'plate' o 'cylinder'
+    thickness: float
+    biot: float
+    lambdas: List[float]
+    terms: int  # Términos de la serie sumados
+    distances: List[float]
+    model: List[str]  # Modelo en cada tiempo: 'series' o 'semi_infinite' (solo placas)
+
+
+class MultidimensionalResult(BaseModel):
+    geometry: str
+    thermal_diffusivity: float
+    q_max: float
+    factors: List[FactorResult]  # Un factor unidimensional por dirección
+    times: List[float]
+    temperature: List[Any]  # Índices: tiempo y una distancia por dirección
+    heat_ratio: List[float]  # Q / Qmax en cada tiempo
+    q: List[float]  # Calor transferido en cada tiempo
+    truncation_error: List[Optional[float]]  # Cota del error en cada tiempo
+    eigenvalue_solves: int  # Pares (geometría, Biot) distintos resueltos
@@ -0,0 +1,45 @@
+# backend/app/models/numerical_models.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from .field_models import GridRange
+
+
+class Profile(BaseModel):
+    points: List[float]  # Distancias al centro o tiempos, en orden creciente
+    values: List[float]  # Temperatura en cada punto (interpolación lineal entre puntos)
+
+
+class NumericalInput(BaseModel):
+    thickness: float
+    thermal_diffusivity: Optional[float] = None  # Puede ser opcional si se calcula internamente
+    conductivity_coefficient: float
+    convection_coefficient: float
+    initial_temperature: Optional[float] = None  # Temperatura inicial uniforme (o initial_profile)
+    initial_profile: Optional[Profile] = None  # Temperatura inicial según la distancia al centro
+    ambient_temperature: Optional[float] = None  # Temperatura ambiente fija (o ambient_schedule)
+    ambient_schedule: Optional[Profile] = None  # Temperatura ambiente según el tiempo
+    density: float
+    specific_heat: float
+    distances: Optional[List[float]] = None  # Distancias al centro (o distance_range)
+    distance_range: Optional[GridRange] = None
+    times: Optional[List[float]] = None  # Tiempos (o time_range)
+    time_range: Optional[GridRange] = None
+    geometry: str  # Puede ser 'plate', 'cylinder' o 'sphere'
+    nodes: int = 201  # Nodos de la malla entre el centro y la superficie
+    time_step: Optional[float] = None  # Paso de tiempo máximo (por defecto, el último tiempo / 1000)
+
+
+class NumericalResult(BaseModel):
+    geometry: str
+    thermal_diffusivity: float
+    biot: float
+    q_max: float  # Calculado con la temperatura inicial media y la última temperatura ambiente
+    nodes: int
+    time_step: float
+    steps: int  # Pasos de tiempo calculados
+    distances: List[float]
+    times: List[float]
+    temperature: List[List[float]]  # Una fila por tiempo y una columna por distancia
+    heat_ratio: List[Optional[float]]  # Q / Qmax en cada tiempo
+    q: List[float]  # Calor transferido en cada tiempo
@@ -0,0 +1,12 @@
+# backend/app/models/pool_models.py
+
+from pydantic import BaseModel
+
+class PoolStats(BaseModel):
+    kind: str  # 'thread' o 'process'
+    workers: int
+    queue_size: int
+    timeout: float
+    pending: int  # Trabajos aceptados sin terminar
+    rejected: int  # Trabajos rechazados por pool lleno
+    timeouts: int  # Solicitudes que superaron el tiempo máximo
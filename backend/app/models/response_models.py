@@ -1,8 +1,83 @@
 # backend/app/models/response_models.py
 
 from pydantic import BaseModel
-from .result_models import DataResult
+from typing import List
+from .result_models import DataResult, BatchRowResult, ResultCacheStats
+from .lambda_model import EigenvalueCacheStats
+from .field_models import FieldResult
+from .heisler_models import HeislerResult
+from .history_models import HistoryPage, HistoryRun, HistoryStats
+from .inverse_models import TimeToTemperatureResult
+from .multidimensional_models import MultidimensionalResult
+from .numerical_models import NumericalResult
+from .pool_models import PoolStats
+from .warmup_models import WarmupStats
 
 class ApiResponse(BaseModel):
     message: str
     data: DataResult
+
+
+class BatchApiResponse(BaseModel):
+    message: str
+    data: List[BatchRowResult]
+
+
+class EigenvalueCacheResponse(BaseModel):
+    message: str
+    data: EigenvalueCacheStats
+
+
+class FieldApiResponse(BaseModel):
+    message: str
+    data: FieldResult
+
+
+class HeislerApiResponse(BaseModel):
+    message: str
+    data: HeislerResult
+
+
+class MultidimensionalApiResponse(BaseModel):
+    message: str
+    data: MultidimensionalResult
+
+
+class NumericalApiResponse(BaseModel):
+    message: str
+    data: NumericalResult
+
+
+class TimeToTemperatureApiResponse(BaseModel):
+    message: str
+    data: TimeToTemperatureResult
+
+
+class PoolStatsResponse(BaseModel):
+    message: str
+    data: PoolStats
+
+
+class ResultCacheResponse(BaseModel):
+    message: str
+    data: ResultCacheStats
+
+
+class ReadinessResponse(BaseModel):
+    message: str
+    data: WarmupStats
+
+
+class HistoryApiResponse(BaseModel):
+    message: str
+    data: HistoryPage
+
+
+class HistoryRunApiResponse(BaseModel):
+    message: str
+    data: HistoryRun
+
+
+class HistoryStatsResponse(BaseModel):
+    message: str
+    data: HistoryStats
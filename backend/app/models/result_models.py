@@ -1,6 +1,7 @@
 # backend/app/models/result_models.py
 
 from pydantic import BaseModel
+from typing import Optional
 from .calculation_models import CalculationResult
 from .lambda_model import LambdaValues
 
@@ -18,14 +19,38 @@ class DataResult(BaseModel):
     iterations: int
     biot: float
     geometry: str
+    absolute_tolerance: Optional[float] = None
+    relative_tolerance: Optional[float] = None
+    accuracy: Optional[float] = None
     q_max: float
-    calc1: CalculationResult
-    calc2: CalculationResult
-    calc3: CalculationResult
-    lamb: LambdaValues
-    value_a: float
+    calc1: Optional[CalculationResult] = None  # null con el modelo concentrado
+    calc2: Optional[CalculationResult] = None  # null también en el modo de un término
+    calc3: Optional[CalculationResult] = None
+    lamb: Optional[LambdaValues] = None
+    value_a: Optional[float] = None
     value_theta_o: float
     value_theta: float
     value_q: float
     tem: float
     q: float
+    terms: Optional[int] = None  # Términos de la serie sumados
+    truncation_error: Optional[float] = None  # Cota del error por los términos omitidos
+    model: str = "series"  # 'series', 'one_term', 'lumped' o 'semi_infinite'
+    model_error: Optional[float] = None  # Diferencia con la serie (lumped) o cota (semi_infinite)
+
+
+class BatchRowResult(BaseModel):
+    index: int  # Posición de la fila en la solicitud
+    data: Optional[DataResult] = None
+    error: Optional[str] = None
+
+
+class ResultCacheStats(BaseModel):
+    hits: int
+    misses: int
+    not_modified: int  # Respuestas 304 sin cálculo
+    size: int
+    max_size: int
+    ttl: float  # Segundos de validez (0 = sin caducidad)
+    memory_bytes: int  # Tamaño de las respuestas guardadas
+    hit_ratio: float
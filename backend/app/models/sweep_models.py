@@ -0,0 +1,15 @@
+# backend/app/models/sweep_models.py
+
+from pydantic import BaseModel
+from typing import Dict, List, Union
+from .field_models import GridRange
+
+# Puntos por bloque de un barrido
+DEFAULT_SWEEP_CHUNK_SIZE = 5000
+MAX_SWEEP_CHUNK_SIZE = 50000
+
+
+class SweepInput(BaseModel):
+    base: Dict[str, Union[float, int, str, None]] = {}  # Campos fijos de ConvectionInput
+    # Campos que varían: lista de valores o rango (el barrido es el producto cartesiano)
+    parameters: Dict[str, Union[GridRange, List[Union[float, int, str]]]]
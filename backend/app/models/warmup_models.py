@@ -0,0 +1,14 @@
+# backend/app/models/warmup_models.py
+
+from pydantic import BaseModel
+from typing import Dict, Optional
+
+class WarmupStats(BaseModel):
+    ready: bool  # True cuando el warm-up terminó (o está desactivado)
+    enabled: bool
+    app_import_seconds: Optional[float] = None  # Importación de la aplicación
+    import_seconds: Optional[float] = None  # Importación de los módulos de cálculo
+    table_seconds: Optional[float] = None  # Construcción de las tablas de valores lambda
+    geometry_seconds: Dict[str, float]  # Primer cálculo de cada geometría
+    warmup_seconds: Optional[float] = None  # Duración total del warm-up
+    error: Optional[str] = None
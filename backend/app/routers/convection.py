@@ -1,25 +1,418 @@
 # backend/app/routers/convection.py
 
-from fastapi import APIRouter, HTTPException
-from ..models.convection_models import ConvectionInput
-from ..models.response_models import ApiResponse
-from ..services.convection_service import perform_convection_calculation
+import asyncio
+import time
+from collections import Counter
+from typing import List, Optional
+from fastapi import (
+    APIRouter, Header, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+)
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from ..models.convection_models import GEOMETRIES, ConvectionInput
+from ..models.field_models import DEFAULT_CHUNK_SIZE, STREAM_MEDIA_TYPES, FieldInput
+from ..models.heisler_models import HeislerInput
+from ..models.inverse_models import TimeToTemperatureInput
+from ..models.multidimensional_models import PRODUCT_GEOMETRIES, MultidimensionalInput
+from ..models.numerical_models import NumericalInput
+from ..models.sweep_models import DEFAULT_SWEEP_CHUNK_SIZE, SweepInput
+from ..models.response_models import (
+    ApiResponse,
+    BatchApiResponse,
+    EigenvalueCacheResponse,
+    FieldApiResponse,
+    HeislerApiResponse,
+    HistoryApiResponse,
+    HistoryRunApiResponse,
+    HistoryStatsResponse,
+    MultidimensionalApiResponse,
+    NumericalApiResponse,
+    PoolStatsResponse,
+    ResultCacheResponse,
+    TimeToTemperatureApiResponse
+)
+from ..services.calculation_pool import calculation_pool, PoolFullError, PoolTimeoutError
+from ..services.result_cache import result_cache, etag_matches
+from ..services.run_history import MAX_HISTORY_PAGE, RunEntry, run_history
+from ..services.metrics import (
+    batch_rows_total,
+    errors_total,
+    requests_total,
+    stage_seconds
+)
 
 router = APIRouter(
     prefix="/convection",
     tags=["Convection"]
 )
 
+
+def _service():
+    # El servicio importa NumPy y los módulos de cálculo: se carga en el warm-up de arranque o,
+    # sin él, con la primera solicitud, en lugar de retrasar el inicio del servidor
+    from ..services import convection_service
+    return convection_service
+
+
+def _sweep_service():
+    from ..services import sweep_service
+    return sweep_service
+
+
+def _csv_service():
+    from ..services import csv_service
+    return csv_service
+
+
+def _heisler_service():
+    from ..services import heisler_service
+    return heisler_service
+
+
+def _multidimensional_service():
+    from ..services import multidimensional_service
+    return multidimensional_service
+
+
+def _numerical_service():
+    from ..services import numerical_service
+    return numerical_service
+
+
+def _live_service():
+    from ..services import live_session
+    return live_session
+
+
+def _geometry_label(geometry: str, known=GEOMETRIES) -> str:
+    # Las geometrías desconocidas se agrupan para no crear una serie por valor recibido
+    geometry = geometry.lower()
+    return geometry if geometry in known else "unknown"
+
+
+def _pool_full_error(endpoint: str):
+    errors_total.inc(endpoint=endpoint, error="pool_full")
+    # Todos los workers ocupados y la cola llena: el cliente debe reintentar más tarde
+    return HTTPException(status_code=503, detail="Error: servidor ocupado, intente más tarde",
+                         headers={"Retry-After": str(calculation_pool.retry_after)})
+
+
+def _pool_timeout_error(endpoint: str):
+    errors_total.inc(endpoint=endpoint, error="timeout")
+    return HTTPException(status_code=504, detail="Error: el cálculo superó el tiempo máximo")
+
+
 @router.post("/calculate", response_model=ApiResponse)
-async def calculate_convection(input_data: ConvectionInput):
+async def calculate_convection(input_data: ConvectionInput,
+                               if_none_match: Optional[str] = Header(None)):
+    requests_total.inc(endpoint="calculate", geometry=_geometry_label(input_data.geometry))
     try:
-        # Llamar a la función de servicio para realizar los cálculos
-        data = perform_convection_calculation(input_data)
-        # Devolver una respuesta exitosa con los datos calculados
-        return ApiResponse(message="Success", data=data)
+        # Entradas equivalentes comparten clave, ETag y resultado en caché
+        service = _service()
+        key = service.canonical_convection_key(input_data)
+        if key is not None:
+            etag = result_cache.etag(key)
+            if etag_matches(if_none_match, etag):
+                # El cliente ya tiene este resultado: no se calcula nada
+                result_cache.count_not_modified()
+                return Response(status_code=304, headers={"ETag": etag})
+            body = result_cache.get(key)
+            if body is None and run_history.enabled:
+                # Segundo nivel: el historial en disco, compartido por los procesos del servidor
+                body = await run_in_threadpool(run_history.lookup, etag.strip('"'))
+                if body is not None:
+                    result_cache.put(key, body)
+            if body is not None:
+                return Response(content=body, media_type="application/json",
+                                headers={"ETag": etag})
+
+        # Llamar a la función de servicio en el pool para no bloquear el event loop
+        record = await calculation_pool.run(service.compute_convection_record, input_data)
+        # Devolver una respuesta exitosa, escrita directamente desde el resultado compacto
+        with stage_seconds.time(stage="serialization", geometry=record.calcs.geometry):
+            body = record.to_json()
+        if key is None:
+            return Response(content=body, media_type="application/json")
+        result_cache.put(key, body)
+        # Guardar en el historial sin esperar al disco: lo escribe un hilo aparte
+        run_history.record(RunEntry(
+            input_hash=etag.strip('"'),
+            created_at=time.time(),
+            geometry=record.calcs.geometry,
+            time=input_data.time,
+            distance=input_data.distance,
+            biot=record.calcs.biot,
+            input=input_data.model_dump_json(),
+            body=body,
+        ))
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+    except PoolFullError:
+        raise _pool_full_error("calculate")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("calculate")
     except ValueError as e:
+        errors_total.inc(endpoint="calculate", error="invalid_input")
         # Manejar errores de validación o cálculos específicos
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
+        errors_total.inc(endpoint="calculate", error=type(e).__name__)
         # Manejar errores inesperados
         raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/calculate/batch", response_model=BatchApiResponse)
+async def calculate_convection_batch(input_data: List[ConvectionInput]):
+    requests_total.inc(endpoint="calculate/batch", geometry="batch")
+    for geometry, rows in Counter(_geometry_label(row.geometry) for row in input_data).items():
+        batch_rows_total.inc(rows, geometry=geometry)
+    try:
+        # Calcular todas las filas agrupadas por geometría; los errores se reportan por fila
+        data = await calculation_pool.run(_service().perform_batch_convection_calculation,
+                                          input_data)
+        # Las filas ya son JSON válido: se devuelven sin volver a validar miles de modelos
+        return JSONResponse(content={"message": "Success", "data": data})
+    except PoolFullError:
+        raise _pool_full_error("calculate/batch")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("calculate/batch")
+    except ValueError as e:
+        errors_total.inc(endpoint="calculate/batch", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="calculate/batch", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/calculate/csv")
+async def calculate_convection_csv(request: Request, chunk_size: Optional[int] = None):
+    requests_total.inc(endpoint="calculate/csv", geometry="batch")
+    service = _csv_service()
+    try:
+        # El cuerpo es el archivo CSV (Content-Type: text/csv); se copia a un archivo temporal
+        # y se calcula por bloques mientras se envían los resultados
+        upload = await service.spool_upload(request.stream())
+        lines = service.stream_csv_calculation(
+            upload, service.DEFAULT_CSV_CHUNK_SIZE if chunk_size is None else chunk_size)
+        return StreamingResponse(lines, media_type="text/csv")
+    except service.UploadTooLargeError as e:
+        errors_total.inc(endpoint="calculate/csv", error="too_large")
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        errors_total.inc(endpoint="calculate/csv", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="calculate/csv", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/field", response_model=FieldApiResponse)
+async def calculate_field(input_data: FieldInput):
+    requests_total.inc(endpoint="field", geometry=_geometry_label(input_data.geometry))
+    try:
+        # Evaluar la temperatura en toda la malla de distancias y tiempos con una sola solicitud
+        data = await calculation_pool.run(_service().perform_field_calculation, input_data)
+        # Las matrices ya son JSON válido: se devuelven sin validarlas punto por punto
+        return JSONResponse(content={"message": "Success", "data": data})
+    except PoolFullError:
+        raise _pool_full_error("field")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("field")
+    except ValueError as e:
+        errors_total.inc(endpoint="field", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="field", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/multidimensional", response_model=MultidimensionalApiResponse)
+async def calculate_multidimensional(input_data: MultidimensionalInput):
+    requests_total.inc(endpoint="multidimensional",
+                       geometry=_geometry_label(input_data.geometry, PRODUCT_GEOMETRIES))
+    try:
+        # Cilindro corto, barra o caja como producto de soluciones unidimensionales
+        service = _multidimensional_service()
+        data = await calculation_pool.run(service.perform_multidimensional_calculation, input_data)
+        return JSONResponse(content={"message": "Success", "data": data})
+    except PoolFullError:
+        raise _pool_full_error("multidimensional")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("multidimensional")
+    except ValueError as e:
+        errors_total.inc(endpoint="multidimensional", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="multidimensional", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/numerical", response_model=NumericalApiResponse)
+async def calculate_numerical(input_data: NumericalInput):
+    requests_total.inc(endpoint="numerical", geometry=_geometry_label(input_data.geometry))
+    try:
+        # Crank-Nicolson en diferencias finitas, para perfiles iniciales y ambientes variables
+        service = _numerical_service()
+        data = await calculation_pool.run(service.perform_numerical_calculation, input_data)
+        return JSONResponse(content={"message": "Success", "data": data})
+    except PoolFullError:
+        raise _pool_full_error("numerical")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("numerical")
+    except ValueError as e:
+        errors_total.inc(endpoint="numerical", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="numerical", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/heisler", response_model=HeislerApiResponse)
+async def heisler_lookup(input_data: HeislerInput):
+    requests_total.inc(endpoint="heisler", geometry=_geometry_label(input_data.geometry))
+    try:
+        service = _heisler_service()
+        # Una consulta pequeña a tablas ya cargadas tarda microsegundos: no pasa por el pool
+        if service.inline_lookup(input_data):
+            data = service.perform_heisler_lookup(input_data)
+        else:
+            data = await calculation_pool.run(service.perform_heisler_lookup, input_data)
+        return JSONResponse(content={"message": "Success", "data": data})
+    except PoolFullError:
+        raise _pool_full_error("heisler")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("heisler")
+    except ValueError as e:
+        errors_total.inc(endpoint="heisler", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="heisler", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/field/stream")
+async def stream_field(input_data: FieldInput, stream_format: str = Query("ndjson", alias="format"),
+                       chunk_size: int = DEFAULT_CHUNK_SIZE):
+    requests_total.inc(endpoint="field/stream", geometry=_geometry_label(input_data.geometry))
+    try:
+        service = _service()
+        # Validar y resolver los valores lambda en el pool antes de empezar a enviar
+        context = await calculation_pool.run(service.prepare_field_stream, input_data,
+                                             stream_format, chunk_size)
+        # Cada bloque de tiempos se calcula en el pool y se envía en cuanto termina
+        events = service.stream_field_calculation(context, input_data, stream_format, chunk_size)
+        return StreamingResponse(events, media_type=STREAM_MEDIA_TYPES[stream_format])
+    except PoolFullError:
+        raise _pool_full_error("field/stream")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("field/stream")
+    except ValueError as e:
+        errors_total.inc(endpoint="field/stream", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="field/stream", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/sweep")
+async def sweep(input_data: SweepInput, stream_format: str = Query("ndjson", alias="format"),
+                chunk_size: int = DEFAULT_SWEEP_CHUNK_SIZE):
+    requests_total.inc(endpoint="sweep", geometry="sweep")
+    try:
+        # Validar el barrido antes de empezar a enviar; los bloques se calculan en el pool de
+        # barridos y se envían en orden a medida que terminan
+        events = _sweep_service().stream_sweep(input_data, stream_format, chunk_size)
+        return StreamingResponse(events, media_type=STREAM_MEDIA_TYPES[stream_format])
+    except ValueError as e:
+        errors_total.inc(endpoint="sweep", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="sweep", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.post("/time-to-temperature", response_model=TimeToTemperatureApiResponse)
+async def time_to_temperature(input_data: TimeToTemperatureInput):
+    requests_total.inc(endpoint="time-to-temperature",
+                       geometry=_geometry_label(input_data.geometry))
+    try:
+        # Tiempos en que la temperatura en la distancia dada alcanza cada objetivo
+        data = await calculation_pool.run(_service().perform_time_to_temperature, input_data)
+        return JSONResponse(content={"message": "Success", "data": data})
+    except PoolFullError:
+        raise _pool_full_error("time-to-temperature")
+    except PoolTimeoutError:
+        raise _pool_timeout_error("time-to-temperature")
+    except ValueError as e:
+        errors_total.inc(endpoint="time-to-temperature", error="invalid_input")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        errors_total.inc(endpoint="time-to-temperature", error=type(e).__name__)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred.")
+
+
+@router.get("/eigenvalues/cache", response_model=EigenvalueCacheResponse)
+async def eigenvalue_cache_stats():
+    # Contadores de aciertos y fallos de la caché de valores lambda
+    from ..calculations.eigenvalues import eigenvalue_provider
+    return EigenvalueCacheResponse(message="Success", data=eigenvalue_provider.stats())
+
+
+@router.get("/pool", response_model=PoolStatsResponse)
+async def calculation_pool_stats():
+    # Configuración y contadores del pool de cálculo
+    return PoolStatsResponse(message="Success", data=calculation_pool.stats())
+
+
+@router.get("/results/cache", response_model=ResultCacheResponse)
+async def result_cache_stats():
+    # Aciertos, fallos, respuestas 304 y memoria usada por la caché de resultados
+    return ResultCacheResponse(message="Success", data=result_cache.stats())
+
+
+def _history_disabled():
+    return HTTPException(status_code=404, detail="Error: el historial de ejecuciones no está activado")
+
+
+@router.get("/history", response_model=HistoryApiResponse)
+async def list_history(geometry: Optional[str] = None, input_hash: Optional[str] = None,
+                       time_min: Optional[float] = None, time_max: Optional[float] = None,
+                       before: Optional[int] = None,
+                       limit: int = Query(50, ge=1, le=MAX_HISTORY_PAGE)):
+    if not run_history.enabled:
+        raise _history_disabled()
+    # Paginación por clave: 'before' es el next_before de la página anterior
+    data = await run_in_threadpool(run_history.query, geometry and geometry.lower(), input_hash,
+                                   time_min, time_max, before, limit)
+    return JSONResponse(content={"message": "Success", "data": data})
+
+
+@router.get("/history/stats", response_model=HistoryStatsResponse)
+async def history_stats():
+    # Ejecuciones guardadas, en cola y descartadas, y aciertos del historial como caché
+    return HistoryStatsResponse(message="Success", data=run_history.stats())
+
+
+@router.get("/history/{run_id}", response_model=HistoryRunApiResponse)
+async def get_history_run(run_id: int):
+    if not run_history.enabled:
+        raise _history_disabled()
+    data = await run_in_threadpool(run_history.get, run_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Error: ejecución no encontrada")
+    return JSONResponse(content={"message": "Success", "data": data})
+
+
+@router.websocket("/ws")
+async def live_calculation(websocket: WebSocket):
+    await websocket.accept()
+    session = _live_service().LiveSession(websocket.send_text)
+    # Los mensajes solo actualizan la entrada; el cálculo corre aparte y solo para la última
+    worker = asyncio.create_task(session.run())
+    try:
+        async for text in websocket.iter_text():
+            await session.receive(text)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # El trabajo en curso termina en el pool, pero su resultado ya no se envía
+        worker.cancel()
@@ -0,0 +1,21 @@
+# backend/app/routers/health.py
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from ..models.response_models import ReadinessResponse
+from ..services.warmup import warmup_state
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"]
+)
+
+@router.get("/ready", response_model=ReadinessResponse,
+            responses={503: {"model": ReadinessResponse}})
+async def readiness():
+    # 503 hasta que termine el warm-up: el balanceador no envía tráfico a un worker en frío
+    data = warmup_state.stats()
+    if not data["ready"]:
+        message = "Error: falló el warm-up" if data["error"] else "Error: el servidor aún no está listo"
+        return JSONResponse(status_code=503, content={"message": message, "data": data})
+    return ReadinessResponse(message="Success", data=data)
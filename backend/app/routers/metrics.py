@@ -0,0 +1,14 @@
+# backend/app/routers/metrics.py
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from ..services.metrics import registry, CONTENT_TYPE
+
+router = APIRouter(
+    tags=["Metrics"]
+)
+
+@router.get("/metrics")
+async def metrics():
+    # Histogramas y contadores en el formato de texto de Prometheus
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,151 @@
+# backend/app/services/calculation_pool.py
+
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+from .warmup import initialize_worker
+
+# Configuración por variables de entorno
+POOL_KIND = os.environ.get("CALC_POOL_KIND", "thread")  # 'thread' o 'process'
+POOL_WORKERS = int(os.environ.get("CALC_POOL_WORKERS", os.cpu_count() or 1))
+POOL_QUEUE_SIZE = int(os.environ.get("CALC_POOL_QUEUE_SIZE", 64))
+POOL_TIMEOUT = float(os.environ.get("CALC_POOL_TIMEOUT", 30))
+POOL_RETRY_AFTER = int(os.environ.get("CALC_POOL_RETRY_AFTER", 1))
+# Pool propio de los barridos de parámetros, con procesos por defecto: los bloques son largos
+SWEEP_POOL_KIND = os.environ.get("SWEEP_POOL_KIND", "process")
+SWEEP_WORKERS = int(os.environ.get("SWEEP_WORKERS", os.cpu_count() or 1))
+SWEEP_QUEUE_SIZE = int(os.environ.get("SWEEP_QUEUE_SIZE", 16))
+
+
+class PoolFullError(Exception):
+    """Raised when every worker is busy and the waiting queue is full."""
+
+
+class PoolTimeoutError(Exception):
+    """Raised when a calculation does not finish within the timeout."""
+
+
+class CalculationPool:
+    """
+    Runs the CPU-bound calculations outside the event loop, with a bounded number of pending jobs.
+
+    Jobs are accepted while fewer than workers + queue_size are in progress; beyond that, run
+    raises PoolFullError at once instead of letting requests pile up. A job stays counted until
+    it really finishes, even after its request timed out, so the bound holds for the work the
+    workers are actually doing.
+
+    Attributes:
+        kind (str): 'thread' (shared caches, cheap results) or 'process' (true parallelism, the
+            arguments and results must be picklable).
+        workers (int): Number of workers.
+        queue_size (int): Number of jobs that may wait for a free worker.
+        timeout (float): Seconds a request waits for its result.
+        retry_after (int): Seconds suggested to clients when the pool is full.
+        initializer (Callable, optional): Function run in each worker process when it starts.
+        pending (int): Jobs accepted and not finished yet.
+        rejected (int): Jobs refused because the pool was full.
+        timeouts (int): Requests that gave up waiting for their result.
+
+    Parameters:
+        kind (str): 'thread' or 'process'.
+        workers (int): Number of workers.
+        queue_size (int): Number of jobs that may wait for a free worker.
+        timeout (float): Seconds a request waits for its result.
+        retry_after (int): Seconds suggested to clients when the pool is full.
+        initializer (Callable, optional): Function run in each worker process when it starts.
+    """
+
+    def __init__(self, kind=POOL_KIND, workers=POOL_WORKERS, queue_size=POOL_QUEUE_SIZE,
+                 timeout=POOL_TIMEOUT, retry_after=POOL_RETRY_AFTER,
+                 initializer: Optional[Callable] = None):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Error: tipo de pool incorrecto '{kind}'")
+        self.kind = kind
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.initializer = initializer
+        self.pending = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self._executor: Optional[Executor] = None
+
+    @property
+    def capacity(self):
+        return self.workers + self.queue_size
+
+    def _get_executor(self) -> Executor:
+        # El executor se crea con el primer trabajo
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     initializer=self.initializer)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="calculation")
+        return self._executor
+
+    def _release(self, _future):
+        self.pending -= 1
+
+    async def run(self, function: Callable, *args):
+        """
+        Runs function(*args) in the pool and waits for its result.
+
+        Parameters:
+            function (Callable): The calculation (a module-level function for process pools).
+            *args: Its arguments.
+
+        Returns:
+            The result of the function. Its exceptions are raised again here.
+
+        Raises:
+            PoolFullError: If the pool already has capacity jobs in progress.
+            PoolTimeoutError: If the result is not ready within timeout seconds.
+        """
+        # El contador solo se toca desde el event loop, no necesita candado
+        if self.pending >= self.capacity:
+            self.rejected += 1
+            raise PoolFullError()
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._get_executor(), function, *args)
+        self.pending += 1
+        future.add_done_callback(self._release)
+        try:
+            # shield: al vencer el tiempo el trabajo sigue contando hasta que termine de verdad
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise PoolTimeoutError()
+
+    def stats(self):
+        """
+        Returns the configuration and the counters of the pool.
+
+        Returns:
+            dict: kind, workers, queue_size, timeout, pending, rejected and timeouts.
+        """
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "timeout": self.timeout,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+        }
+
+    def shutdown(self):
+        # Los trabajos en curso terminan; los que esperan se cancelan
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Los procesos del pool hacen su propio warm-up: no comparten memoria con el servidor
+calculation_pool = CalculationPool(initializer=initialize_worker)
+sweep_pool = CalculationPool(kind=SWEEP_POOL_KIND, workers=SWEEP_WORKERS, queue_size=SWEEP_QUEUE_SIZE,
+                             initializer=initialize_worker)
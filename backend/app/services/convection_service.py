@@ -1,28 +1,218 @@
 # backend/app/services/convection_service.py
 
+import logging
+import math
+import os
+import time
+import numpy as np
+import pydantic_core
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Union
 from ..models.result_models import DataResult
 from ..models.convection_models import ConvectionInput
-from ..models.calculation_models import CalculationResult
-from ..models.lambda_model import LambdaValues
+from ..models.field_models import DEFAULT_CHUNK_SIZE, STREAM_MEDIA_TYPES, FieldInput, GridRange
+from ..models.inverse_models import TimeToTemperatureInput
 from ..calculations.convection_calculations import (
     InitialCalcs,
     InitialCalcsData,
     calc_qmax,
     calc_biot,
     calc_alpha,
-    LambdaPlate,
-    LambdaCylinder,
-    LambdaSphere,
-    Plate,
-    Cylinder,
-    Sphere,
-    SumTable,
-    ConvectionResults,
-    FinalValues
+    ConvectionResults
 )
+from ..calculations.eigenvalues import eigenvalue_provider
+from ..calculations.series import (
+    DEFAULT_ACCURACY,
+    DISPLAY_TERMS,
+    evaluate_grid,
+    evaluate_point,
+    required_terms,
+    required_terms_point
+)
+from ..calculations.inverse import crossing_times
+from ..calculations.lumped import lumped_point
+from ..calculations.records import ClosedFormRecord, ConvectionRecord
+from ..calculations.semi_infinite import (
+    SHORT_TIME_GEOMETRIES,
+    semi_infinite_heat,
+    semi_infinite_point,
+    semi_infinite_theta,
+    short_time_error,
+    short_time_limit
+)
+from ..calculations.batch_calculations import GEOMETRIES, BatchArrays, evaluate_batch
+from .calculation_pool import calculation_pool, PoolFullError, PoolTimeoutError
+from .metrics import errors_total, stage_seconds
+
+logger = logging.getLogger(__name__)
+
+# Número de Biot por debajo del cual se usa el modelo concentrado (0 lo desactiva)
+LUMPED_BIOT_THRESHOLD = float(os.environ.get("LUMPED_BIOT_THRESHOLD", 0.1))
+
+
+def uses_lumped_model(input_data: ConvectionInput, biot: float) -> bool:
+    # El modelo concentrado se usa si la entrada lo permite y el número de Biot es pequeño
+    return input_data.allow_lumped and 0 < biot < LUMPED_BIOT_THRESHOLD
+
+
+def uses_short_time_model(geometry: str, dimensionless_time, accuracy):
+    # La solución de sólido semi-infinito se usa en los tiempos cortos en que cumple la precisión
+    # (no está definida en Fo = 0, donde sigue la serie)
+    if geometry not in SHORT_TIME_GEOMETRIES:
+        return np.zeros(np.shape(dimensionless_time), dtype=bool)
+    return (dimensionless_time > 0) & (dimensionless_time <= short_time_limit(accuracy))
+
+
+def compute_convection_record(input_data: ConvectionInput) -> Union[ConvectionRecord, ClosedFormRecord]:
+    """
+    Performs the convection calculation in a single pass and returns a compact record.
+
+    The terms are evaluated with Python floats (evaluate_point) and kept in the record without
+    copying them into Pydantic models; ConvectionRecord.to_json writes the response directly.
+    No lambda value is calculated when a closed form meets the accuracy: at short times, for the
+    plate and the sphere, the semi-infinite solid solution; and when the Biot number is below
+    LUMPED_BIOT_THRESHOLD and the input allows it, the lumped-capacitance model. At large Fourier
+    numbers, when the truncation bound of the first term alone is within the accuracy, only
+    lambda_1 is calculated (one-term mode).
+
+    Parameters:
+        input_data (ConvectionInput): The input data for the calculation.
+
+    Returns:
+        ConvectionRecord or ClosedFormRecord: The result of the calculation.
+    """
+    geometry = input_data.geometry.lower()
+    # Etiqueta de las métricas (las geometrías desconocidas se agrupan)
+    label = geometry if geometry in GEOMETRIES else "unknown"
 
-def perform_convection_calculation(input_data: ConvectionInput) -> DataResult:
     # Convertir ConvectionInput a InitialCalcsData
+    with stage_seconds.time(stage="input", geometry=label):
+        data = InitialCalcsData(
+            thickness=input_data.thickness,
+            thermal_diffusivity=input_data.thermal_diffusivity,
+            conductivity_coefficient=input_data.conductivity_coefficient,
+            convection_coefficient=input_data.convection_coefficient,
+            initial_temperature=input_data.initial_temperature,
+            ambient_temperature=input_data.ambient_temperature,
+            density=input_data.density,
+            specific_heat=input_data.specific_heat,
+            distance=input_data.distance,
+            time=input_data.time,
+            iterations=input_data.iterations,
+            biot=input_data.biot,
+            geometry=geometry,
+            absolute_tolerance=input_data.absolute_tolerance,
+            relative_tolerance=input_data.relative_tolerance,
+            accuracy=input_data.accuracy
+        )
+
+    with stage_seconds.time(stage="biot_alpha", geometry=label):
+        # Calcular la difusividad térmica antes del tiempo adimensional, que depende de ella
+        if data.thermal_diffusivity is None or data.thermal_diffusivity == 0:
+            data.thermal_diffusivity = calc_alpha(data)
+
+        # Crear instancia de InitialCalcs
+        initial_parameters = InitialCalcs(data)
+
+        # Calcular q_max
+        if data.geometry in ["sphere", "cylinder", "plate"]:
+            calcs = initial_parameters  # Ya creado
+            qmax = calc_qmax(calcs, data.geometry)
+        else:
+            raise ValueError("Error: geometría incorrecta")
+
+        # Calcular número de Biot si no se proporciona
+        if calcs.biot is None or calcs.biot == 0:
+            biot = calc_biot(calcs)
+            calcs.biot = biot
+        else:
+            biot = calcs.biot
+
+    accuracy = DEFAULT_ACCURACY if data.accuracy is None else data.accuracy
+    if uses_short_time_model(data.geometry, calcs.dimensionless_time, accuracy):
+        with stage_seconds.time(stage="semi_infinite", geometry=label):
+            solution = semi_infinite_point(data.geometry, biot, calcs.dimensionless_time,
+                                           calcs.dimensionless_distance)
+            convection_results = ConvectionResults(solution, calcs, qmax)
+        logger.debug("Sólido semi-infinito %s (Bi=%s, Fo=%s): theta=%s", data.geometry, biot,
+                     calcs.dimensionless_time, solution.value_theta)
+        return ClosedFormRecord(calcs=calcs, q_max=qmax, model="semi_infinite", solution=solution,
+                                tem=convection_results.tem, q=convection_results.q)
+
+    if uses_lumped_model(input_data, biot):
+        with stage_seconds.time(stage="lumped", geometry=label):
+            solution = lumped_point(data.geometry, biot, calcs.dimensionless_time,
+                                    calcs.dimensionless_distance)
+            convection_results = ConvectionResults(solution, calcs, qmax)
+        logger.debug("Modelo concentrado %s (Bi=%s): theta=%s error=%s", data.geometry, biot,
+                     solution.value_theta, solution.model_error)
+        return ClosedFormRecord(calcs=calcs, q_max=qmax, model="lumped", solution=solution,
+                                tem=convection_results.tem, q=convection_results.q)
+
+    with stage_seconds.time(stage="eigenvalues", geometry=label):
+        # Número de términos de la serie según la precisión pedida: si el primero basta, solo se
+        # calcula lambda_1 (modo de un término); si no, al menos los que se muestran
+        terms = required_terms_point(calcs.dimensionless_time, accuracy)
+        if terms > 1:
+            terms = max(terms, DISPLAY_TERMS)
+
+        # Calcular todos los valores lambda necesarios
+        try:
+            lamb = eigenvalue_provider.get(data.geometry, biot, data.iterations,
+                                           data.absolute_tolerance, data.relative_tolerance, terms)
+        except Exception as e:
+            raise ValueError(f"Error calculando lambda: {e}")
+    logger.debug("Lambdas %s (Bi=%s): %s", data.geometry, biot, lamb.roots)
+
+    # Evaluar todos los términos de la serie y sus sumas en una sola pasada
+    with stage_seconds.time(stage="terms", geometry=label):
+        series = evaluate_point(data.geometry, lamb.roots, calcs.dimensionless_time,
+                                calcs.dimensionless_distance)
+
+    with stage_seconds.time(stage="summation", geometry=label):
+        convection_results = ConvectionResults(series, calcs, qmax)
+    logger.debug("Sumatorias %s: theta=%s q=%s", data.geometry, series.summation_theta,
+                 series.summation_q)
+
+    return ConvectionRecord(
+        calcs=calcs,
+        q_max=qmax,
+        lambdas=lamb.roots,
+        iterations=lamb.iterations,
+        residuals=lamb.residuals,
+        terms=series,
+        tem=convection_results.tem,
+        q=convection_results.q,
+    )
+
+
+def perform_convection_calculation(input_data: ConvectionInput) -> DataResult:
+    # Mismo cálculo que compute_convection_record, como modelo de Pydantic
+    record = compute_convection_record(input_data)
+    with stage_seconds.time(stage="response", geometry=record.calcs.geometry):
+        return DataResult.model_validate(record.to_dict())
+
+
+def _canonical_float(value):
+    # -0.0 y 0.0 (o 1 y 1.0) son la misma entrada
+    return None if value is None else float(value) + 0.0
+
+
+def canonical_convection_key(input_data: ConvectionInput):
+    """
+    Builds a key that is equal for every input giving the same DataResult.
+
+    The geometry is lowercased, numbers are normalized to floats, and an omitted (None or 0)
+    thermal diffusivity or Biot number is replaced by the value the calculation would derive,
+    so requests that omit them share the entry of requests that give them explicitly.
+
+    Parameters:
+        input_data (ConvectionInput): The input data for the calculation.
+
+    Returns:
+        tuple: The canonical key, or None when the input cannot be calculated (the calculation
+            itself then reports the error).
+    """
     data = InitialCalcsData(
         thickness=input_data.thickness,
         thermal_diffusivity=input_data.thermal_diffusivity,
@@ -36,102 +226,621 @@ def perform_convection_calculation(input_data: ConvectionInput) -> DataResult:
         time=input_data.time,
         iterations=input_data.iterations,
         biot=input_data.biot,
-        geometry=input_data.geometry.lower()
+        geometry=input_data.geometry.lower(),
+        absolute_tolerance=input_data.absolute_tolerance,
+        relative_tolerance=input_data.relative_tolerance,
+        accuracy=input_data.accuracy
     )
+    if data.geometry not in GEOMETRIES:
+        return None
+    try:
+        if data.thermal_diffusivity is None or data.thermal_diffusivity == 0:
+            data.thermal_diffusivity = calc_alpha(data)
+        if data.biot is None or data.biot == 0:
+            data.biot = calc_biot(InitialCalcs(data))
+    except (ArithmeticError, ValueError):
+        return None
+
+    return (
+        data.geometry,
+        *(_canonical_float(value) for value in (
+            data.thickness, data.thermal_diffusivity, data.conductivity_coefficient,
+            data.convection_coefficient, data.initial_temperature, data.ambient_temperature,
+            data.density, data.specific_heat, data.distance, data.time, data.biot,
+            data.absolute_tolerance, data.relative_tolerance, data.accuracy)),
+        int(data.iterations),
+        # Con Biot pequeño, permitir o no el modelo concentrado cambia el resultado
+        uses_lumped_model(input_data, data.biot),
+    )
+
+
+def _batch_arrays(rows: List[ConvectionInput]) -> BatchArrays:
+    # Convertir las filas a columnas de NumPy (None se representa como NaN)
+    def column(name):
+        return np.array([getattr(row, name) for row in rows], dtype=float)
+
+    def optional_column(name):
+        return np.array([np.nan if getattr(row, name) is None else getattr(row, name) for row in rows],
+                        dtype=float)
+
+    return BatchArrays(
+        thickness=column("thickness"),
+        thermal_diffusivity=optional_column("thermal_diffusivity"),
+        conductivity_coefficient=column("conductivity_coefficient"),
+        convection_coefficient=column("convection_coefficient"),
+        initial_temperature=column("initial_temperature"),
+        ambient_temperature=column("ambient_temperature"),
+        density=column("density"),
+        specific_heat=column("specific_heat"),
+        distance=column("distance"),
+        time=column("time"),
+        iterations=np.array([row.iterations for row in rows], dtype=np.int64),
+        biot=optional_column("biot"),
+        absolute_tolerance=optional_column("absolute_tolerance"),
+        relative_tolerance=optional_column("relative_tolerance"),
+        accuracy=optional_column("accuracy"),
+    )
+
+
+def perform_batch_convection_calculation(input_data: List[ConvectionInput]) -> List[dict]:
+    """
+    Performs the convection calculation for many rows at once.
+
+    Rows are grouped by geometry and every group is evaluated as NumPy arrays in a single pass.
+    The result has one entry per input row, in the same order, following the BatchRowResult schema:
+    'data' holds the same fields as DataResult, or 'error' describes why the row failed. As in
+    the scalar calculation, rows at short times of the plate and the sphere are solved with the
+    semi-infinite solid ('model' is 'semi_infinite') and rows whose first term meets the accuracy
+    sum only that term ('one_term'); the lumped model is not used.
+
+    Parameters:
+        input_data (List[ConvectionInput]): The rows to calculate.
+
+    Returns:
+        List[dict]: One JSON-ready BatchRowResult dictionary per input row.
+    """
+    results: List[dict] = [None] * len(input_data)
+    geometries = [row.geometry.lower() for row in input_data]
+
+    for index, geometry in enumerate(geometries):
+        if geometry not in GEOMETRIES:
+            results[index] = {"index": index, "data": None, "error": "Error: geometría incorrecta"}
+
+    for geometry in GEOMETRIES:
+        indices = [index for index, value in enumerate(geometries) if value == geometry]
+        if not indices:
+            continue
+
+        rows = [input_data[index] for index in indices]
+        with stage_seconds.time(stage="batch_input", geometry=geometry):
+            arrays = _batch_arrays(rows)
+        with stage_seconds.time(stage="batch_evaluation", geometry=geometry):
+            output = evaluate_batch(arrays, geometry)
+        logger.debug("Lote %s: %d filas, hasta %d términos", geometry, len(rows),
+                     output.terms.max())
+        start = time.perf_counter()
+
+        # Convertir las columnas a listas de floats de Python de una sola vez
+        short = output.model == "semi_infinite"
+        valid = (np.isfinite(output.tem) & np.isfinite(output.q) &
+                 (short | np.isfinite(output.lambdas[:, 0]))).tolist()
+        short = short.tolist()
+        thermal_diffusivity = output.thermal_diffusivity.tolist()
+        biot = output.biot.tolist()
+        q_max = output.q_max.tolist()
+        lambdas = output.lambdas.tolist()
+        iterations = output.iterations.tolist()
+        residuals = output.residuals.tolist()
+        value_a = output.value_a.tolist()
+        value_theta_o = output.value_theta_o.tolist()
+        value_theta = output.value_theta.tolist()
+        value_q = output.value_q.tolist()
+        summation_a = output.summation_a.tolist()
+        summation_theta_o = output.summation_theta_o.tolist()
+        summation_theta = output.summation_theta.tolist()
+        summation_q = output.summation_q.tolist()
+        terms = output.terms.tolist()
+        tem = output.tem.tolist()
+        q = output.q.tolist()
+        truncation_error = np.where(np.isfinite(output.truncation_error), output.truncation_error,
+                                    None).tolist()
+        model_error = output.model_error.tolist()
+
+        columns = zip(indices, rows, valid, thermal_diffusivity, biot, q_max, lambdas, iterations,
+                      residuals, value_a, value_theta_o, value_theta, value_q, summation_a,
+                      summation_theta_o, summation_theta, summation_q, tem, q, truncation_error,
+                      terms, short, model_error)
+        for (index, row, row_valid, row_alpha, row_biot, row_q_max, row_lambdas, row_iterations,
+             row_residuals, row_a, row_theta_o, row_theta, row_q, row_summation_a,
+             row_summation_theta_o, row_summation_theta, row_summation_q, row_tem,
+             row_result_q, row_truncation_error, row_terms, row_short, row_model_error) in columns:
+            if not row_valid:
+                results[index] = {"index": index, "data": None,
+                                  "error": "Error: valores no válidos para el cálculo"}
+                continue
+
+            # Los campos de entrada se copian tal cual y se completan con los calculados (el lote
+            # no usa el modelo concentrado)
+            data = dict(vars(row))
+            del data["allow_lumped"]
+            data.update(
+                thermal_diffusivity=row_alpha,
+                biot=row_biot,
+                geometry=geometry,
+                q_max=row_q_max,
+            )
+            if row_short:
+                # Tiempos cortos: sin términos ni valores lambda, como ClosedFormRecord
+                data.update(
+                    calc1=None, calc2=None, calc3=None, lamb=None, value_a=None,
+                    value_theta_o=row_summation_theta_o,
+                    value_theta=row_summation_theta,
+                    value_q=row_summation_q,
+                    tem=row_tem,
+                    q=row_result_q,
+                    terms=None,
+                    truncation_error=None,
+                    model="semi_infinite",
+                    model_error=row_model_error,
+                )
+                results[index] = {"index": index, "data": data, "error": None}
+                continue
+            # En el modo de un término, calc2, calc3, lambda2 y lambda3 quedan en null, como en
+            # ConvectionRecord
+            calc1, calc2, calc3 = (
+                {"value_a": row_a[term], "value_theta_o": row_theta_o[term],
+                 "value_theta": row_theta[term], "value_q": row_q[term]}
+                if term < row_terms else None
+                for term in range(DISPLAY_TERMS)
+            )
+            lambda1, lambda2, lambda3 = (row_lambdas[term] if term < row_terms else None
+                                         for term in range(DISPLAY_TERMS))
+            data.update(
+                calc1=calc1,
+                calc2=calc2,
+                calc3=calc3,
+                lamb={"lambda1": lambda1, "lambda2": lambda2, "lambda3": lambda3,
+                      "iterations": row_iterations[:row_terms],
+                      "residuals": row_residuals[:row_terms]},
+                value_a=row_summation_a,
+                value_theta_o=row_summation_theta_o,
+                value_theta=row_summation_theta,
+                value_q=row_summation_q,
+                tem=row_tem,
+                q=row_result_q,
+                terms=row_terms,
+                truncation_error=row_truncation_error,
+                model="one_term" if row_terms == 1 else "series",
+                model_error=None,
+            )
+            results[index] = {"index": index, "data": data, "error": None}
+        stage_seconds.observe(time.perf_counter() - start, stage="batch_response", geometry=geometry)
+
+    return results
+
+
+# Máximo de puntos (tiempos x distancias) de un campo de temperaturas
+MAX_FIELD_POINTS = 4_000_000
+
+
+def evaluate_grid_models(geometry: str, biot: float, lambdas: np.ndarray,
+                         dimensionless_time: np.ndarray, dimensionless_distance: np.ndarray,
+                         accuracy: float):
+    """
+    Evaluates a 1-D solution on every combination of times and distances, choosing the model of
+    each time.
+
+    Times at which the semi-infinite solid solution meets the accuracy (uses_short_time_model) use
+    it, and the rest use the series through evaluate_grid, so short times never need the terms
+    that the series would.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        biot (float): Biot number.
+        lambdas (np.ndarray): Lambda values of the series.
+        dimensionless_time (np.ndarray): Fourier numbers, shape (times,).
+        dimensionless_distance (np.ndarray): Dimensionless distances, shape (distances,).
+        accuracy (float): Maximum error of the temperature and heat ratios.
+
+    Returns:
+        tuple: theta of shape (times, distances), Q / Qmax and the error bound of shape (times,),
+            and whether each time used the short-time solution.
+    """
+    short = uses_short_time_model(geometry, dimensionless_time, accuracy)
+    theta = np.empty((dimensionless_time.size, dimensionless_distance.size))
+    heat_ratio = np.empty(dimensionless_time.size)
+    truncation_error = np.empty(dimensionless_time.size)
+    if short.any():
+        short_time = dimensionless_time[short]
+        theta[short] = semi_infinite_theta(geometry, biot, short_time[:, None],
+                                           dimensionless_distance)
+        heat_ratio[short] = semi_infinite_heat(geometry, biot, short_time)
+        truncation_error[short] = short_time_error(short_time)
+    if not short.all():
+        theta[~short], heat_ratio[~short], truncation_error[~short] = evaluate_grid(
+            geometry, lambdas, dimensionless_time[~short], dimensionless_distance)
+    return theta, heat_ratio, truncation_error, short
+
+
+@dataclass
+class FieldContext:
+    """
+    The part of a temperature field that does not depend on the time.
 
-    # Crear instancia de InitialCalcs
-    initial_parameters = InitialCalcs(data)
+    Attributes:
+        calcs (InitialCalcs): Initial parameters of the material (distance and time are unused).
+        q_max (float): Maximum heat transfer.
+        biot (float): Biot number used.
+        lambdas (np.ndarray): Lambda values of every term of the series.
+        distances (np.ndarray): Distances of the grid.
+        dimensionless_distance (np.ndarray): Distances of the grid divided by the characteristic length.
+        accuracy (float): Maximum error of the temperature and heat ratios.
+    """
 
-    # Calcular q_max
-    if data.geometry in ["sphere", "cylinder", "plate"]:
-        calcs = initial_parameters  # Ya creado
-        qmax = calc_qmax(calcs, data.geometry)
-    else:
+    calcs: InitialCalcs
+    q_max: float
+    biot: float
+    lambdas: np.ndarray
+    distances: np.ndarray
+    dimensionless_distance: np.ndarray
+    accuracy: float = DEFAULT_ACCURACY
+
+    def header(self) -> dict:
+        return {
+            "geometry": self.calcs.geometry,
+            "thermal_diffusivity": float(self.calcs.thermal_diffusivity),
+            "biot": float(self.biot),
+            "q_max": float(self.q_max),
+            "lambdas": self.lambdas.tolist(),
+            "terms": int(self.lambdas.size),
+            "distances": self.distances.tolist(),
+        }
+
+    def evaluate(self, times: np.ndarray) -> dict:
+        # Evaluar todas las distancias para un bloque de tiempos
+        dimensionless_time = times * self.calcs.thermal_diffusivity / \
+            self.calcs.characteristic_length ** 2
+        theta, heat_ratio, truncation_error, short = evaluate_grid_models(
+            self.calcs.geometry, self.biot, self.lambdas, dimensionless_time,
+            self.dimensionless_distance, self.accuracy)
+        temperature = theta * (self.calcs.initial_temperature - self.calcs.ambient_temperature) + \
+            self.calcs.ambient_temperature
+        return {
+            "times": times.tolist(),
+            "temperature": temperature.tolist(),
+            "heat_ratio": heat_ratio.tolist(),
+            "q": (heat_ratio * self.q_max).tolist(),
+            "truncation_error": np.where(np.isfinite(truncation_error), truncation_error,
+                                         None).tolist(),
+            "model": np.where(short, "semi_infinite", "series").tolist(),
+        }
+
+
+def check_grid(values: Optional[List[float]], grid_range: Optional[GridRange], name: str):
+    # Los puntos se dan como lista o como rango, pero no de ambas formas
+    if (values is None) == (grid_range is None):
+        raise ValueError(f"Error: indique {name} como lista o como rango")
+    if grid_range is not None:
+        if grid_range.points < 1:
+            raise ValueError(f"Error: el rango de {name} necesita al menos un punto")
+        values = [grid_range.start, grid_range.stop]
+    if len(values) == 0 or not np.isfinite(np.array(values, dtype=float)).all():
+        raise ValueError(f"Error: valores no válidos en {name}")
+    if min(values) < 0:
+        raise ValueError(f"Error: los valores de {name} no pueden ser negativos")
+
+
+def grid_values(values: Optional[List[float]], grid_range: Optional[GridRange]) -> np.ndarray:
+    # Los puntos de una lista o de un rango (ya comprobados con check_grid)
+    if grid_range is None:
+        return np.array(values, dtype=float)
+    if grid_range.points > MAX_FIELD_POINTS:
+        raise ValueError("Error: demasiados puntos en el campo de temperaturas")
+    return np.linspace(grid_range.start, grid_range.stop, grid_range.points)
+
+
+def _grid_chunks(values: Optional[List[float]], grid_range: Optional[GridRange], chunk_size: int):
+    # Los rangos se generan bloque a bloque, sin crear nunca el arreglo completo
+    if grid_range is None:
+        values = np.array(values, dtype=float)
+        for first in range(0, values.size, chunk_size):
+            yield values[first:first + chunk_size]
+        return
+
+    points = grid_range.points
+    step = (grid_range.stop - grid_range.start) / (points - 1) if points > 1 else 0.0
+    for first in range(0, points, chunk_size):
+        index = np.arange(first, min(first + chunk_size, points))
+        chunk = grid_range.start + step * index
+        # Igual que np.linspace, el último punto es exactamente stop
+        chunk[index == points - 1] = grid_range.stop if points > 1 else grid_range.start
+        yield chunk
+
+
+def smallest_grid_time(values: Optional[List[float]],
+                       grid_range: Optional[GridRange]) -> Optional[float]:
+    # Menor tiempo distinto de cero de la malla (None si todos son cero)
+    if grid_range is None:
+        values = np.array(values, dtype=float)
+        started = values[values > 0]
+        return float(started.min()) if started.size else None
+    if grid_range.points == 1:
+        return grid_range.start if grid_range.start > 0 else None
+    if grid_range.start > 0 and grid_range.stop > 0:
+        return min(grid_range.start, grid_range.stop)
+    # Un extremo es cero: el menor tiempo positivo es el paso
+    step = abs(grid_range.stop - grid_range.start) / (grid_range.points - 1)
+    return step if step > 0 else None
+
+
+def _material_parameters(input_data, geometry: str, distance: float = 0.0):
+    # Parámetros del material de los cálculos sin un tiempo fijo (campos y tiempos de cruce):
+    # InitialCalcs con la difusividad y el número de Biot resueltos, y q_max
+    data = InitialCalcsData(
+        thickness=input_data.thickness,
+        thermal_diffusivity=input_data.thermal_diffusivity,
+        conductivity_coefficient=input_data.conductivity_coefficient,
+        convection_coefficient=input_data.convection_coefficient,
+        initial_temperature=input_data.initial_temperature,
+        ambient_temperature=input_data.ambient_temperature,
+        density=input_data.density,
+        specific_heat=input_data.specific_heat,
+        distance=distance,
+        time=0.0,
+        iterations=input_data.iterations,
+        biot=input_data.biot,
+        geometry=geometry,
+        absolute_tolerance=input_data.absolute_tolerance,
+        relative_tolerance=input_data.relative_tolerance,
+        accuracy=input_data.accuracy
+    )
+    if data.thermal_diffusivity is None or data.thermal_diffusivity == 0:
+        data.thermal_diffusivity = calc_alpha(data)
+    calcs = InitialCalcs(data)
+    qmax = calc_qmax(calcs, geometry)
+    biot = calc_biot(calcs) if calcs.biot is None or calcs.biot == 0 else calcs.biot
+    return calcs, qmax, biot
+
+
+def _prepare_field(input_data: FieldInput, distances: np.ndarray,
+                   smallest_time: Optional[float]) -> FieldContext:
+    geometry = input_data.geometry.lower()
+    if geometry not in GEOMETRIES:
+        raise ValueError("Error: geometría incorrecta")
+
+    # Reutilizar InitialCalcs para los parámetros que no dependen del punto
+    calcs, qmax, biot = _material_parameters(input_data, geometry)
+
+    # El tiempo más corto distinto de cero es el que más términos necesita; los tiempos cortos
+    # que resuelve la solución de sólido semi-infinito no usan la serie
+    accuracy = DEFAULT_ACCURACY if calcs.accuracy is None else calcs.accuracy
+    terms = DISPLAY_TERMS
+    if smallest_time is not None:
+        dimensionless_time = smallest_time * calcs.thermal_diffusivity / calcs.characteristic_length ** 2
+        if geometry in SHORT_TIME_GEOMETRIES:
+            dimensionless_time = max(dimensionless_time, short_time_limit(accuracy))
+        terms = max(int(required_terms(dimensionless_time, accuracy)), DISPLAY_TERMS)
+
+    try:
+        lamb = eigenvalue_provider.get(geometry, biot, calcs.iterations, calcs.absolute_tolerance,
+                                       calcs.relative_tolerance, terms)
+    except Exception as e:
+        raise ValueError(f"Error calculando lambda: {e}")
+    lambdas = np.array(lamb.roots)
+    if not np.isfinite(lambdas).all():
+        raise ValueError("Error: valores no válidos para el cálculo")
+
+    return FieldContext(
+        calcs=calcs,
+        q_max=qmax,
+        biot=biot,
+        lambdas=lambdas,
+        distances=distances,
+        dimensionless_distance=distances / calcs.characteristic_length,
+        accuracy=accuracy,
+    )
+
+
+def perform_field_calculation(input_data: FieldInput) -> dict:
+    """
+    Evaluates the temperature on a whole grid of distances and times in one call.
+
+    The eigenvalues are solved once for the material and geometry, and the series is evaluated on
+    every (time, distance) pair at once with evaluate_grid. The number of terms is chosen for the
+    smallest nonzero time of the grid, so every point meets the requested accuracy.
+
+    Parameters:
+        input_data (FieldInput): The material, the geometry and the grid.
+
+    Returns:
+        dict: JSON-ready dictionary following the FieldResult schema.
+    """
+    check_grid(input_data.distances, input_data.distance_range, "distancias")
+    check_grid(input_data.times, input_data.time_range, "tiempos")
+    distances = grid_values(input_data.distances, input_data.distance_range)
+    times = grid_values(input_data.times, input_data.time_range)
+    if distances.size * times.size > MAX_FIELD_POINTS:
+        raise ValueError("Error: demasiados puntos en el campo de temperaturas")
+
+    smallest_time = smallest_grid_time(input_data.times, input_data.time_range)
+    context = _prepare_field(input_data, distances, smallest_time)
+    return {**context.header(), **context.evaluate(times)}
+
+
+def encode_event(stream_format: str, event: str, payload: dict) -> str:
+    # SSE lleva el nombre del evento aparte; en NDJSON va dentro de cada línea. El serializador
+    # de pydantic_core es varias veces más rápido que json.dumps con bloques grandes; infinitos y
+    # NaN se escriben como null
+    if stream_format == "sse":
+        content = pydantic_core.to_json(payload, inf_nan_mode="null").decode()
+        return f"event: {event}\ndata: {content}\n\n"
+    content = pydantic_core.to_json({"event": event, "data": payload}, inf_nan_mode="null")
+    return content.decode() + "\n"
+
+
+def encode_field_chunk(context: FieldContext, times: np.ndarray, stream_format: str) -> str:
+    # Se ejecuta en el pool de cálculo: evaluar y codificar un bloque de tiempos
+    return encode_event(stream_format, "chunk", context.evaluate(times))
+
+
+async def _field_events(context: FieldContext, input_data: FieldInput, stream_format: str,
+                        chunk_size: int) -> AsyncIterator[str]:
+    yield encode_event(stream_format, "header", context.header())
+    try:
+        for times in _grid_chunks(input_data.times, input_data.time_range, chunk_size):
+            yield await calculation_pool.run(encode_field_chunk, context, times, stream_format)
+    except PoolFullError:
+        errors_total.inc(endpoint="field/stream", error="pool_full")
+        yield encode_event(stream_format, "error",
+                           {"detail": "Error: servidor ocupado, intente más tarde"})
+        return
+    except PoolTimeoutError:
+        errors_total.inc(endpoint="field/stream", error="timeout")
+        yield encode_event(stream_format, "error",
+                           {"detail": "Error: el cálculo superó el tiempo máximo"})
+        return
+    except Exception as e:
+        # La respuesta ya empezó: el error se informa como un evento más
+        logger.exception("Error en el campo de temperaturas por streaming")
+        errors_total.inc(endpoint="field/stream", error=type(e).__name__)
+        yield encode_event(stream_format, "error", {"detail": "An unexpected error occurred."})
+        return
+    yield encode_event(stream_format, "end", {})
+
+
+def prepare_field_stream(input_data: FieldInput, stream_format: str = "ndjson",
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> FieldContext:
+    """
+    Validates a streamed temperature field and solves its eigenvalues, before anything is sent.
+
+    Parameters:
+        input_data (FieldInput): The material, the geometry and the grid.
+        stream_format (str): 'ndjson' (one JSON object per line) or 'sse' (Server-Sent Events).
+        chunk_size (int): Number of times per chunk.
+
+    Returns:
+        FieldContext: The part of the field that does not depend on the time.
+    """
+    if stream_format not in STREAM_MEDIA_TYPES:
+        raise ValueError("Error: formato de streaming incorrecto")
+    if chunk_size < 1:
+        raise ValueError("Error: el tamaño de bloque debe ser al menos 1")
+    check_grid(input_data.distances, input_data.distance_range, "distancias")
+    check_grid(input_data.times, input_data.time_range, "tiempos")
+    distances = grid_values(input_data.distances, input_data.distance_range)
+    if distances.size * chunk_size > MAX_FIELD_POINTS:
+        raise ValueError("Error: demasiados puntos en el campo de temperaturas")
+
+    smallest_time = smallest_grid_time(input_data.times, input_data.time_range)
+    return _prepare_field(input_data, distances, smallest_time)
+
+
+def stream_field_calculation(context: FieldContext, input_data: FieldInput,
+                             stream_format: str = "ndjson",
+                             chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[str]:
+    """
+    Evaluates a temperature field block by block, for streaming responses.
+
+    The context comes from prepare_field_stream, which raises ValueError before the response
+    starts. The returned generator yields a 'header' event (the FieldResult fields that do not
+    depend on the time), one 'chunk' event per chunk_size times (times, temperature, heat_ratio,
+    q and truncation_error) and a final 'end' event. Each chunk is evaluated and encoded in the
+    calculation pool, one at a time; a full pool or a timeout ends the stream with an 'error'
+    event. Time ranges are generated chunk by chunk, so memory stays constant whatever the number
+    of times.
+
+    Parameters:
+        context (FieldContext): The prepared field.
+        input_data (FieldInput): The material, the geometry and the grid.
+        stream_format (str): 'ndjson' (one JSON object per line) or 'sse' (Server-Sent Events).
+        chunk_size (int): Number of times per chunk.
+
+    Returns:
+        AsyncIterator[str]: The encoded events.
+    """
+    return _field_events(context, input_data, stream_format, chunk_size)
+
+
+def perform_time_to_temperature(input_data: TimeToTemperatureInput) -> dict:
+    """
+    Finds the times at which the temperature at a distance from the center reaches each target.
+
+    Replaces bisecting on the time with repeated calculations: the eigenvalues and the
+    coefficients of the series at the distance are computed once, and the Fourier number of each
+    target is found with Newton steps on the analytic series and its time derivative. For the
+    plate and the sphere, targets reached at short times are found on the semi-infinite solid
+    solution instead, as /convection/calculate evaluates them.
+
+    Parameters:
+        input_data (TimeToTemperatureInput): The material, the geometry, the distance and one
+            target temperature or a list of them.
+
+    Returns:
+        dict: The fields of TimeToTemperatureResult, with one crossing per target in the order
+            given. Targets that are not reached carry an error instead of a time.
+    """
+    geometry = input_data.geometry.lower()
+    if geometry not in GEOMETRIES:
         raise ValueError("Error: geometría incorrecta")
-    
-    # Calcular número de Biot si no se proporciona
-    if calcs.biot is None or calcs.biot == 0:
-        biot = calc_biot(calcs)
-        calcs.biot = biot
-    else:
-        biot = calcs.biot
-
-    # Calcular la difusividad térmica
-    if calcs.thermal_diffusivity is None or calcs.thermal_diffusivity == 0:
-        calcs.thermal_diffusivity = calc_alpha(calcs)
-
-    # Calcular valores de lambda y realizar cálculos según la geometría
-    if data.geometry == "plate":
-        lamb = LambdaPlate(biot, data.iterations)
-        calc1 = Plate(calcs, lamb.lambda1)
-        calc2 = Plate(calcs, lamb.lambda2)
-        calc3 = Plate(calcs, lamb.lambda3)
-    elif data.geometry == "cylinder":
-        lamb = LambdaCylinder(biot, data.iterations)
-        calc1 = Cylinder(calcs, lamb.lambda1)
-        calc2 = Cylinder(calcs, lamb.lambda2)
-        calc3 = Cylinder(calcs, lamb.lambda3)
-    elif data.geometry == "sphere":
+    targets = np.atleast_1d(np.array(input_data.target_temperature, dtype=float))
+    if targets.size == 0 or not np.isfinite(targets).all():
+        raise ValueError("Error: valores no válidos en la temperatura objetivo")
+    if not np.isfinite(input_data.distance) or input_data.distance < 0:
+        raise ValueError("Error: la distancia no puede ser negativa")
+
+    calcs, _, biot = _material_parameters(input_data, geometry, input_data.distance)
+    difference = calcs.initial_temperature - calcs.ambient_temperature
+    if difference == 0:
+        raise ValueError("Error: la temperatura inicial y la ambiente son iguales")
+    theta = (targets - calcs.ambient_temperature) / difference
+    accuracy = DEFAULT_ACCURACY if calcs.accuracy is None else calcs.accuracy
+
+    def roots(count):
         try:
-            lamb = LambdaSphere(biot, data.iterations)
-            calc1 = Sphere(calcs, lamb.lambda1)
-            calc2 = Sphere(calcs, lamb.lambda2)
-            calc3 = Sphere(calcs, lamb.lambda3)
+            lamb = eigenvalue_provider.get(geometry, biot, calcs.iterations,
+                                           calcs.absolute_tolerance, calcs.relative_tolerance,
+                                           count)
         except Exception as e:
             raise ValueError(f"Error calculando lambda: {e}")
-    else:
-        raise ValueError("Error: geometría incorrecta")
-    
-    # Calcular sumatorias
-    summation = SumTable(calc1, calc2, calc3)
-    convection_results = ConvectionResults(summation, calcs, qmax)
-    output_data = FinalValues(calcs, qmax, calc1, calc2, calc3, lamb, summation, convection_results)
-    
-    # Construir DataResult
-    data_result = DataResult(
-        thickness=output_data.thickness,
-        thermal_diffusivity=output_data.thermal_diffusivity,
-        conductivity_coefficient=output_data.conductivity_coefficient,
-        convection_coefficient=output_data.convection_coefficient,
-        initial_temperature=output_data.initial_temperature,
-        ambient_temperature=output_data.ambient_temperature,
-        density=output_data.density,
-        specific_heat=output_data.specific_heat,
-        distance=output_data.distance,
-        time=output_data.time,
-        iterations=output_data.iterations,
-        biot=output_data.biot,
-        geometry=output_data.geometry,
-        q_max=output_data.q_max,
-        calc1=CalculationResult(
-            value_a=output_data.calc1.value_a,
-            value_theta_o=output_data.calc1.value_theta_o,
-            value_theta=output_data.calc1.value_theta,
-            value_q=output_data.calc1.value_q,
-        ),
-        calc2=CalculationResult(
-            value_a=output_data.calc2.value_a,
-            value_theta_o=output_data.calc2.value_theta_o,
-            value_theta=output_data.calc2.value_theta,
-            value_q=output_data.calc2.value_q,
-        ),
-        calc3=CalculationResult(
-            value_a=output_data.calc3.value_a,
-            value_theta_o=output_data.calc3.value_theta_o,
-            value_theta=output_data.calc3.value_theta,
-            value_q=output_data.calc3.value_q,
-        ),
-        lamb=LambdaValues(
-            lambda1=output_data.lambda_val.lambda1,
-            lambda2=output_data.lambda_val.lambda2,
-            lambda3=output_data.lambda_val.lambda3,
-        ),
-        value_a=output_data.value_a,
-        value_theta_o=output_data.value_theta_o,
-        value_theta=output_data.value_theta,
-        value_q=output_data.value_q,
-        tem=output_data.tem,
-        q=output_data.q
-    )
+        lambdas = np.array(lamb.roots)
+        if not np.isfinite(lambdas).all():
+            raise ValueError("Error: valores no válidos para el cálculo")
+        return lambdas
+
+    with stage_seconds.time(stage="crossing_times", geometry=geometry):
+        result = crossing_times(geometry, roots, theta, calcs.dimensionless_distance, accuracy,
+                                biot=biot)
+
+    # Fo = alpha * t / Lc^2
+    time_scale = calcs.characteristic_length ** 2 / calcs.thermal_diffusivity
+    crossings = []
+    for target, ratio, fourier, iterations, residual, model, model_error in zip(
+            targets.tolist(), theta.tolist(), result.dimensionless_time.tolist(),
+            result.iterations.tolist(), result.residual.tolist(), result.model.tolist(),
+            result.model_error.tolist()):
+        crossing = {"target_temperature": target, "theta": ratio, "time": None, "fourier": None,
+                    "iterations": iterations, "residual": None, "model": model,
+                    "model_error": None, "error": None}
+        if math.isfinite(fourier):
+            crossing.update(time=fourier * time_scale, fourier=fourier, residual=residual)
+            if model == "semi_infinite":
+                crossing["model_error"] = model_error
+        elif 0 < ratio < 1:
+            # Tan cerca de la temperatura inicial que se alcanza antes del tiempo que la serie resuelve
+            crossing["error"] = "Error: la temperatura objetivo se alcanza antes del tiempo mínimo " \
+                                f"que resuelve la serie ({result.shortest_time * time_scale:g} s)"
+        else:
+            crossing["error"] = "Error: la temperatura objetivo no está entre la temperatura " \
+                                "inicial y la ambiente"
+        crossings.append(crossing)
 
-    return data_result
+    return {
+        "geometry": geometry,
+        "thermal_diffusivity": float(calcs.thermal_diffusivity),
+        "biot": float(biot),
+        "distance": float(calcs.distance),
+        "lambdas": result.lambdas.tolist(),
+        "terms": int(result.lambdas.size),
+        "truncation_error": result.truncation_error if math.isfinite(result.truncation_error) else None,
+        "crossings": crossings,
+    }
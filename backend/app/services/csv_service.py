@@ -0,0 +1,317 @@
+# backend/app/services/csv_service.py
+
+import asyncio
+import csv
+import io
+import logging
+import os
+import tempfile
+import time
+import numpy as np
+import pydantic_core
+from collections import deque
+from itertools import islice
+from typing import AsyncIterator, Dict, List, Tuple
+from ..models.convection_models import GEOMETRIES
+from ..calculations.batch_calculations import BatchArrays, evaluate_batch
+from ..calculations.sweep import OPTIONAL_FIELDS
+from .calculation_pool import calculation_pool, PoolFullError, PoolTimeoutError
+from .metrics import errors_total
+
+logger = logging.getLogger(__name__)
+
+# Filas por bloque, tamaño máximo del archivo y bytes que se guardan en memoria antes de pasar
+# el archivo a disco
+DEFAULT_CSV_CHUNK_SIZE = 5000
+MAX_CSV_CHUNK_SIZE = 50000
+MAX_CSV_BYTES = int(os.environ.get("MAX_CSV_BYTES", 1 << 30))
+CSV_SPOOL_BYTES = int(os.environ.get("CSV_SPOOL_BYTES", 8 << 20))
+
+# Columnas de ConvectionInput que el archivo debe tener (las de OPTIONAL_FIELDS pueden faltar o
+# quedar vacías; allow_lumped se ignora, como en los lotes, que siempre suman la serie)
+REQUIRED_COLUMNS = ("geometry", "thickness", "conductivity_coefficient", "convection_coefficient",
+                    "initial_temperature", "ambient_temperature", "density", "specific_heat",
+                    "distance", "time", "iterations")
+OUTPUT_COLUMNS = ("line", "geometry", "model", "terms", "thermal_diffusivity", "biot", "q_max",
+                  "lambda1", "lambda2", "lambda3", "value_theta_o", "value_theta", "value_q", "tem",
+                  "q", "truncation_error", "model_error", "error")
+# Columnas numéricas de la salida, en orden
+_RESULT_COLUMNS = OUTPUT_COLUMNS[4:-1]
+
+
+class UploadTooLargeError(Exception):
+    """
+    Raised when an uploaded file exceeds MAX_CSV_BYTES.
+    """
+
+
+async def spool_upload(chunks: AsyncIterator[bytes]):
+    """
+    Copies a request body into a temporary file, in memory up to CSV_SPOOL_BYTES and on disk
+    beyond, so the upload is never held in memory as a whole.
+
+    Parameters:
+        chunks (AsyncIterator[bytes]): The body, as received.
+
+    Returns:
+        tempfile.SpooledTemporaryFile: The file, positioned at the start.
+    """
+    upload = tempfile.SpooledTemporaryFile(max_size=CSV_SPOOL_BYTES)
+    size = 0
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > MAX_CSV_BYTES:
+                raise UploadTooLargeError(f"Error: el archivo supera {MAX_CSV_BYTES} bytes")
+            upload.write(chunk)
+    except BaseException:
+        upload.close()
+        raise
+    upload.seek(0)
+    return upload
+
+
+def _header_columns(header: List[str]) -> Dict[str, int]:
+    # Posición de cada columna conocida; las desconocidas se ignoran
+    names = [name.strip().lower() for name in header]
+    duplicated = sorted({name for name in names if name and names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f"Error: columnas repetidas en el CSV: {', '.join(duplicated)}")
+    missing = [name for name in REQUIRED_COLUMNS if name not in names]
+    if missing:
+        raise ValueError(f"Error: faltan columnas en el CSV: {', '.join(missing)}")
+    return {name: names.index(name) for name in (*REQUIRED_COLUMNS, *OPTIONAL_FIELDS)
+            if name in names}
+
+
+def _cell(value: str) -> str:
+    # Texto de una celda, entre comillas solo si lo necesita
+    if any(character in value for character in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _parse_column(values: List[str], optional: bool) -> Tuple[np.ndarray, np.ndarray]:
+    # Convertir una columna de texto a floats de una vez; si algún valor falla, se convierte
+    # valor por valor para marcar solo esas filas. Los vacíos son NaN en las columnas opcionales
+    try:
+        if optional:
+            values = [value if value.strip() else "nan" for value in values]
+        column = np.array(values, dtype=float)
+        return column, np.zeros(column.size, dtype=bool)
+    except ValueError:
+        pass
+    column = np.empty(len(values))
+    invalid = np.zeros(len(values), dtype=bool)
+    for index, value in enumerate(values):
+        try:
+            column[index] = float(value) if value.strip() or not optional else np.nan
+        except ValueError:
+            column[index] = np.nan
+            invalid[index] = True
+    return column, invalid
+
+
+def evaluate_csv_chunk(columns: Dict[str, int], lines: List[int], rows: List[List[str]]) -> Tuple[str, int]:
+    """
+    Evaluates a block of CSV rows and encodes the results as CSV.
+
+    Every column is converted to a NumPy array at once and the rows are grouped by geometry and
+    evaluated with evaluate_batch, as in the batch endpoint. Rows that cannot be read or
+    calculated keep their line number and get a message in the 'error' column. Runs in the
+    calculation pool, so the parsing and the encoding also stay out of the event loop.
+
+    Parameters:
+        columns (Dict[str, int]): Position of each known column, from the header.
+        lines (List[int]): Line number of each row in the file.
+        rows (List[List[str]]): The rows, as read by csv.reader.
+
+    Returns:
+        tuple: The CSV text of the block (OUTPUT_COLUMNS, without header) and the number of rows
+            with an error.
+    """
+    count = len(rows)
+    width = max(columns.values()) + 1
+    errors: List[str] = [None] * count
+    for index, row in enumerate(rows):
+        if len(row) < width:
+            errors[index] = f"Error: la fila tiene {len(row)} columnas"
+    short = np.array([error is not None for error in errors], dtype=bool)
+
+    def text(name):
+        position = columns.get(name)
+        if position is None:
+            return [""] * count
+        return [row[position] if position < len(row) else "" for row in rows]
+
+    geometry = np.array([value.strip().lower() for value in text("geometry")])
+    parsed, invalid_names = {}, {}
+    for name in (*REQUIRED_COLUMNS[1:], *OPTIONAL_FIELDS):
+        column, invalid = _parse_column(text(name), name in OPTIONAL_FIELDS)
+        if name == "iterations":
+            invalid |= ~(np.isfinite(column) & (column == np.round(column)))
+        parsed[name] = column
+        invalid_names[name] = invalid & ~short
+    for name, invalid in invalid_names.items():
+        for index in np.flatnonzero(invalid):
+            if errors[index] is None:
+                errors[index] = f"Error: valor no válido en '{name}'"
+    for index in np.flatnonzero(~np.isin(geometry, GEOMETRIES)):
+        if errors[index] is None:
+            errors[index] = "Error: geometría incorrecta"
+
+    ok = np.array([error is None for error in errors], dtype=bool)
+    parsed["iterations"] = np.where(ok, parsed["iterations"], 0).astype(np.int64)
+    arrays = BatchArrays(**parsed)
+
+    results = {name: np.full(count, np.nan) for name in _RESULT_COLUMNS}
+    terms = np.zeros(count, dtype=np.int64)
+    model = np.full(count, "series", dtype=object)
+    for name in GEOMETRIES:
+        mask = ok & (geometry == name)
+        if not mask.any():
+            continue
+        output = evaluate_batch(arrays.subset(mask), name)
+        results["thermal_diffusivity"][mask] = output.thermal_diffusivity
+        results["biot"][mask] = output.biot
+        results["q_max"][mask] = output.q_max
+        for term in range(3):
+            results[f"lambda{term + 1}"][mask] = output.lambdas[:, term]
+        results["value_theta_o"][mask] = output.summation_theta_o
+        results["value_theta"][mask] = output.summation_theta
+        results["value_q"][mask] = output.summation_q
+        results["tem"][mask] = output.tem
+        results["q"][mask] = output.q
+        results["truncation_error"][mask] = output.truncation_error
+        results["model_error"][mask] = output.model_error
+        terms[mask] = output.terms
+        model[mask] = output.model
+
+    failed = ok & ~(np.isfinite(results["tem"]) & np.isfinite(results["q"]))
+    for index in np.flatnonzero(failed):
+        errors[index] = "Error: valores no válidos para el cálculo"
+    # Las filas con error solo conservan la línea, la geometría y el mensaje
+    valid = np.array([error is None for error in errors], dtype=bool)
+    for name, column in results.items():
+        column[~valid] = np.nan
+
+    # Los números se escriben con el serializador de pydantic_core, varias veces más rápido que
+    # csv.writer con floats; los NaN quedan como celdas vacías
+    block = np.column_stack([results[name] for name in _RESULT_COLUMNS])
+    encoded = pydantic_core.to_json(block.tolist(), inf_nan_mode="null").decode()
+    numbers = encoded[2:-2].replace("null", "").split("],[") if count else []
+    output = io.StringIO()
+    for line, name, row_model, row_terms, row_valid, row_numbers, error in zip(
+            lines, geometry.tolist(), model.tolist(), terms.tolist(), valid.tolist(), numbers,
+            errors):
+        # Con la solución de tiempos cortos no hay términos
+        model_cell = row_model if row_valid else ''
+        terms_cell = row_terms if row_valid and row_terms else ''
+        output.write(f"{line},{_cell(name)},{model_cell},{terms_cell},{row_numbers},"
+                     f"{'' if error is None else _cell(error)}\n")
+    return output.getvalue(), int(count - valid.sum())
+
+
+def _read_rows(reader, chunk_size: int) -> Tuple[List[int], List[List[str]]]:
+    # Siguiente bloque de filas no vacías, con su número de línea en el archivo
+    lines, rows = [], []
+    for row in islice(reader, chunk_size):
+        if row and any(value.strip() for value in row):
+            lines.append(reader.line_num)
+            rows.append(row)
+    return lines, rows
+
+
+def _summary_line(rows: int, errors: int, start: float) -> str:
+    seconds = time.perf_counter() - start
+    rate = rows / seconds if seconds > 0 else 0.0
+    return f"# rows={rows} errors={errors} seconds={seconds:.3f} rows_per_second={rate:.0f}\n"
+
+
+async def _csv_lines(upload, reader, columns: Dict[str, int], chunk_size: int) -> AsyncIterator[str]:
+    start = time.perf_counter()
+    total_rows = total_errors = 0
+    yield ",".join(OUTPUT_COLUMNS) + "\n"
+
+    # Tantos bloques en curso como workers: se leen a medida que se calculan y se envían en orden
+    window = max(1, calculation_pool.workers)
+    pending = deque()
+    exhausted = False
+    try:
+        while not exhausted or pending:
+            while not exhausted and len(pending) < window:
+                lines, rows = await asyncio.to_thread(_read_rows, reader, chunk_size)
+                if not rows:
+                    exhausted = True
+                    break
+                total_rows += len(rows)
+                pending.append(asyncio.ensure_future(
+                    calculation_pool.run(evaluate_csv_chunk, columns, lines, rows)))
+            if pending:
+                text, errors = await pending.popleft()
+                total_errors += errors
+                yield text
+    except csv.Error as e:
+        errors_total.inc(endpoint="calculate/csv", error="invalid_input")
+        yield f"# error: Error: CSV no válido en la línea {reader.line_num}: {e}\n"
+        return
+    except UnicodeDecodeError:
+        errors_total.inc(endpoint="calculate/csv", error="invalid_input")
+        yield "# error: Error: el archivo no está en UTF-8\n"
+        return
+    except PoolFullError:
+        errors_total.inc(endpoint="calculate/csv", error="pool_full")
+        yield "# error: Error: servidor ocupado, intente más tarde\n"
+        return
+    except PoolTimeoutError:
+        errors_total.inc(endpoint="calculate/csv", error="timeout")
+        yield "# error: Error: el cálculo superó el tiempo máximo\n"
+        return
+    except Exception as e:
+        # La respuesta ya empezó: el error se informa como una línea de comentario
+        logger.exception("Error en el cálculo de CSV")
+        errors_total.inc(endpoint="calculate/csv", error=type(e).__name__)
+        yield "# error: An unexpected error occurred.\n"
+        return
+    finally:
+        for task in pending:
+            task.cancel()
+        upload.close()
+    yield _summary_line(total_rows, total_errors, start)
+
+
+def stream_csv_calculation(upload, chunk_size: int = DEFAULT_CSV_CHUNK_SIZE) -> AsyncIterator[str]:
+    """
+    Calculates every row of an uploaded CSV file, block by block, for streaming responses.
+
+    The header is read and checked before anything is sent (errors raise ValueError). The rows
+    are then read chunk_size at a time from the spooled file, evaluated in the calculation pool
+    and written as CSV in the order of the file: a header with OUTPUT_COLUMNS, one line per row
+    (with its line number in the file and an 'error' column) and a final comment line with the
+    number of rows, the rows with an error, the seconds and the rows per second. Neither the
+    upload nor the results are held in memory beyond the blocks in progress.
+
+    Parameters:
+        upload: The spooled file (see spool_upload); it is closed when the stream ends.
+        chunk_size (int): Number of rows per block.
+
+    Returns:
+        AsyncIterator[str]: The CSV lines.
+    """
+    try:
+        if not 1 <= chunk_size <= MAX_CSV_CHUNK_SIZE:
+            raise ValueError(f"Error: el tamaño de bloque debe estar entre 1 y {MAX_CSV_CHUNK_SIZE}")
+        # utf-8-sig descarta el BOM que agregan las hojas de cálculo al exportar
+        text = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")
+        reader = csv.reader(text)
+        try:
+            header = next(reader)
+        except StopIteration:
+            raise ValueError("Error: el archivo CSV está vacío")
+        except (csv.Error, UnicodeDecodeError):
+            raise ValueError("Error: el encabezado del CSV no es válido")
+        columns = _header_columns(header)
+    except BaseException:
+        upload.close()
+        raise
+    return _csv_lines(text, reader, columns, chunk_size)
@@ -0,0 +1,162 @@
+# backend/app/services/heisler_service.py
+
+import math
+import os
+import numpy as np
+from ..models.convection_models import GEOMETRIES
+from ..models.heisler_models import HeislerInput
+from ..calculations.eigenvalues import DEFAULT_MAX_ITERATIONS, eigenvalue_provider
+from ..calculations.heisler import INTERPOLATION_METHODS, heisler_tables
+from ..calculations.series import DEFAULT_ACCURACY, DISPLAY_TERMS, evaluate_point, required_terms_point
+from ..calculations.semi_infinite import semi_infinite_point
+from .convection_service import uses_short_time_model
+from .metrics import stage_seconds
+
+# Máximo de puntos por solicitud
+MAX_HEISLER_POINTS = int(os.environ.get("MAX_HEISLER_POINTS", 100_000))
+# Hasta este número de puntos se interpola punto a punto, sin la sobrecarga de NumPy, y sin
+# cálculo exacto la consulta se responde en el event loop
+POINT_LOOKUP_LIMIT = 16
+
+
+def _points(input_data: HeislerInput) -> tuple:
+    # Biot, Fourier y distancia con la misma longitud (un valor único se repite)
+    values = [np.atleast_1d(np.asarray(value, dtype=float))
+              for value in (input_data.biot, input_data.fourier, input_data.distance)]
+    try:
+        biot, fourier, distance = np.broadcast_arrays(*values)
+    except ValueError:
+        raise ValueError("Error: biot, fourier y distance deben tener un valor o la misma cantidad "
+                         "de valores")
+    if biot.ndim != 1:
+        raise ValueError("Error: biot, fourier y distance deben ser números o listas de números")
+    if biot.size == 0 or biot.size > MAX_HEISLER_POINTS:
+        raise ValueError(f"Error: la consulta debe tener entre 1 y {MAX_HEISLER_POINTS} puntos")
+    if not (np.isfinite(biot).all() and np.isfinite(fourier).all() and np.isfinite(distance).all()):
+        raise ValueError("Error: valores no válidos para la consulta")
+    if (biot < 0).any() or (fourier < 0).any():
+        raise ValueError("Error: los números de Biot y de Fourier no pueden ser negativos")
+    if (distance < 0).any() or (distance > 1).any():
+        raise ValueError("Error: la distancia adimensional debe estar entre 0 y 1")
+    return biot, fourier, distance
+
+
+def inline_lookup(input_data: HeislerInput) -> bool:
+    """
+    Tells whether a lookup is cheap enough to answer in the event loop.
+
+    It is when the tables of the geometry are already mapped, no exact solve may be needed and
+    the request has at most POINT_LOOKUP_LIMIT points, which are interpolated one by one without
+    NumPy arrays: the lookup then takes microseconds, less than handing the job to the
+    calculation pool. Larger lookups always run in the pool.
+
+    Parameters:
+        input_data (HeislerInput): The lookup.
+
+    Returns:
+        bool: Whether to run perform_heisler_lookup directly.
+    """
+    if input_data.exact_fallback or not heisler_tables.loaded(input_data.geometry.lower()):
+        return False
+    count = 1
+    for value in (input_data.biot, input_data.fourier, input_data.distance):
+        if isinstance(value, list):
+            count = max(count, len(value))
+    return count <= POINT_LOOKUP_LIMIT
+
+
+def exact_point(geometry: str, biot: float, dimensionless_time: float,
+                dimensionless_distance: float) -> tuple:
+    """
+    Solves one point exactly, as /convection/calculate does without the lumped model.
+
+    Parameters:
+        geometry (str): The geometry ('plate', 'cylinder' or 'sphere').
+        biot (float): Biot number.
+        dimensionless_time (float): Fourier number.
+        dimensionless_distance (float): Dimensionless distance from the center.
+
+    Returns:
+        tuple: theta_o, theta and heat_ratio (Q / Qmax).
+    """
+    if biot == 0 or dimensionless_time == 0:
+        # Sin convección o sin tiempo la temperatura no cambia
+        return 1.0, 1.0, 0.0
+    if uses_short_time_model(geometry, dimensionless_time, DEFAULT_ACCURACY):
+        solution = semi_infinite_point(geometry, biot, dimensionless_time, dimensionless_distance)
+        return solution.value_theta_o, solution.value_theta, 1 - solution.value_q
+    terms = required_terms_point(dimensionless_time)
+    if terms > 1:
+        terms = max(terms, DISPLAY_TERMS)
+    try:
+        lamb = eigenvalue_provider.get(geometry, biot, DEFAULT_MAX_ITERATIONS, None, None, terms)
+    except Exception as e:
+        raise ValueError(f"Error calculando lambda: {e}")
+    series = evaluate_point(geometry, lamb.roots, dimensionless_time, dimensionless_distance)
+    return series.summation_theta_o, series.summation_theta, 1 - series.summation_q
+
+
+def _optional(values) -> list:
+    return [value if math.isfinite(value) else None for value in values]
+
+
+def perform_heisler_lookup(input_data: HeislerInput) -> dict:
+    """
+    Reads the Heisler charts of a geometry at one or more points.
+
+    The values come from the memory-mapped tables of HeislerTables, interpolated linearly or with
+    cubic polynomials. Points outside the tables (Biot or Fourier numbers outside 1e-3 to 1e3, or
+    a distance away from the center with Fo < 0.2, where the one-term position correction of the
+    charts does not hold) are null with the source 'off_grid', or, with exact_fallback, solved
+    with the series or the short-time solution and marked 'exact'.
+
+    Parameters:
+        input_data (HeislerInput): The geometry, the points and the options.
+
+    Returns:
+        dict: JSON-ready dictionary following the HeislerResult schema.
+    """
+    geometry = input_data.geometry.lower()
+    if geometry not in GEOMETRIES:
+        raise ValueError("Error: geometría incorrecta")
+    method = input_data.method.lower()
+    if method not in INTERPOLATION_METHODS:
+        raise ValueError("Error: el método debe ser 'linear' o 'cubic'")
+    biot, fourier, distance = _points(input_data)
+    biot_list, fourier_list, distance_list = biot.tolist(), fourier.tolist(), distance.tolist()
+
+    with stage_seconds.time(stage="heisler", geometry=geometry):
+        if biot.size <= POINT_LOOKUP_LIMIT:
+            points = [heisler_tables.lookup_point(geometry, *point, method)
+                      for point in zip(biot_list, fourier_list, distance_list)]
+            on_grid = [point["on_grid"] for point in points]
+            theta_o = [point["theta_o"] for point in points]
+            theta = [point["theta"] for point in points]
+            heat_ratio = [point["heat_ratio"] for point in points]
+        else:
+            values = heisler_tables.lookup(geometry, biot, fourier, distance, method)
+            on_grid = values["on_grid"].tolist()
+            theta_o = values["theta_o"].tolist()
+            theta = values["theta"].tolist()
+            heat_ratio = values["heat_ratio"].tolist()
+
+    source = ["table" if inside else "off_grid" for inside in on_grid]
+    if input_data.exact_fallback:
+        with stage_seconds.time(stage="heisler_exact", geometry=geometry):
+            for index, inside in enumerate(on_grid):
+                if not inside:
+                    theta_o[index], theta[index], heat_ratio[index] = exact_point(
+                        geometry, biot_list[index], fourier_list[index], distance_list[index])
+                    source[index] = "exact"
+
+    return {
+        "geometry": geometry,
+        "method": method,
+        "biot": biot_list,
+        "fourier": fourier_list,
+        "distance": distance_list,
+        "theta_o": _optional(theta_o),
+        "theta": _optional(theta),
+        "heat_ratio": _optional(heat_ratio),
+        "source": source,
+    }
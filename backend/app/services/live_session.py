@@ -0,0 +1,197 @@
+# backend/app/services/live_session.py
+
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Optional
+from pydantic import ValidationError
+from ..models.convection_models import GEOMETRIES, ConvectionInput
+from . import convection_service
+from .calculation_pool import calculation_pool, PoolFullError, PoolTimeoutError
+from .metrics import errors_total, live_updates_total, requests_total, stage_seconds
+from .result_cache import result_cache
+
+logger = logging.getLogger(__name__)
+
+# Campos que acepta una actualización: los de /convection/calculate
+INPUT_FIELDS = frozenset(ConvectionInput.model_fields)
+
+
+async def compute_body(input_data: ConvectionInput) -> bytes:
+    """
+    Computes an input like /convection/calculate, sharing its result cache.
+
+    Parameters:
+        input_data (ConvectionInput): The input.
+
+    Returns:
+        bytes: The encoded response, {"message": "Success", "data": ...}.
+    """
+    key = convection_service.canonical_convection_key(input_data)
+    if key is not None:
+        body = result_cache.get(key)
+        if body is not None:
+            return body
+    record = await calculation_pool.run(convection_service.compute_convection_record, input_data)
+    with stage_seconds.time(stage="serialization", geometry=record.calcs.geometry):
+        body = record.to_json()
+    if key is not None:
+        result_cache.put(key, body)
+    return body
+
+
+class LiveSession:
+    """
+    Input of one WebSocket client, updated by deltas and computed latest-wins.
+
+    The client sends updates with the fields that changed; each one is merged into the current
+    input and bumps the version, and never waits for a calculation. A single loop computes the
+    current input whenever it changed: updates that arrive while a calculation runs only replace
+    the input, so a burst of slider moves costs one calculation for the state in progress and one
+    for the last state, and the superseded states are never computed. A session therefore has at
+    most one job in the calculation pool, however fast its client sends.
+
+    Messages from the client (JSON text):
+        {"type": "update", "input": {...}}: merges the fields into the input (null removes one).
+        {"type": "reset"}: clears the input.
+
+    Messages to the client (JSON text):
+        {"type": "result", "version", "latest", "coalesced", "message", "data"}: the result of
+            the input at version, with the shape of /convection/calculate; latest is false when
+            newer updates arrived meanwhile (their result follows), and coalesced counts the
+            updates superseded without being computed.
+        {"type": "error", "version", "detail"}: the input at version is incomplete or invalid,
+            or its calculation failed; the session waits for the next update.
+
+    Attributes:
+        values (dict): The current input, as received.
+        version (int): Updates applied so far.
+        computed (int): Inputs computed.
+        coalesced (int): Updates superseded without being computed.
+
+    Parameters:
+        send (Callable[[str], Awaitable]): Sends a text message to the client.
+    """
+
+    def __init__(self, send: Callable[[str], Awaitable]):
+        self.values = {}
+        self.version = 0
+        self.computed = 0
+        self.coalesced = 0
+        self._send = send
+        self._send_lock = asyncio.Lock()
+        self._changed = asyncio.Event()
+        self._computed_version = 0
+
+    async def _send_json(self, message: dict, body: Optional[bytes] = None):
+        text = json.dumps(message)
+        if body is not None:
+            # El cuerpo ya codificado ({"message": ..., "data": ...}) se añade sin volver a serializarlo
+            text = text[:-1] + ", " + body.decode()[1:]
+        # Los mensajes de error del receptor y los resultados no deben intercalarse
+        async with self._send_lock:
+            await self._send(text)
+
+    async def _error(self, version: int, detail, error: str):
+        errors_total.inc(endpoint="ws", error=error)
+        await self._send_json({"type": "error", "version": version, "detail": detail})
+
+    async def receive(self, text: str):
+        """
+        Applies one client message.
+
+        An update or a reset only changes the input and wakes the loop, so it never waits for a
+        calculation. An invalid message is answered with an error, which waits for a result that
+        is being sent to the same client (the two are not interleaved).
+
+        Parameters:
+            text (str): The message, as JSON text.
+        """
+        try:
+            message = json.loads(text)
+        except ValueError:
+            await self._error(self.version, "Error: el mensaje no es JSON válido", "invalid_input")
+            return
+        if not isinstance(message, dict):
+            await self._error(self.version, "Error: el mensaje debe ser un objeto JSON",
+                              "invalid_input")
+            return
+        kind = message.get("type", "update")
+        if kind == "reset":
+            self.values = {}
+        elif kind == "update":
+            values = message.get("input")
+            if not isinstance(values, dict):
+                await self._error(self.version, "Error: la actualización necesita un objeto input",
+                                  "invalid_input")
+                return
+            unknown = sorted(set(values) - INPUT_FIELDS)
+            if unknown:
+                await self._error(self.version, f"Error: campos desconocidos: {', '.join(unknown)}",
+                                  "invalid_input")
+                return
+            for field, value in values.items():
+                if value is None:
+                    self.values.pop(field, None)
+                else:
+                    self.values[field] = value
+        else:
+            await self._error(self.version, f"Error: tipo de mensaje desconocido '{kind}'",
+                              "invalid_input")
+            return
+        self.version += 1
+        self._changed.set()
+
+    async def run(self):
+        """
+        Computes the current input every time it changes, until cancelled.
+        """
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            version, values = self.version, dict(self.values)
+            # Las actualizaciones entre el último cálculo y esta no se calculan
+            superseded = version - self._computed_version - 1
+            self._computed_version = version
+            self.coalesced += superseded
+            live_updates_total.inc(superseded, outcome="coalesced")
+            if not values:
+                continue
+            await self._compute(version, values, superseded)
+
+    async def _compute(self, version: int, values: dict, superseded: int):
+        try:
+            input_data = ConvectionInput.model_validate(values)
+        except ValidationError as e:
+            live_updates_total.inc(outcome="invalid")
+            await self._error(version, json.loads(e.json(include_url=False)), "invalid_input")
+            return
+
+        geometry = input_data.geometry.lower()
+        requests_total.inc(endpoint="ws", geometry=geometry if geometry in GEOMETRIES else "unknown")
+        try:
+            body = await compute_body(input_data)
+        except PoolFullError:
+            await self._error(version, "Error: servidor ocupado, intente más tarde", "pool_full")
+            # Reintentar después con la entrada que haya entonces
+            await asyncio.sleep(calculation_pool.retry_after)
+            if self.version == version:
+                # Sin actualizaciones nuevas se vuelve a intentar la misma entrada
+                self._computed_version = version - 1
+                self._changed.set()
+            return
+        except PoolTimeoutError:
+            await self._error(version, "Error: el cálculo superó el tiempo máximo", "timeout")
+            return
+        except ValueError as e:
+            await self._error(version, str(e), "invalid_input")
+            return
+        except Exception as e:
+            logger.exception("Error en el cálculo de la sesión WebSocket")
+            await self._error(version, "An unexpected error occurred.", type(e).__name__)
+            return
+
+        self.computed += 1
+        live_updates_total.inc(outcome="computed")
+        await self._send_json({"type": "result", "version": version,
+                               "latest": version == self.version, "coalesced": superseded}, body)
@@ -0,0 +1,179 @@
+# backend/app/services/metrics.py
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+# Límites de los histogramas en segundos (de 100 µs a 10 s)
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                   0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Counter:
+    """
+    Monotonic counter with labels, rendered in the Prometheus text format.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        label_names (tuple): Names of the labels.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(labels.get(name, "") for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.label_names, key)} "
+                             f"{_format_number(value)}")
+        return lines
+
+
+class _Timer:
+    # Context manager sin generador: se usa varias veces por solicitud
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class Histogram:
+    """
+    Cumulative histogram with labels, rendered in the Prometheus text format.
+
+    Attributes:
+        name (str): Metric name.
+        documentation (str): HELP text.
+        label_names (tuple): Names of the labels.
+        buckets (tuple): Upper bounds of the buckets (+Inf is added).
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # Por combinación de etiquetas: conteo de cada bucket (no acumulado), suma y total
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple([labels.get(name, "") for name in self.label_names])
+        # Primer límite mayor o igual que el valor (+Inf recoge el resto)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels):
+        """
+        Returns a context manager that observes the duration of the block, also when it raises.
+        """
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    bucket = _format_labels(self.label_names, key, f'le="{_format_number(bound)}"')
+                    lines.append(f"{self.name}_bucket{bucket} {cumulative}")
+                labels = _format_labels(self.label_names, key)
+                lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics exported together on /metrics.
+    """
+
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, documentation, label_names)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, label_names: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        metric = Histogram(name, documentation, label_names, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# Tiempo de cada etapa del cálculo (conversión de entrada, Biot/alpha, lambdas, términos, ...)
+stage_seconds = registry.histogram(
+    "convection_stage_seconds", "Time spent in each stage of a convection calculation.",
+    ("stage", "geometry"))
+request_seconds = registry.histogram(
+    "convection_request_seconds", "Total time of each request.", ("endpoint",))
+requests_total = registry.counter(
+    "convection_requests_total", "Requests received, by endpoint and geometry.",
+    ("endpoint", "geometry"))
+batch_rows_total = registry.counter(
+    "convection_batch_rows_total", "Rows received by the batch endpoint, by geometry.",
+    ("geometry",))
+errors_total = registry.counter(
+    "convection_errors_total", "Failed requests, by endpoint and error type.",
+    ("endpoint", "error"))
+live_updates_total = registry.counter(
+    "convection_live_updates_total",
+    "Updates received by the WebSocket endpoint, by outcome (computed, coalesced or invalid).",
+    ("outcome",))
@@ -0,0 +1,136 @@
+# backend/app/services/multidimensional_service.py
+
+import math
+import numpy as np
+from ..models.multidimensional_models import MultidimensionalInput
+from ..calculations.convection_calculations import calc_alpha
+from ..calculations.eigenvalues import eigenvalue_provider
+from ..calculations.series import DEFAULT_ACCURACY, DISPLAY_TERMS, required_terms
+from ..calculations.product import PRODUCT_FACTORS, combine_factors, product_volume
+from ..calculations.semi_infinite import SHORT_TIME_GEOMETRIES, short_time_limit
+from .convection_service import (
+    MAX_FIELD_POINTS,
+    check_grid,
+    evaluate_grid_models,
+    grid_values,
+    smallest_grid_time
+)
+from .metrics import stage_seconds
+
+
+def perform_multidimensional_calculation(input_data: MultidimensionalInput) -> dict:
+    """
+    Evaluates the temperature of a short cylinder, a bar or a box as a product of 1-D solutions.
+
+    Each direction is a plate (or, for the lateral surface of the short cylinder, an infinite
+    cylinder) with its own thickness and Biot number. The eigenvalues are solved once per distinct
+    (geometry, Biot) pair, so the three directions of a cube share one solve, and every factor is
+    evaluated with evaluate_grid_models on its own distances (plate factors at short times use the
+    semi-infinite solid solution) before the factors are combined on the grid of all the distances
+    by broadcasting. The accuracy is split evenly among the factors.
+
+    Parameters:
+        input_data (MultidimensionalInput): The material, the geometry, the thicknesses and the grid.
+
+    Returns:
+        dict: JSON-ready dictionary following the MultidimensionalResult schema.
+    """
+    geometry = input_data.geometry.lower()
+    if geometry not in PRODUCT_FACTORS:
+        raise ValueError("Error: geometría incorrecta")
+    factors = PRODUCT_FACTORS[geometry]
+    thicknesses = [float(value) for value in input_data.thicknesses]
+    convection = input_data.convection_coefficient
+    convection = [float(value) for value in convection] if isinstance(convection, list) \
+        else [float(convection)] * len(factors)
+    if len(thicknesses) != len(factors) or len(convection) != len(factors) or \
+            len(input_data.distances) != len(factors):
+        raise ValueError(f"Error: la geometría {geometry} necesita {len(factors)} valores de "
+                         "espesor, coeficiente de convección y distancias")
+    if not all(math.isfinite(value) and value > 0 for value in thicknesses):
+        raise ValueError("Error: los espesores deben ser positivos")
+    for values in input_data.distances:
+        check_grid(values, None, "distancias")
+    check_grid(input_data.times, input_data.time_range, "tiempos")
+    distances = [np.array(values, dtype=float) for values in input_data.distances]
+    times = grid_values(input_data.times, input_data.time_range)
+    if times.size * math.prod(values.size for values in distances) > MAX_FIELD_POINTS:
+        raise ValueError("Error: demasiados puntos en el campo de temperaturas")
+
+    alpha = input_data.thermal_diffusivity
+    if alpha is None or alpha == 0:
+        alpha = calc_alpha(input_data)
+    accuracy = (DEFAULT_ACCURACY if input_data.accuracy is None else input_data.accuracy) / \
+        len(factors)
+    smallest_time = smallest_grid_time(input_data.times, input_data.time_range)
+
+    # Longitud característica, Biot y términos de cada dirección; los términos de cada par
+    # (geometría, Biot) son los que pide su factor más exigente. Los tiempos cortos de las placas
+    # usan la solución de sólido semi-infinito y no cuentan
+    lengths = [thickness / 2 for thickness in thicknesses]
+    biots = [h * length / input_data.conductivity_coefficient
+             for h, length in zip(convection, lengths)]
+    needed = {}
+    for factor, length, biot in zip(factors, lengths, biots):
+        terms = DISPLAY_TERMS
+        if smallest_time is not None:
+            dimensionless_time = smallest_time * alpha / length ** 2
+            if factor in SHORT_TIME_GEOMETRIES:
+                dimensionless_time = max(dimensionless_time, short_time_limit(accuracy))
+            terms = max(int(required_terms(dimensionless_time, accuracy)), DISPLAY_TERMS)
+        needed[(factor, biot)] = max(needed.get((factor, biot), 0), terms)
+
+    with stage_seconds.time(stage="eigenvalues", geometry=geometry):
+        roots = {}
+        for (factor, biot), terms in needed.items():
+            try:
+                lamb = eigenvalue_provider.get(factor, biot, input_data.iterations,
+                                               input_data.absolute_tolerance,
+                                               input_data.relative_tolerance, terms)
+            except Exception as e:
+                raise ValueError(f"Error calculando lambda: {e}")
+            roots[(factor, biot)] = np.array(lamb.roots)
+            if not np.isfinite(roots[(factor, biot)]).all():
+                raise ValueError("Error: valores no válidos para el cálculo")
+
+    with stage_seconds.time(stage="terms", geometry=geometry):
+        thetas, heat_ratios, truncation_errors, models = [], [], [], []
+        for factor, length, biot, values in zip(factors, lengths, biots, distances):
+            theta, heat_ratio, truncation_error, short = evaluate_grid_models(
+                factor, biot, roots[(factor, biot)], times * alpha / length ** 2, values / length,
+                accuracy)
+            thetas.append(theta)
+            heat_ratios.append(heat_ratio)
+            truncation_errors.append(truncation_error)
+            models.append(np.where(short, "semi_infinite", "series").tolist())
+        theta, heat_ratio, truncation_error = combine_factors(thetas, heat_ratios,
+                                                              truncation_errors)
+
+    difference = input_data.initial_temperature - input_data.ambient_temperature
+    q_max = input_data.density * input_data.specific_heat * \
+        product_volume(geometry, thicknesses) * -difference
+    return {
+        "geometry": geometry,
+        "thermal_diffusivity": float(alpha),
+        "q_max": float(q_max),
+        "factors": [
+            {
+                "geometry": factor,
+                "thickness": thickness,
+                "biot": float(biot),
+                "lambdas": roots[(factor, biot)].tolist(),
+                "terms": int(roots[(factor, biot)].size),
+                "distances": values.tolist(),
+                "model": model,
+            }
+            for factor, thickness, biot, values, model in zip(factors, thicknesses, biots,
+                                                               distances, models)
+        ],
+        "times": times.tolist(),
+        "temperature": (theta * difference + input_data.ambient_temperature).tolist(),
+        "heat_ratio": heat_ratio.tolist(),
+        "q": (heat_ratio * q_max).tolist(),
+        "truncation_error": np.where(np.isfinite(truncation_error), truncation_error,
+                                     None).tolist(),
+        "eigenvalue_solves": len(roots),
+    }
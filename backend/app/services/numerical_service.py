@@ -0,0 +1,130 @@
+# backend/app/services/numerical_service.py
+
+import math
+import os
+import numpy as np
+from ..models.convection_models import GEOMETRIES
+from ..models.numerical_models import NumericalInput, Profile
+from ..calculations.convection_calculations import calc_alpha
+from ..calculations.finite_difference import VOLUME_FACTORS, crank_nicolson, radial_mesh
+from .convection_service import MAX_FIELD_POINTS, check_grid, grid_values
+from .metrics import stage_seconds
+
+# Límites del método numérico: nodos de la malla y nodos por pasos de tiempo de un cálculo
+MAX_NUMERICAL_NODES = int(os.environ.get("MAX_NUMERICAL_NODES", 100_000))
+MAX_NUMERICAL_WORK = int(os.environ.get("MAX_NUMERICAL_WORK", 500_000_000))
+# Pasos de tiempo por defecto hasta el último tiempo pedido
+DEFAULT_NUMERICAL_STEPS = 1000
+
+
+def _profile_values(profile: Profile, name: str):
+    # Perfil lineal a trozos: tantos valores como puntos, finitos y con los puntos en orden
+    points = np.array(profile.points, dtype=float)
+    values = np.array(profile.values, dtype=float)
+    if points.size == 0 or points.size != values.size:
+        raise ValueError(f"Error: el {name} necesita un valor por punto")
+    if not (np.isfinite(points).all() and np.isfinite(values).all()):
+        raise ValueError(f"Error: valores no válidos en el {name}")
+    if (np.diff(points) <= 0).any():
+        raise ValueError(f"Error: los puntos del {name} deben ser crecientes")
+    return points, values
+
+
+def perform_numerical_calculation(input_data: NumericalInput) -> dict:
+    """
+    Solves the temperature field with the Crank-Nicolson finite-volume method.
+
+    Unlike the series, the initial temperature may vary with the distance from the center and the
+    ambient temperature with the time (both as piecewise linear profiles), which covers the cases
+    the analytical solutions cannot. The mesh has input_data.nodes nodes between the center and
+    the surface, and the time step defaults to the last time over DEFAULT_NUMERICAL_STEPS. The
+    result has the shape of the field endpoint, without the series fields, rather than DataResult:
+    DataResult describes one distance and one time through the terms and lambda values of the
+    series, which the method does not have, while one run gives every requested time and
+    distance. q_max uses the mean initial temperature and the last ambient temperature.
+
+    Parameters:
+        input_data (NumericalInput): The material, the geometry, the conditions and the grid.
+
+    Returns:
+        dict: JSON-ready dictionary following the NumericalResult schema.
+    """
+    geometry = input_data.geometry.lower()
+    if geometry not in GEOMETRIES:
+        raise ValueError("Error: geometría incorrecta")
+    if not (math.isfinite(input_data.thickness) and input_data.thickness > 0):
+        raise ValueError("Error: el espesor debe ser positivo")
+    nodes = input_data.nodes
+    if not 2 <= nodes <= MAX_NUMERICAL_NODES:
+        raise ValueError(f"Error: la malla debe tener entre 2 y {MAX_NUMERICAL_NODES} nodos")
+    if (input_data.initial_temperature is None) == (input_data.initial_profile is None):
+        raise ValueError("Error: indique la temperatura inicial como valor o como perfil")
+    if (input_data.ambient_temperature is None) == (input_data.ambient_schedule is None):
+        raise ValueError("Error: indique la temperatura ambiente como valor o como perfil")
+    check_grid(input_data.distances, input_data.distance_range, "distancias")
+    check_grid(input_data.times, input_data.time_range, "tiempos")
+    distances = grid_values(input_data.distances, input_data.distance_range)
+    times = grid_values(input_data.times, input_data.time_range)
+    if distances.size * times.size > MAX_FIELD_POINTS:
+        raise ValueError("Error: demasiados puntos en el campo de temperaturas")
+    length = input_data.thickness / 2
+    if distances.max() > length * (1 + 1e-12):
+        raise ValueError("Error: las distancias no pueden superar la longitud característica")
+    distances = np.minimum(distances, length)
+
+    alpha = input_data.thermal_diffusivity
+    if alpha is None or alpha == 0:
+        alpha = calc_alpha(input_data)
+    conductivity = input_data.conductivity_coefficient
+    biot = input_data.convection_coefficient * length / conductivity
+
+    # Los tiempos se calculan en orden y sin repetir, y se devuelven en el orden pedido
+    ordered, positions = np.unique(times, return_inverse=True)
+    time_step = input_data.time_step
+    if time_step is None:
+        time_step = ordered[-1] / DEFAULT_NUMERICAL_STEPS
+    elif not (math.isfinite(time_step) and time_step > 0):
+        raise ValueError("Error: el paso de tiempo debe ser positivo")
+    if time_step > 0 and nodes * (ordered[-1] / time_step + ordered.size) > MAX_NUMERICAL_WORK:
+        raise ValueError("Error: demasiados nodos y pasos de tiempo para el método numérico")
+
+    mesh = radial_mesh(geometry, length, nodes)
+    if input_data.initial_profile is None:
+        initial = np.full(nodes, float(input_data.initial_temperature))
+    else:
+        points, values = _profile_values(input_data.initial_profile, "perfil inicial")
+        initial = np.interp(mesh.positions, points, values)
+    if input_data.ambient_schedule is None:
+        final_ambient = float(input_data.ambient_temperature)
+        ambient = lambda time: final_ambient
+    else:
+        points, values = _profile_values(input_data.ambient_schedule, "perfil de ambiente")
+        final_ambient = float(values[-1])
+        ambient = lambda time: float(np.interp(time, points, values))
+    if not np.isfinite(initial).all() or not math.isfinite(final_ambient):
+        raise ValueError("Error: valores no válidos para el cálculo")
+
+    with stage_seconds.time(stage="numerical", geometry=geometry):
+        # h / (rho * c) a partir de alpha y k, igual que el número de Biot de la serie
+        solution = crank_nicolson(mesh, alpha, input_data.convection_coefficient * alpha /
+                                  conductivity, initial, ambient, distances, ordered, time_step)
+
+    heat_capacity = input_data.density * input_data.specific_heat * VOLUME_FACTORS[geometry]
+    mean_initial = float(mesh.volumes @ initial / mesh.volumes.sum())
+    q_max = heat_capacity * float(mesh.volumes.sum()) * (final_ambient - mean_initial)
+    q = heat_capacity * solution.stored_heat[positions]
+    heat_ratio = q / q_max if q_max != 0 else np.full(q.size, np.nan)
+    return {
+        "geometry": geometry,
+        "thermal_diffusivity": float(alpha),
+        "biot": float(biot),
+        "q_max": float(q_max),
+        "nodes": nodes,
+        "time_step": float(time_step),
+        "steps": solution.steps,
+        "distances": distances.tolist(),
+        "times": times.tolist(),
+        "temperature": solution.temperature[positions].tolist(),
+        "heat_ratio": np.where(np.isfinite(heat_ratio), heat_ratio, None).tolist(),
+        "q": q.tolist(),
+    }
@@ -0,0 +1,164 @@
+# backend/app/services/result_cache.py
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+# Configuración por variables de entorno (TTL 0 = sin caducidad)
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", 1024))
+RESULT_CACHE_TTL = float(os.environ.get("RESULT_CACHE_TTL", 0))
+# Cambiar la versión invalida los ETag emitidos con resultados anteriores y las respuestas del
+# historial; se sube con cada cambio de la respuesta de /convection/calculate para una misma
+# entrada. 2: modelo concentrado, 3: modo de un término, 4: sólido semi-infinito
+RESULT_VERSION = "4"
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an ETag (weak comparison, as RFC 9110 asks for).
+
+    Parameters:
+        if_none_match (str, optional): The header value: '*' or a comma-separated list of ETags.
+        etag (str): The current ETag.
+
+    Returns:
+        bool: True when the client already has the current representation.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of serialized responses, with optional time to live.
+
+    Keys are canonicalized inputs (see canonical_convection_key) and values the encoded JSON body,
+    so a hit is returned without computing or serializing anything. The ETag of a key is derived
+    from the key itself, which lets a repeated request be answered with 304 before looking at the
+    cache at all.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept in the cache.
+        ttl (float): Seconds an entry stays valid (0 for no expiry).
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required a calculation.
+        not_modified (int): Number of requests answered with 304.
+
+    Parameters:
+        max_size (int): Maximum number of entries kept in the cache.
+        ttl (float): Seconds an entry stays valid (0 for no expiry).
+    """
+
+    def __init__(self, max_size=RESULT_CACHE_SIZE, ttl=RESULT_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._memory = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def etag(key: Hashable) -> str:
+        """
+        Returns the strong ETag of a canonical key.
+
+        Parameters:
+            key (Hashable): Canonical input key.
+
+        Returns:
+            str: The quoted ETag.
+        """
+        digest = hashlib.sha256(f"{RESULT_VERSION}:{key!r}".encode()).hexdigest()
+        return f'"{digest[:32]}"'
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Returns the cached body of a key, or None when it is missing or expired.
+
+        Parameters:
+            key (Hashable): Canonical input key.
+
+        Returns:
+            bytes: The encoded JSON body, or None.
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                body, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return body
+                # Caducada: se elimina como si no existiera
+                del self._cache[key]
+                self._memory -= len(body)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, body: bytes):
+        """
+        Stores the body of a key, evicting the least recently used entries beyond max_size.
+
+        Parameters:
+            key (Hashable): Canonical input key.
+            body (bytes): The encoded JSON body.
+        """
+        if self.max_size <= 0:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl > 0 else None
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._memory -= len(previous[0])
+            self._cache[key] = (body, expires)
+            self._memory += len(body)
+            while len(self._cache) > self.max_size:
+                _, (evicted, _) = self._cache.popitem(last=False)
+                self._memory -= len(evicted)
+
+    def count_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def stats(self):
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            dict: hits, misses, not_modified, size, max_size, ttl, memory_bytes and hit_ratio.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'not_modified': self.not_modified,
+                'size': len(self._cache),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'memory_bytes': self._memory,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        with self._lock:
+            self._cache.clear()
+            self._memory = 0
+            self.hits = 0
+            self.misses = 0
+            self.not_modified = 0
+
+
+result_cache = ResultCache()
@@ -0,0 +1,327 @@
+# backend/app/services/run_history.py
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from .result_cache import RESULT_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Configuración por variables de entorno (sin RUN_HISTORY_PATH el historial está desactivado)
+RUN_HISTORY_PATH = os.environ.get("RUN_HISTORY_PATH", "")
+RUN_HISTORY_BATCH_SIZE = int(os.environ.get("RUN_HISTORY_BATCH_SIZE", 256))
+RUN_HISTORY_FLUSH_INTERVAL = float(os.environ.get("RUN_HISTORY_FLUSH_INTERVAL", 0.5))
+RUN_HISTORY_QUEUE_SIZE = int(os.environ.get("RUN_HISTORY_QUEUE_SIZE", 10_000))
+# Máximo de ejecuciones por página
+MAX_HISTORY_PAGE = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        input_hash TEXT NOT NULL,
+        result_version TEXT,
+        created_at REAL NOT NULL,
+        geometry TEXT NOT NULL,
+        time REAL,
+        distance REAL,
+        biot REAL,
+        input TEXT NOT NULL,
+        body BLOB NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS runs_input_hash ON runs (input_hash)",
+    "CREATE INDEX IF NOT EXISTS runs_geometry_time ON runs (geometry, time)",
+)
+_COLUMNS = "id, input_hash, created_at, geometry, time, distance, biot, input, body"
+
+
+@dataclass(slots=True)
+class RunEntry:
+    """
+    A calculation waiting to be written.
+
+    Attributes:
+        input_hash (str): Hash of the canonical input, the ETag without quotes.
+        created_at (float): Unix time of the calculation.
+        geometry (str): The geometry.
+        time (float): Time of the calculation.
+        distance (float): Distance from the center.
+        biot (float): Biot number used.
+        input (str): The input as JSON.
+        body (bytes): The encoded response.
+    """
+
+    input_hash: str
+    created_at: float
+    geometry: str
+    time: Optional[float]
+    distance: Optional[float]
+    biot: Optional[float]
+    input: str
+    body: bytes
+
+
+class RunHistory:
+    """
+    Durable history of calculations in a SQLite database.
+
+    Requests only put their result in a bounded queue; a writer thread inserts the queue in
+    batches of up to batch_size rows, one transaction per batch, so the request path never waits
+    for the disk. The database runs in WAL mode, so readers (each thread has its own connection)
+    do not block the writer, and several server processes on the same host can share the file.
+    The rows are indexed by the hash of the canonical input, which makes the history a second
+    level of the result cache that survives restarts, and by geometry and time for the queries.
+    Every row stores the RESULT_VERSION of the code that computed it and the cache only returns
+    rows of the current version, so a deploy that changes the results does not serve old bodies.
+    When the queue is full the entry is dropped and counted rather than slowing the request.
+
+    Attributes:
+        path (str): Path of the database ('' when the history is disabled).
+        written (int): Rows inserted.
+        dropped (int): Entries dropped because the queue was full.
+        hits (int): Lookups found in the database.
+        misses (int): Lookups not found.
+
+    Parameters:
+        path (str): Path of the database ('' disables the history).
+        batch_size (int): Maximum rows per transaction.
+        flush_interval (float): Seconds the writer waits to fill a batch.
+        queue_size (int): Maximum entries waiting to be written.
+        result_version (str): Version of the results written and returned by lookup.
+    """
+
+    def __init__(self, path=RUN_HISTORY_PATH, batch_size=RUN_HISTORY_BATCH_SIZE,
+                 flush_interval=RUN_HISTORY_FLUSH_INTERVAL, queue_size=RUN_HISTORY_QUEUE_SIZE,
+                 result_version=RESULT_VERSION):
+        self.path = path
+        self.result_version = result_version
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self.hits = 0
+        self.misses = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writer = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Con WAL, NORMAL solo puede perder las últimas transacciones ante un corte de energía
+        connection.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(runs)")}
+        if "result_version" not in columns:
+            # Bases anteriores a la columna: sus filas quedan sin versión y la caché no las usa
+            connection.execute("ALTER TABLE runs ADD COLUMN result_version TEXT")
+        connection.commit()
+        return connection
+
+    def _connection(self) -> sqlite3.Connection:
+        # Una conexión de lectura por hilo: sqlite3 no comparte conexiones entre hilos
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._connect()
+        return connection
+
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name="run-history",
+                                                daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        connection = self._connect()
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            # Juntar lo que llegue hasta completar el lote o agotar el intervalo
+            while len(batch) < self.batch_size:
+                try:
+                    entry = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stop = True
+                    break
+                batch.append(entry)
+            self._insert(connection, batch)
+            if stop:
+                break
+        connection.close()
+
+    def _insert(self, connection: sqlite3.Connection, batch: List[RunEntry]):
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO runs (input_hash, result_version, created_at, geometry, time, "
+                    "distance, biot, input, body) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(entry.input_hash, self.result_version, entry.created_at, entry.geometry,
+                      entry.time, entry.distance, entry.biot, entry.input, entry.body)
+                     for entry in batch])
+            with self._lock:
+                self.written += len(batch)
+        except sqlite3.Error:
+            logger.exception("No se pudieron guardar %d ejecuciones en el historial", len(batch))
+            with self._lock:
+                self.dropped += len(batch)
+
+    def record(self, entry: RunEntry):
+        """
+        Queues a calculation to be written; returns at once.
+
+        Parameters:
+            entry (RunEntry): The calculation.
+        """
+        if not self.enabled:
+            return
+        self._start_writer()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def lookup(self, input_hash: str) -> Optional[bytes]:
+        """
+        Returns the latest stored response of an input computed with the current result version,
+        or None.
+
+        Parameters:
+            input_hash (str): Hash of the canonical input.
+
+        Returns:
+            bytes: The encoded response, or None.
+        """
+        if not self.enabled:
+            return None
+        row = self._connection().execute(
+            "SELECT body FROM runs WHERE input_hash = ? AND result_version = ? "
+            "ORDER BY id DESC LIMIT 1", (input_hash, self.result_version)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return bytes(row[0])
+
+    @staticmethod
+    def _row(row) -> dict:
+        run_id, input_hash, created_at, geometry, run_time, distance, biot, input_json, body = row
+        return {
+            "id": run_id,
+            "input_hash": input_hash,
+            "created_at": created_at,
+            "geometry": geometry,
+            "time": run_time,
+            "distance": distance,
+            "biot": biot,
+            "input": json.loads(input_json),
+            "result": json.loads(body)["data"],
+        }
+
+    def get(self, run_id: int) -> Optional[dict]:
+        """
+        Returns one run by its id, or None.
+
+        Parameters:
+            run_id (int): The id of the run.
+
+        Returns:
+            dict: The run, following the HistoryRun schema, or None.
+        """
+        row = self._connection().execute(f"SELECT {_COLUMNS} FROM runs WHERE id = ?",
+                                         (run_id,)).fetchone()
+        return None if row is None else self._row(row)
+
+    def query(self, geometry: Optional[str] = None, input_hash: Optional[str] = None,
+              time_min: Optional[float] = None, time_max: Optional[float] = None,
+              before: Optional[int] = None, limit: int = 50) -> dict:
+        """
+        Lists runs from the newest, filtered, with keyset pagination.
+
+        The page after one ending at id n is the query with before=n, which the index on the
+        primary key answers without counting or skipping the previous pages (unlike OFFSET).
+
+        Parameters:
+            geometry (str, optional): Only runs of this geometry.
+            input_hash (str, optional): Only runs of this input.
+            time_min (float, optional): Only runs at this time or later.
+            time_max (float, optional): Only runs at this time or earlier.
+            before (int, optional): Only runs with a smaller id (the next_before of the
+                previous page).
+            limit (int): Maximum runs in the page.
+
+        Returns:
+            dict: runs and next_before (None on the last page), following the HistoryPage schema.
+        """
+        conditions, parameters = [], []
+        for condition, value in (("geometry = ?", geometry), ("input_hash = ?", input_hash),
+                                 ("time >= ?", time_min), ("time <= ?", time_max),
+                                 ("id < ?", before)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        # Una fila de más indica si hay otra página
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM runs {where} ORDER BY id DESC LIMIT ?",
+            (*parameters, limit + 1)).fetchall()
+        runs = [self._row(row) for row in rows[:limit]]
+        return {
+            "runs": runs,
+            "next_before": runs[-1]["id"] if len(rows) > limit else None,
+        }
+
+    def stats(self):
+        """
+        Returns the counters of the history.
+
+        Returns:
+            dict: enabled, path, written, pending, dropped, hits and misses.
+        """
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'path': self.path,
+                'written': self.written,
+                'pending': self._queue.qsize(),
+                'dropped': self.dropped,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+    def shutdown(self, timeout: float = 5.0):
+        """
+        Writes the queued entries and stops the writer thread.
+
+        Parameters:
+            timeout (float): Seconds to wait for the writer.
+        """
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join(timeout)
+
+
+run_history = RunHistory()
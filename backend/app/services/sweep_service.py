@@ -0,0 +1,191 @@
+# backend/app/services/sweep_service.py
+
+import asyncio
+import logging
+import os
+import numpy as np
+from collections import deque
+from typing import AsyncIterator
+from pydantic import ValidationError
+from ..models.convection_models import GEOMETRIES, ConvectionInput
+from ..models.field_models import STREAM_MEDIA_TYPES, GridRange
+from ..models.sweep_models import DEFAULT_SWEEP_CHUNK_SIZE, MAX_SWEEP_CHUNK_SIZE, SweepInput
+from ..calculations.sweep import AXIS_PRIORITY, SweepAxis, SweepGrid, evaluate_sweep_chunk
+from .calculation_pool import sweep_pool, PoolFullError, PoolTimeoutError
+from .convection_service import encode_event
+from .metrics import errors_total
+
+logger = logging.getLogger(__name__)
+
+# Máximo de puntos de un barrido (la malla nunca se construye completa)
+MAX_SWEEP_POINTS = int(os.environ.get("MAX_SWEEP_POINTS", 10_000_000))
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value)
+
+
+def build_sweep_grid(input_data: SweepInput) -> SweepGrid:
+    """
+    Validates a sweep and describes it as a SweepGrid, without expanding it.
+
+    Parameters:
+        input_data (SweepInput): The fixed fields and the varying fields of the sweep.
+
+    Returns:
+        SweepGrid: The sweep, with the axes ordered so that points sharing the geometry and the
+            Biot number are contiguous.
+    """
+    known = ConvectionInput.model_fields
+    for name in input_data.base:
+        if name not in known:
+            raise ValueError(f"Error: campo desconocido '{name}'")
+
+    axes = []
+    for name, spec in input_data.parameters.items():
+        if name not in known:
+            raise ValueError(f"Error: campo desconocido '{name}'")
+        if name in input_data.base:
+            raise ValueError(f"Error: el campo '{name}' no puede ser fijo y variable a la vez")
+        if isinstance(spec, GridRange):
+            if name in ("geometry", "iterations"):
+                raise ValueError(f"Error: '{name}' solo admite una lista de valores")
+            if spec.points < 1:
+                raise ValueError(f"Error: el rango de '{name}' necesita al menos un punto")
+            if not (_is_number(spec.start) and _is_number(spec.stop)):
+                raise ValueError(f"Error: valores no válidos en '{name}'")
+            axes.append(SweepAxis(name, start=spec.start, stop=spec.stop, points=spec.points))
+            continue
+
+        if len(spec) == 0:
+            raise ValueError(f"Error: el campo '{name}' no tiene valores")
+        if name == "geometry":
+            values = [str(value).lower() for value in spec]
+            if any(value not in GEOMETRIES for value in values):
+                raise ValueError("Error: geometría incorrecta")
+        elif name == "iterations":
+            if not all(_is_number(value) and float(value).is_integer() for value in spec):
+                raise ValueError(f"Error: valores no válidos en '{name}'")
+            values = [int(value) for value in spec]
+        else:
+            if not all(_is_number(value) for value in spec):
+                raise ValueError(f"Error: valores no válidos en '{name}'")
+            values = [float(value) for value in spec]
+        axes.append(SweepAxis(name, values=values))
+
+    if not axes:
+        raise ValueError("Error: el barrido necesita al menos un campo variable")
+    # Geometría y parámetros de Biot primero; el resto en el orden recibido
+    axes.sort(key=lambda axis: AXIS_PRIORITY.index(axis.name) if axis.name in AXIS_PRIORITY
+              else len(AXIS_PRIORITY))
+
+    grid = SweepGrid(base=dict(input_data.base), axes=axes)
+    if grid.size > MAX_SWEEP_POINTS:
+        raise ValueError("Error: demasiados puntos en el barrido")
+    try:
+        first = ConvectionInput.model_validate(grid.first_point())
+    except ValidationError as e:
+        names = sorted({str(error["loc"][0]) for error in e.errors() if error["loc"]})
+        raise ValueError(f"Error: faltan datos o no son válidos en el barrido: {', '.join(names)}")
+    if "geometry" in input_data.base and first.geometry.lower() not in GEOMETRIES:
+        raise ValueError("Error: geometría incorrecta")
+    return grid
+
+
+def encode_sweep_chunk(grid: SweepGrid, start: int, stop: int, stream_format: str) -> str:
+    """
+    Evaluates a block of a sweep and encodes it as a 'chunk' event.
+
+    Runs in the sweep pool, so the JSON encoding also stays out of the event loop.
+
+    Parameters:
+        grid (SweepGrid): The sweep.
+        start (int): First flat index.
+        stop (int): Flat index after the last one.
+        stream_format (str): 'ndjson' or 'sse'.
+
+    Returns:
+        str: The encoded event.
+    """
+    chunk = evaluate_sweep_chunk(grid, start, stop)
+    # Los NaN de los puntos inválidos se escriben como null
+    payload = {
+        "start": chunk["start"],
+        "stop": chunk["stop"],
+        "parameters": {name: values.tolist() for name, values in chunk["parameters"].items()},
+    }
+    for name in ("model", "biot", "tem", "q", "value_theta", "value_q", "truncation_error"):
+        payload[name] = chunk[name].tolist()
+    return encode_event(stream_format, "chunk", payload)
+
+
+async def _sweep_events(grid: SweepGrid, stream_format: str, chunk_size: int) -> AsyncIterator[str]:
+    size = grid.size
+    yield encode_event(stream_format, "header", {
+        "points": size,
+        "axes": [{"name": axis.name, "size": axis.size} for axis in grid.axes],
+        "chunk_size": chunk_size,
+        "chunks": -(-size // chunk_size),
+    })
+
+    # Tantos bloques en curso como workers: los bloques se envían en orden y la memoria no crece
+    window = max(1, sweep_pool.workers)
+    pending = deque()
+    next_start = 0
+    try:
+        while next_start < size or pending:
+            while next_start < size and len(pending) < window:
+                stop = min(next_start + chunk_size, size)
+                pending.append(asyncio.ensure_future(
+                    sweep_pool.run(encode_sweep_chunk, grid, next_start, stop, stream_format)))
+                next_start = stop
+            yield await pending.popleft()
+    except PoolFullError:
+        errors_total.inc(endpoint="sweep", error="pool_full")
+        yield encode_event(stream_format, "error",
+                           {"detail": "Error: servidor ocupado, intente más tarde"})
+        return
+    except PoolTimeoutError:
+        errors_total.inc(endpoint="sweep", error="timeout")
+        yield encode_event(stream_format, "error",
+                           {"detail": "Error: el cálculo superó el tiempo máximo"})
+        return
+    except Exception as e:
+        # La respuesta ya empezó: el error se informa como un evento más
+        logger.exception("Error en el barrido")
+        errors_total.inc(endpoint="sweep", error=type(e).__name__)
+        yield encode_event(stream_format, "error", {"detail": "An unexpected error occurred."})
+        return
+    finally:
+        # Cliente desconectado o error: los bloques pendientes ya no se esperan
+        for task in pending:
+            task.cancel()
+    yield encode_event(stream_format, "end", {})
+
+
+def stream_sweep(input_data: SweepInput, stream_format: str = "ndjson",
+                 chunk_size: int = DEFAULT_SWEEP_CHUNK_SIZE) -> AsyncIterator[str]:
+    """
+    Runs a parameter sweep in blocks across the sweep pool, for streaming responses.
+
+    The sweep is the Cartesian product of the varying fields; it is validated before anything is
+    sent (errors raise ValueError) and is never built in memory: each block of chunk_size points
+    is expanded from its flat indices by the worker that evaluates it. The events are a 'header'
+    (number of points and the axes, slowest first), one 'chunk' per block in order (the values of
+    the varying fields and, per point, model, biot, tem, q, value_theta, value_q and
+    truncation_error, null for invalid points) and a final 'end'.
+
+    Parameters:
+        input_data (SweepInput): The fixed fields and the varying fields of the sweep.
+        stream_format (str): 'ndjson' (one JSON object per line) or 'sse' (Server-Sent Events).
+        chunk_size (int): Number of points per block.
+
+    Returns:
+        AsyncIterator[str]: The encoded events.
+    """
+    if stream_format not in STREAM_MEDIA_TYPES:
+        raise ValueError("Error: formato de streaming incorrecto")
+    if not 1 <= chunk_size <= MAX_SWEEP_CHUNK_SIZE:
+        raise ValueError(f"Error: el tamaño de bloque debe estar entre 1 y {MAX_SWEEP_CHUNK_SIZE}")
+    grid = build_sweep_grid(input_data)
+    return _sweep_events(grid, stream_format, chunk_size)
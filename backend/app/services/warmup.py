@@ -0,0 +1,153 @@
+# backend/app/services/warmup.py
+
+import logging
+import os
+import time
+from typing import Dict, Optional
+from ..models.convection_models import GEOMETRIES, ConvectionInput
+
+logger = logging.getLogger(__name__)
+
+# Configuración por variables de entorno
+WARMUP_ENABLED = os.environ.get("WARMUP", "1") != "0"
+WARMUP_TABLES = os.environ.get("WARMUP_TABLES", "1") != "0"
+
+# Entrada de referencia con la que se ejercita cada geometría (Bi = 0.5, Fo = 0.5)
+WARMUP_INPUT = {
+    "thickness": 0.04,
+    "thermal_diffusivity": 1.0e-5,
+    "conductivity_coefficient": 60.0,
+    "convection_coefficient": 1500.0,
+    "initial_temperature": 300.0,
+    "ambient_temperature": 20.0,
+    "density": 7800.0,
+    "specific_heat": 460.0,
+    "distance": 0.01,
+    "time": 20.0,
+    "iterations": 100,
+}
+
+
+class WarmupState:
+    """
+    Progress of the start-up warm-up, which the readiness endpoint reports.
+
+    Attributes:
+        enabled (bool): Whether the warm-up runs at start-up.
+        ready (bool): True once the warm-up has finished (or at once when it is disabled).
+        app_import_seconds (float, optional): Time spent importing the application.
+        import_seconds (float, optional): Time spent importing the calculation modules (NumPy).
+        table_seconds (float, optional): Time spent building the eigenvalue tables.
+        geometry_seconds (dict): Time of the first calculation of each geometry, including the
+            imports it needs (SciPy for the cylinder and the sphere).
+        warmup_seconds (float, optional): Total time of the warm-up.
+        error (str, optional): Error that stopped the warm-up.
+    """
+
+    def __init__(self, enabled=WARMUP_ENABLED):
+        self.enabled = enabled
+        self.ready = False
+        self.app_import_seconds: Optional[float] = None
+        self.import_seconds: Optional[float] = None
+        self.table_seconds: Optional[float] = None
+        self.geometry_seconds: Dict[str, float] = {}
+        self.warmup_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def stats(self):
+        """
+        Returns the state of the warm-up.
+
+        Returns:
+            dict: ready, enabled, the measured times and the error, if any.
+        """
+        return {
+            'ready': self.ready,
+            'enabled': self.enabled,
+            'app_import_seconds': self.app_import_seconds,
+            'import_seconds': self.import_seconds,
+            'table_seconds': self.table_seconds,
+            'geometry_seconds': dict(self.geometry_seconds),
+            'warmup_seconds': self.warmup_seconds,
+            'error': self.error,
+        }
+
+
+def load_calculations(preload_tables=WARMUP_TABLES):
+    """
+    Imports the calculation modules and, optionally, builds the eigenvalue tables of every geometry
+    and maps its Heisler chart tables (building the files the first time).
+
+    Also used as the initializer of the process pool, so each worker process is warm before its
+    first job.
+
+    Parameters:
+        preload_tables (bool): Whether to build the eigenvalue tables and load the Heisler tables.
+
+    Returns:
+        tuple: Seconds spent importing and building the tables (None when not built).
+    """
+    start = time.perf_counter()
+    # El servicio importa NumPy y todos los módulos de cálculo
+    from . import convection_service
+    from ..calculations.eigenvalues import eigenvalue_provider
+    from ..calculations.heisler import heisler_tables
+    import_seconds = time.perf_counter() - start
+
+    table_seconds = None
+    if preload_tables:
+        start = time.perf_counter()
+        for geometry in GEOMETRIES:
+            eigenvalue_provider.table(geometry)
+            heisler_tables.load(geometry)
+        table_seconds = time.perf_counter() - start
+    return import_seconds, table_seconds
+
+
+def warm_up(state: WarmupState, preload_tables=WARMUP_TABLES):
+    """
+    Loads the calculation modules and runs one calculation of each geometry, then marks the state
+    as ready.
+
+    Runs outside the event loop: the server accepts requests meanwhile, and the readiness endpoint
+    answers 503 until it finishes. A failure is logged and leaves the state not ready.
+
+    Parameters:
+        state (WarmupState): The state to update.
+        preload_tables (bool): Whether to build the eigenvalue tables.
+    """
+    start = time.perf_counter()
+    try:
+        import_seconds, table_seconds = load_calculations(preload_tables)
+        state.import_seconds = import_seconds
+        state.table_seconds = table_seconds
+
+        from .convection_service import compute_convection_record
+        for geometry in GEOMETRIES:
+            geometry_start = time.perf_counter()
+            # El primer cálculo de cada geometría carga lo que le falta (SciPy, cachés internas)
+            compute_convection_record(ConvectionInput(**WARMUP_INPUT, geometry=geometry)).to_json()
+            state.geometry_seconds[geometry] = time.perf_counter() - geometry_start
+    except Exception as e:
+        logger.exception("Falló el warm-up")
+        state.error = f"{type(e).__name__}: {e}"
+        return
+
+    state.warmup_seconds = time.perf_counter() - start
+    state.ready = True
+    logger.info(
+        "Warm-up terminado en %.3f s (importación %.3f s, tablas %s, geometrías %s)",
+        state.warmup_seconds, import_seconds,
+        f"{table_seconds:.3f} s" if table_seconds is not None else "omitidas",
+        ", ".join(f"{geometry} {seconds:.3f} s"
+                  for geometry, seconds in state.geometry_seconds.items())
+    )
+
+
+def initialize_worker():
+    # Inicializador de los procesos del pool: cada proceso importa y construye sus tablas
+    if WARMUP_ENABLED:
+        load_calculations()
+
+
+warmup_state = WarmupState()
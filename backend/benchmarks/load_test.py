@@ -0,0 +1,392 @@
+# backend/benchmarks/load_test.py
+"""
+Load test of the API under concurrency.
+
+Sends /convection/calculate requests with a configurable mix of plate, cylinder and sphere
+payloads at increasing concurrency levels, and reports for every level the throughput, the
+latency percentiles and the error rate, as a text table and, optionally, as JSON.
+
+The target is the app itself, driven in-process through its ASGI interface (the default), a
+uvicorn server started locally for the test (--uvicorn, with --workers processes), or a server
+already running (--url). The pool settings are the environment variables of the app, so two
+configurations are compared by running the test once with each.
+
+Usage (from the backend directory):
+    python -m benchmarks.load_test --concurrency 1 4 16 64 --requests 2000
+    CALC_POOL_WORKERS=4 python -m benchmarks.load_test --uvicorn --workers 2 --output load.json
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --duration 30
+
+Every worker of a level sends its next request as soon as the previous one is answered (a
+closed loop), so the concurrency is the number of requests in flight. In-process, the client
+shares the event loop with the app, which slightly understates the throughput of a real server.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import httpx
+import numpy as np
+
+GEOMETRIES = ("plate", "cylinder", "sphere")
+DEFAULT_MIX = "plate=1,cylinder=1,sphere=1"
+DEFAULT_CONCURRENCY = (1, 2, 4, 8, 16, 32)
+PERCENTILES = (50, 95, 99)
+# Variables de entorno que definen la configuración medida (se guardan con los resultados)
+SETTINGS_VARIABLES = ("CALC_POOL_KIND", "CALC_POOL_WORKERS", "CALC_POOL_QUEUE_SIZE",
+                      "CALC_POOL_TIMEOUT", "RESULT_CACHE_SIZE", "WARMUP", "WARMUP_TABLES",
+                      "LUMPED_BIOT_THRESHOLD", "RUN_HISTORY_PATH")
+# Segundos máximos de espera hasta que el servidor está listo
+READY_TIMEOUT = 120.0
+
+# Material de referencia, el de run_benchmarks: la convección y el tiempo se ajustan para obtener
+# cada Biot y Fourier
+THICKNESS = 0.04
+CONDUCTIVITY = 60.0
+DIFFUSIVITY = 1.0e-5
+# Rangos de Biot y Fourier de los payloads (uniformes en escala logarítmica)
+BIOT_RANGE = (0.01, 100.0)
+FOURIER_RANGE = (0.01, 2.0)
+
+
+def parse_mix(text):
+    """
+    Parses a mix like 'plate=2,sphere=1' into normalized weights.
+
+    Parameters:
+        text (str): Comma-separated geometry=weight pairs.
+
+    Returns:
+        dict: Weight of every geometry, adding up to 1.
+    """
+    weights = {}
+    for item in text.split(","):
+        geometry, _, weight = item.partition("=")
+        geometry = geometry.strip().lower()
+        if geometry not in GEOMETRIES:
+            raise argparse.ArgumentTypeError(f"unknown geometry '{geometry}'")
+        try:
+            weights[geometry] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight '{weight}'")
+        if weights[geometry] < 0:
+            raise argparse.ArgumentTypeError(f"negative weight for '{geometry}'")
+    total = sum(weights.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError("the mix needs a positive weight")
+    return {geometry: weight / total for geometry, weight in weights.items() if weight > 0}
+
+
+class PayloadGenerator:
+    """
+    Random /convection/calculate payloads with a given geometry mix.
+
+    The Biot and Fourier numbers are drawn log-uniformly from BIOT_RANGE and FOURIER_RANGE, so the
+    requests cover the lumped, short-time, series and one-term paths. With distinct = 0 every
+    payload is new and the result cache never answers; with distinct = n the generator cycles
+    through n payloads, which measures the cached path as well.
+
+    Parameters:
+        mix (dict): Weight of every geometry, adding up to 1.
+        distinct (int): Number of different payloads (0 for all different).
+        seed (int): Seed of the random generator.
+    """
+
+    def __init__(self, mix, distinct=0, seed=0):
+        self.geometries = list(mix)
+        self.weights = np.array([mix[geometry] for geometry in self.geometries])
+        self.distinct = distinct
+        self._rng = np.random.default_rng(seed)
+        self._cycle = [self._new() for _ in range(distinct)]
+        self._index = 0
+
+    def _new(self):
+        geometry = self.geometries[self._rng.choice(len(self.geometries), p=self.weights)]
+        biot = float(np.exp(self._rng.uniform(*np.log(BIOT_RANGE))))
+        fourier = float(np.exp(self._rng.uniform(*np.log(FOURIER_RANGE))))
+        characteristic_length = THICKNESS / 2
+        return geometry, {
+            "thickness": THICKNESS,
+            "thermal_diffusivity": DIFFUSIVITY,
+            "conductivity_coefficient": CONDUCTIVITY,
+            "convection_coefficient": biot * CONDUCTIVITY / characteristic_length,
+            "initial_temperature": 300.0,
+            "ambient_temperature": 20.0,
+            "density": 7800.0,
+            "specific_heat": 460.0,
+            "distance": float(self._rng.uniform(0, characteristic_length)),
+            "time": fourier * characteristic_length ** 2 / DIFFUSIVITY,
+            "iterations": 100,
+            "geometry": geometry,
+        }
+
+    def next(self):
+        if not self.distinct:
+            return self._new()
+        payload = self._cycle[self._index]
+        self._index = (self._index + 1) % self.distinct
+        return payload
+
+
+def summarize(concurrency, seconds, samples):
+    """
+    Summarizes the samples of one concurrency level.
+
+    Parameters:
+        concurrency (int): Requests in flight.
+        seconds (float): Wall time of the level.
+        samples (list): (geometry, status, latency) of every request; status is the HTTP status
+            or the name of the client exception.
+
+    Returns:
+        dict: Requests, errors, throughput, latency statistics (in seconds), the count of every
+            status and the median latency of every geometry.
+    """
+    latencies = np.array([latency for _, _, latency in samples])
+    statuses = Counter(str(status) for _, status, _ in samples)
+    errors = sum(1 for _, status, _ in samples if not isinstance(status, int) or status >= 400)
+    geometries = {}
+    for geometry in sorted({geometry for geometry, _, _ in samples}):
+        values = [latency for name, _, latency in samples if name == geometry]
+        geometries[geometry] = {"requests": len(values), "p50": float(np.median(values))}
+    latency = {"mean": float(latencies.mean()), "max": float(latencies.max())} if samples else {}
+    for percentile in PERCENTILES:
+        latency[f"p{percentile}"] = (float(np.percentile(latencies, percentile))
+                                     if samples else None)
+    return {
+        "concurrency": concurrency,
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "seconds": seconds,
+        "throughput": len(samples) / seconds if seconds > 0 else 0.0,
+        "latency": latency,
+        "statuses": dict(sorted(statuses.items())),
+        "geometries": geometries,
+    }
+
+
+async def run_level(client, endpoint, generator, concurrency, requests=None, duration=None):
+    """
+    Runs one concurrency level: concurrency workers send requests in a closed loop until
+    requests have been sent or duration seconds have passed.
+
+    Parameters:
+        client (httpx.AsyncClient): Client of the target.
+        endpoint (str): Path of the endpoint.
+        generator (PayloadGenerator): Source of the payloads.
+        concurrency (int): Requests in flight.
+        requests (int, optional): Requests to send.
+        duration (float, optional): Seconds to send requests for.
+
+    Returns:
+        dict: The summary of the level.
+    """
+    samples = []
+    sent = 0
+    deadline = None if duration is None else time.perf_counter() + duration
+
+    async def worker():
+        nonlocal sent
+        while True:
+            if requests is not None and sent >= requests:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            sent += 1
+            geometry, payload = generator.next()
+            start = time.perf_counter()
+            try:
+                response = await client.post(endpoint, json=payload)
+                status = response.status_code
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            samples.append((geometry, status, time.perf_counter() - start))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(concurrency, time.perf_counter() - start, samples)
+
+
+async def wait_ready(client, timeout=READY_TIMEOUT):
+    # El servidor responde 503 en /health/ready hasta que termina el warm-up
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"the server was not ready after {timeout:.0f} s")
+        await asyncio.sleep(0.2)
+
+
+async def run_levels(client, args, generator):
+    await wait_ready(client)
+    levels = []
+    for concurrency in args.concurrency:
+        if args.warmup_requests:
+            # Solicitudes previas sin medir: conexiones abiertas y workers calientes
+            await run_level(client, args.endpoint, generator, concurrency,
+                            requests=args.warmup_requests)
+        level = await run_level(client, args.endpoint, generator, concurrency,
+                                requests=args.requests, duration=args.duration)
+        levels.append(level)
+        if not args.quiet:
+            print(format_row(level), flush=True)
+    return levels
+
+
+async def run_in_process(args, generator):
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    # ASGITransport no envía los eventos de lifespan: se ejecuta aquí (warm-up y pools)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test",
+                                     timeout=args.timeout) as client:
+            return await run_levels(client, args, generator)
+
+
+async def run_remote(url, args, generator):
+    limits = httpx.Limits(max_connections=max(args.concurrency),
+                          max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=url, timeout=args.timeout, limits=limits) as client:
+        return await run_levels(client, args, generator)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(port, workers):
+    """
+    Starts uvicorn with the app on 127.0.0.1, from the backend directory and with the environment
+    of this process.
+
+    Returns:
+        subprocess.Popen: The server process.
+    """
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+               "--port", str(port), "--workers", str(workers), "--log-level", "warning"]
+    return subprocess.Popen(command, cwd=backend)
+
+
+def stop_process(process, timeout=10.0):
+    process.terminate()
+    try:
+        process.wait(timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def environment(args):
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "target": args.url or ("uvicorn" if args.uvicorn else "in-process"),
+        "uvicorn_workers": args.workers if args.uvicorn else None,
+        "settings": {name: os.environ[name] for name in SETTINGS_VARIABLES if name in os.environ},
+    }
+
+
+def format_seconds(value):
+    if value is None:
+        return f"{'-':>9}"
+    return f"{value * 1e3:9.2f}"
+
+
+HEADER = (f"{'concurrency':>11} {'requests':>9} {'errors':>8} {'req/s':>10} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+
+
+def format_row(level):
+    latency = level["latency"]
+    return (f"{level['concurrency']:>11} {level['requests']:>9} {level['error_rate']:>8.2%} "
+            f"{level['throughput']:>10.1f} {format_seconds(latency.get('p50'))} "
+            f"{format_seconds(latency.get('p95'))} {format_seconds(latency.get('p99'))} "
+            f"{format_seconds(latency.get('max'))}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="Test a server already running at this URL.")
+    target.add_argument("--uvicorn", action="store_true",
+                        help="Start a local uvicorn server for the test.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="uvicorn worker processes with --uvicorn (default 1).")
+    parser.add_argument("--endpoint", default="/convection/calculate",
+                        help="Path of the endpoint (default /convection/calculate).")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Geometry weights, e.g. plate=2,sphere=1 (default {DEFAULT_MIX}).")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY),
+                        help="Concurrency levels (default 1 2 4 8 16 32).")
+    parser.add_argument("--requests", type=int, default=None,
+                        help="Requests per level (default 500 without --duration).")
+    parser.add_argument("--duration", type=float, default=None, help="Seconds per level.")
+    parser.add_argument("--warmup-requests", type=int, default=20,
+                        help="Unmeasured requests before every level (default 20).")
+    parser.add_argument("--distinct", type=int, default=0,
+                        help="Cycle through this many payloads (default 0: every one is new).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the payloads (default 0).")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="Client timeout in seconds (default 60).")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--quiet", action="store_true", help="Do not print the table.")
+    args = parser.parse_args(argv)
+    if args.requests is None and args.duration is None:
+        args.requests = 500
+    if min(args.concurrency) < 1 or args.workers < 1 or args.distinct < 0:
+        parser.error("--concurrency, --workers and --distinct must be positive")
+
+    # Los logs de cada solicitud distorsionarían los tiempos
+    logging.disable(logging.INFO)
+    generator = PayloadGenerator(args.mix, args.distinct, args.seed)
+    if not args.quiet:
+        print(HEADER, flush=True)
+    if args.url:
+        levels = asyncio.run(run_remote(args.url.rstrip("/"), args, generator))
+    elif args.uvicorn:
+        port = free_port()
+        process = start_uvicorn(port, args.workers)
+        try:
+            levels = asyncio.run(run_remote(f"http://127.0.0.1:{port}", args, generator))
+        finally:
+            stop_process(process)
+    else:
+        levels = asyncio.run(run_in_process(args, generator))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({
+                "environment": environment(args),
+                "endpoint": args.endpoint,
+                "mix": args.mix,
+                "distinct": args.distinct,
+                "levels": levels,
+            }, file, indent=2)
+        if not args.quiet:
+            print(f"{len(levels)} levels written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+# backend/benchmarks/run_benchmarks.py
+"""
+Benchmark suite of the calculation engine.
+
+Times every stage of a convection calculation over a grid of geometries, Biot numbers, Fourier
+numbers and iteration counts, and either stores the results as a JSON baseline or compares them
+against one.
+
+Usage (from the backend directory):
+    python -m benchmarks.run_benchmarks --output benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json --threshold 0.25
+
+In compare mode the exit status is 1 when any case is slower than the baseline by more than the
+threshold (and by more than --min-delta seconds, to ignore noise on very fast stages).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import httpx
+import numpy as np
+import scipy
+
+from app.calculations.convection_calculations import (
+    InitialCalcs,
+    InitialCalcsData,
+    LambdaPlate,
+    LambdaCylinder,
+    LambdaSphere,
+)
+from app.calculations.eigenvalues import eigenvalue_provider
+from app.calculations.series import DEFAULT_ACCURACY, DISPLAY_TERMS, evaluate_series, required_terms
+from app.main import app
+from app.models.convection_models import ConvectionInput
+from app.services.convection_service import (
+    compute_convection_record,
+    perform_convection_calculation
+)
+from app.services.result_cache import result_cache
+
+GEOMETRIES = ("plate", "cylinder", "sphere")
+BIOT_NUMBERS = (0.01, 0.1, 1.0, 10.0, 100.0)
+FOURIER_NUMBERS = (0.01, 0.2, 2.0)
+ITERATIONS = (20, 100)
+STAGES = ("lambda", "series", "record", "service", "http")
+
+LAMBDA_CLASSES = {"plate": LambdaPlate, "cylinder": LambdaCylinder, "sphere": LambdaSphere}
+
+# Material de referencia: la convección y el tiempo se ajustan para obtener cada Biot y Fourier
+THICKNESS = 0.04
+CONDUCTIVITY = 60.0
+DIFFUSIVITY = 1.0e-5
+
+
+def case_input(geometry, biot, fourier, iterations):
+    characteristic_length = THICKNESS / 2
+    return {
+        "thickness": THICKNESS,
+        "thermal_diffusivity": DIFFUSIVITY,
+        "conductivity_coefficient": CONDUCTIVITY,
+        "convection_coefficient": biot * CONDUCTIVITY / characteristic_length,
+        "initial_temperature": 300.0,
+        "ambient_temperature": 20.0,
+        "density": 7800.0,
+        "specific_heat": 460.0,
+        "distance": characteristic_length / 2,
+        "time": fourier * characteristic_length ** 2 / DIFFUSIVITY,
+        "iterations": iterations,
+        "biot": biot,
+        "geometry": geometry,
+    }
+
+
+def case_name(geometry, biot, fourier, iterations, stage):
+    return f"{geometry}/bi={biot:g}/fo={fourier:g}/it={iterations}/{stage}"
+
+
+def summarize(samples):
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "samples": len(samples),
+    }
+
+
+def time_samples(function, repeats, setup=None):
+    # Una llamada por muestra; setup (fuera de la medición) deja el estado igual en cada una
+    samples = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def time_http_samples(client, payload, repeats):
+    samples = []
+    for _ in range(repeats):
+        # Sin la caché de resultados cada solicitud recorre el cálculo completo
+        result_cache.clear()
+        start = time.perf_counter()
+        response = await client.post("/convection/calculate", json=payload)
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+    return samples
+
+
+def run_case(geometry, biot, fourier, iterations, repeats, stages):
+    payload = case_input(geometry, biot, fourier, iterations)
+    input_data = ConvectionInput(**payload)
+    calcs = InitialCalcs(InitialCalcsData(**payload))
+    results = {}
+
+    if "lambda" in stages:
+        # Resolución completa: la caché de valores lambda se vacía antes de cada muestra
+        lambda_class = LAMBDA_CLASSES[geometry]
+        results["lambda"] = time_samples(lambda: lambda_class(biot, iterations), repeats,
+                                         setup=eigenvalue_provider.clear)
+
+    terms = max(int(required_terms(calcs.dimensionless_time, DEFAULT_ACCURACY)), DISPLAY_TERMS)
+    roots = eigenvalue_provider.get(geometry, biot, iterations, count=terms).roots
+
+    if "series" in stages:
+        lambdas = np.array(roots)
+        results["series"] = time_samples(
+            lambda: evaluate_series(geometry, lambdas, calcs.dimensionless_time,
+                                    calcs.dimensionless_distance), repeats)
+
+    if "record" in stages:
+        # Ruta de /convection/calculate: registro compacto escrito directamente a JSON
+        results["record"] = time_samples(lambda: compute_convection_record(input_data).to_json(),
+                                         repeats)
+
+    if "service" in stages:
+        # Con la caché de valores lambda caliente, como en un servidor en marcha
+        results["service"] = time_samples(lambda: perform_convection_calculation(input_data),
+                                          repeats)
+    return payload, results
+
+
+async def run_http_cases(payloads, repeats):
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for name, payload in payloads:
+            results[name] = await time_http_samples(client, payload, repeats)
+    return results
+
+
+def run_suite(repeats, stages, geometries=GEOMETRIES):
+    cases = {}
+    http_payloads = []
+    for geometry in geometries:
+        for biot in BIOT_NUMBERS:
+            for fourier in FOURIER_NUMBERS:
+                for iterations in ITERATIONS:
+                    payload, results = run_case(geometry, biot, fourier, iterations, repeats, stages)
+                    for stage, samples in results.items():
+                        cases[case_name(geometry, biot, fourier, iterations, stage)] = \
+                            summarize(samples)
+                    if "http" in stages:
+                        http_payloads.append(
+                            (case_name(geometry, biot, fourier, iterations, "http"), payload))
+
+    if http_payloads:
+        for name, samples in asyncio.run(run_http_cases(http_payloads, repeats)).items():
+            cases[name] = summarize(samples)
+    return dict(sorted(cases.items()))
+
+
+def environment():
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(baseline, current, threshold, min_delta):
+    """
+    Compares the medians of two runs.
+
+    Parameters:
+        baseline (dict): Cases of the baseline run.
+        current (dict): Cases of the current run.
+        threshold (float): Allowed relative slowdown (0.25 = 25 %).
+        min_delta (float): Slowdowns below this many seconds are never reported.
+
+    Returns:
+        list: (name, baseline median, current median, ratio, regressed) for each common case.
+    """
+    rows = []
+    for name, case in current.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        before = reference["median"]
+        after = case["median"]
+        ratio = after / before if before > 0 else float("inf")
+        regressed = ratio > 1 + threshold and after - before > min_delta
+        rows.append((name, before, after, ratio, regressed))
+    return rows
+
+
+def format_seconds(value):
+    if value < 1e-3:
+        return f"{value * 1e6:9.1f} µs"
+    return f"{value * 1e3:9.2f} ms"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--output", help="Write the results to this JSON baseline.")
+    parser.add_argument("--compare", help="Compare against this JSON baseline.")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative slowdown in compare mode (default 0.25).")
+    parser.add_argument("--min-delta", type=float, default=20e-6,
+                        help="Ignore slowdowns smaller than this many seconds (default 20e-6).")
+    parser.add_argument("--repeats", type=int, default=25, help="Samples per case (default 25).")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES),
+                        help="Stages to time (default all).")
+    parser.add_argument("--geometries", nargs="+", choices=GEOMETRIES, default=list(GEOMETRIES),
+                        help="Geometries to time (default all).")
+    args = parser.parse_args(argv)
+
+    # Los logs de depuración del cálculo distorsionarían los tiempos
+    logging.disable(logging.INFO)
+    cases = run_suite(args.repeats, args.stages, args.geometries)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"environment": environment(), "cases": cases}, file, indent=2)
+        print(f"{len(cases)} cases written to {args.output}")
+
+    if not args.compare:
+        if not args.output:
+            for name, case in cases.items():
+                print(f"{name:48} {format_seconds(case['median'])}")
+        return 0
+
+    with open(args.compare, encoding="utf-8") as file:
+        baseline = json.load(file)["cases"]
+    rows = compare(baseline, cases, args.threshold, args.min_delta)
+    regressions = [row for row in rows if row[4]]
+    for name, before, after, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:48} {format_seconds(before)} -> {format_seconds(after)}  x{ratio:5.2f}{flag}")
+    print(f"{len(rows)} cases compared, {len(regressions)} regressions "
+          f"(threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+# backend/tests/test_batch_calculations.py
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.calculations.batch_calculations import BatchArrays, evaluate_batch
+from app.calculations.series import DISPLAY_TERMS
+
+
+def _arrays(time, geometry_size=0.1):
+    count = len(time)
+
+    def column(value):
+        return np.full(count, value, dtype=float)
+
+    return BatchArrays(
+        thickness=column(geometry_size), thermal_diffusivity=column(np.nan),
+        conductivity_coefficient=column(20.0), convection_coefficient=column(100.0),
+        initial_temperature=column(300.0), ambient_temperature=column(20.0),
+        density=column(7800.0), specific_heat=column(460.0), distance=column(0.02),
+        time=np.array(time, dtype=float), iterations=np.full(count, 100, dtype=np.int64),
+        biot=column(np.nan), absolute_tolerance=column(np.nan), relative_tolerance=column(np.nan),
+        accuracy=column(np.nan))
+
+
+def test_start_rows_do_not_raise_the_terms_of_the_group():
+    output = evaluate_batch(_arrays([0.0, 600.0, 6000.0]), "cylinder")
+    # Con Fo ≈ 13 basta el primer término
+    assert output.terms.tolist() == [DISPLAY_TERMS, DISPLAY_TERMS, 1]
+    assert output.tem[0] == 300.0
+    assert output.q[0] == 0.0
+    assert output.truncation_error[0] == 0.0
+    assert output.lambdas.shape[1] == DISPLAY_TERMS
+
+
+def test_rows_sum_their_own_terms():
+    output = evaluate_batch(_arrays([5.0, 600.0]), "cylinder")
+    assert output.terms[0] > output.terms[1] == DISPLAY_TERMS
+    assert np.isnan(output.lambdas[1, DISPLAY_TERMS:]).all()
+    assert (output.truncation_error <= 1e-8).all()
+
+
+def test_negative_time_is_invalid():
+    output = evaluate_batch(_arrays([-1.0, 600.0]), "plate")
+    assert np.isnan(output.tem[0])
+    assert np.isfinite(output.tem[1])
+
+
+@pytest.mark.parametrize("geometry", ["plate", "cylinder", "sphere"])
+def test_one_term_rows_match_calculate(geometry):
+    output = evaluate_batch(_arrays([600.0, 2000.0]), geometry)
+    assert output.model.tolist() == ["series", "one_term"]
+    assert output.terms.tolist() == [DISPLAY_TERMS, 1]
+    assert np.isfinite(output.value_a[1, 0]) and np.isnan(output.value_a[1, 1:]).all()
+
+    # La misma entrada da la misma respuesta en /calculate y en /calculate/batch
+    row = {"thickness": 0.1, "conductivity_coefficient": 20.0, "convection_coefficient": 100.0,
+           "initial_temperature": 300.0, "ambient_temperature": 20.0, "density": 7800.0,
+           "specific_heat": 460.0, "distance": 0.02, "time": 2000.0, "iterations": 100,
+           "geometry": geometry, "allow_lumped": False}
+    client = TestClient(app)
+    single = client.post("/convection/calculate", json=row).json()["data"]
+    batch = client.post("/convection/calculate/batch", json=[row]).json()["data"][0]["data"]
+    assert single["model"] == "one_term"
+    # q_max del cilindro y la esfera se calcula en otro orden y puede diferir en el último bit
+    for name in ("q_max", "q"):
+        assert batch.pop(name) == pytest.approx(single.pop(name), rel=1e-14)
+    assert batch == single
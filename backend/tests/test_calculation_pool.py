@@ -0,0 +1,128 @@
+# backend/tests/test_calculation_pool.py
+
+import asyncio
+import json
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.calculation_pool import (
+    CalculationPool,
+    PoolFullError,
+    PoolTimeoutError,
+    calculation_pool
+)
+from app.services import convection_service
+from app.services.metrics import errors_total
+from app.services.result_cache import result_cache
+
+INPUT = {"thickness": 0.1, "conductivity_coefficient": 20.0, "convection_coefficient": 100.0,
+         "initial_temperature": 300.0, "ambient_temperature": 20.0, "density": 7800.0,
+         "specific_heat": 460.0, "distance": 0.02, "time": 600.0, "iterations": 100,
+         "geometry": "plate"}
+
+
+def test_full_pool_rejects_at_once():
+    pool = CalculationPool(workers=1, queue_size=0, timeout=5)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(PoolFullError):
+            await pool.run(sum, [1, 2])
+        release.set()
+        assert await running is True
+        # El trabajo terminado libera su lugar
+        assert await pool.run(sum, [1, 2]) == 3
+
+    asyncio.run(scenario())
+    assert pool.rejected == 1
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_slow_job_times_out_and_keeps_counting():
+    pool = CalculationPool(workers=1, queue_size=0, timeout=0.05)
+    release = threading.Event()
+
+    async def scenario():
+        with pytest.raises(PoolTimeoutError):
+            await pool.run(release.wait)
+        # El trabajo sigue ocupando el worker hasta que termina de verdad
+        assert pool.pending == 1
+        with pytest.raises(PoolFullError):
+            await pool.run(sum, [1])
+        release.set()
+        while pool.pending:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+    assert pool.timeouts == 1
+    pool.shutdown()
+
+
+@pytest.mark.parametrize("error, status", [(PoolFullError, 503), (PoolTimeoutError, 504)])
+def test_calculate_maps_pool_errors(monkeypatch, error, status):
+    async def run(function, *args):
+        raise error()
+
+    result_cache.clear()
+    monkeypatch.setattr(calculation_pool, "run", run)
+    response = TestClient(app).post("/convection/calculate", json=INPUT)
+    assert response.status_code == status
+    if status == 503:
+        assert response.headers["Retry-After"] == str(calculation_pool.retry_after)
+
+
+FIELD_INPUT = {**{key: value for key, value in INPUT.items() if key not in ("distance", "time")},
+               "distances": [0.0, 0.05], "time_range": {"start": 0.0, "stop": 600.0, "points": 4}}
+
+
+@pytest.mark.parametrize("error, status", [(PoolFullError, 503), (PoolTimeoutError, 504)])
+def test_field_stream_setup_maps_pool_errors(monkeypatch, error, status):
+    async def run(function, *args):
+        raise error()
+
+    monkeypatch.setattr(calculation_pool, "run", run)
+    response = TestClient(app).post("/convection/field/stream", json=FIELD_INPUT)
+    assert response.status_code == status
+
+
+def test_field_stream_chunks_go_through_the_pool(monkeypatch):
+    calls = []
+    original = calculation_pool.run
+
+    async def run(function, *args):
+        calls.append(function.__name__)
+        # El segundo bloque encuentra el pool lleno
+        if calls.count("encode_field_chunk") == 2:
+            raise PoolFullError()
+        return await original(function, *args)
+
+    monkeypatch.setattr(calculation_pool, "run", run)
+    response = TestClient(app).post("/convection/field/stream?chunk_size=2", json=FIELD_INPUT)
+    assert response.status_code == 200
+    events = [line for line in response.text.splitlines() if line]
+    assert calls == ["prepare_field_stream", "encode_field_chunk", "encode_field_chunk"]
+    assert [json.loads(line)["event"] for line in events] == ["header", "chunk", "error"]
+
+
+def _errors(endpoint, error):
+    # Valor del contador de errores en /metrics
+    line = f'convection_errors_total{{endpoint="{endpoint}",error="{error}"}} '
+    values = [float(text[len(line):]) for text in errors_total.render() if text.startswith(line)]
+    return values[0] if values else 0.0
+
+
+def test_field_stream_failure_is_logged_and_counted(monkeypatch, caplog):
+    def fail(context, times, stream_format):
+        raise RuntimeError("fallo")
+
+    monkeypatch.setattr(convection_service, "encode_field_chunk", fail)
+    before = _errors("field/stream", "RuntimeError")
+    response = TestClient(app).post("/convection/field/stream", json=FIELD_INPUT)
+    events = [json.loads(line)["event"] for line in response.text.splitlines() if line]
+    assert events == ["header", "error"]
+    assert _errors("field/stream", "RuntimeError") == before + 1
+    assert "Error en el campo de temperaturas por streaming" in caplog.text
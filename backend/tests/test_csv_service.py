@@ -0,0 +1,113 @@
+# backend/tests/test_csv_service.py
+
+import csv
+import io
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.convection_models import ConvectionInput
+from app.services.convection_service import compute_convection_record
+from app.services.csv_service import OUTPUT_COLUMNS, _cell, _header_columns, evaluate_csv_chunk
+
+HEADER = ("geometry,thickness,conductivity_coefficient,convection_coefficient,initial_temperature,"
+          "ambient_temperature,density,specific_heat,distance,time,iterations,accuracy")
+ROW = "plate,0.1,20,100,300,20,7800,460,0.02,600,100,"
+INPUT = dict(geometry="plate", thickness=0.1, conductivity_coefficient=20.0,
+             convection_coefficient=100.0, initial_temperature=300.0, ambient_temperature=20.0,
+             density=7800.0, specific_heat=460.0, distance=0.02, time=600.0, iterations=100,
+             allow_lumped=False)
+
+
+def _post(text, **params):
+    return TestClient(app).post("/convection/calculate/csv", content=text.encode(),
+                                headers={"Content-Type": "text/csv"}, params=params)
+
+
+def _rows(text):
+    # Filas de resultados (sin la línea de resumen), leídas con el módulo csv
+    lines = [line for line in text.splitlines() if not line.startswith("#")]
+    return list(csv.DictReader(io.StringIO("\n".join(lines))))
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("plate", "plate"),
+    ("a,b", '"a,b"'),
+    ('dice "hola"', '"dice ""hola"""'),
+    ("dos\nlíneas", '"dos\nlíneas"'),
+])
+def test_cell_quotes_only_when_needed(value, expected):
+    assert _cell(value) == expected
+    # csv.reader devuelve el valor original
+    assert next(csv.reader(io.StringIO(expected))) == [value]
+
+
+def test_rows_match_calculate_and_errors_are_per_row():
+    text = "\n".join([
+        HEADER,
+        ROW,
+        "plate,0.1,20,100,300,20",
+        "plate,0.1,abc,100,300,20,7800,460,0.02,600,100,",
+        '"cu,be",0.1,20,100,300,20,7800,460,0.02,600,100,',
+        "",
+        "sphere,0.1,20,100,300,20,7800,460,0.02,600,100,1e-6",
+    ]) + "\n"
+    response = _post(text)
+    assert response.status_code == 200
+    rows = _rows(response.text)
+    assert list(rows[0]) == list(OUTPUT_COLUMNS)
+    # Las líneas vacías se saltan, pero los números de línea son los del archivo
+    assert [row["line"] for row in rows] == ["2", "3", "4", "5", "7"]
+
+    expected = compute_convection_record(ConvectionInput(**INPUT)).to_dict()
+    assert float(rows[0]["tem"]) == pytest.approx(expected["tem"], abs=1e-6)
+    assert float(rows[0]["biot"]) == pytest.approx(expected["biot"])
+    assert rows[0]["error"] == ""
+    # Columna opcional vacía (precisión por defecto) o con valor
+    assert rows[0]["model"] == expected["model"]
+    assert rows[4]["geometry"] == "sphere" and rows[4]["error"] == ""
+
+    assert rows[1]["error"] == "Error: la fila tiene 6 columnas"
+    assert rows[2]["error"] == "Error: valor no válido en 'conductivity_coefficient'"
+    assert rows[3]["geometry"] == "cu,be"
+    assert rows[3]["error"] == "Error: geometría incorrecta"
+    # Las filas con error solo conservan la línea, la geometría y el mensaje
+    for row in rows[1:4]:
+        assert all(row[name] == "" for name in OUTPUT_COLUMNS[2:-1])
+
+    summary = response.text.splitlines()[-1]
+    assert summary.startswith("# rows=5 errors=3 seconds=")
+    assert "rows_per_second=" in summary
+
+
+@pytest.mark.parametrize("row, error", [(ROW, None), ("cylinder,0.1,-20", "columnas")])
+def test_one_row_chunk(row, error):
+    columns = _header_columns(HEADER.split(","))
+    text, errors = evaluate_csv_chunk(columns, [2], [row.split(",")])
+    cells = next(csv.reader(io.StringIO(text)))
+    assert len(text.splitlines()) == 1
+    assert len(cells) == len(OUTPUT_COLUMNS)
+    assert cells[0] == "2"
+    assert errors == (0 if error is None else 1)
+    if error is None:
+        assert cells[-1] == "" and float(cells[OUTPUT_COLUMNS.index("tem")]) > 20
+    else:
+        assert error in cells[-1]
+
+
+def test_chunks_keep_the_order_of_the_file():
+    text = HEADER + "\n" + "\n".join(ROW.replace("600", str(100 * (i + 1))) for i in range(5)) + "\n"
+    rows = _rows(_post(text, chunk_size=1).text)
+    assert [row["line"] for row in rows] == ["2", "3", "4", "5", "6"]
+    temperatures = [float(row["tem"]) for row in rows]
+    assert temperatures == sorted(temperatures, reverse=True)
+
+
+@pytest.mark.parametrize("text, detail", [
+    ("", "vacío"),
+    (HEADER + ",thickness\n" + ROW + "0.1\n", "columnas repetidas en el CSV: thickness"),
+    (HEADER.replace(",time", "") + "\n", "faltan columnas en el CSV: time"),
+])
+def test_header_errors(text, detail):
+    response = _post(text)
+    assert response.status_code == 400
+    assert detail in response.json()["detail"]
@@ -0,0 +1,43 @@
+# backend/tests/test_eigenvalues.py
+
+import math
+import numpy as np
+import pytest
+from scipy.optimize import brentq
+from app.calculations.eigenvalues import EigenvalueProvider, solve_eigenvalues
+
+
+def test_get_many_shares_the_cache_with_get():
+    provider = EigenvalueProvider()
+    single = provider.get("plate", 0.5, count=5)
+    solution = provider.get_many("plate", np.array([0.5, 2.0, 0.5]), count=5)
+
+    assert np.array_equal(solution.roots[0], single.roots)
+    assert np.array_equal(solution.roots[2], single.roots)
+    # 0.5 se sirve de la caché dos veces; 2.0 se resuelve y se guarda
+    assert provider.stats()["hits"] == 2
+    assert provider.stats()["misses"] == 2
+    assert provider.get("plate", 2.0, count=5).roots == tuple(solution.roots[1].tolist())
+    assert provider.stats()["hits"] == 3
+
+
+def test_get_many_does_not_store_invalid_biot():
+    provider = EigenvalueProvider()
+    provider.get_many("sphere", np.array([np.nan, 1.0]))
+    assert provider.stats()["size"] == 1
+
+
+@pytest.mark.parametrize("biot", [1e-4, 0.1, 1.0, 10.0, 1e3])
+def test_sphere_roots_match_brentq(biot):
+    count = 20
+    roots = solve_eigenvalues("sphere", biot, count).roots
+
+    # Referencia: 1 - lambda * cot(lambda) = Bi sin polos, una raíz en cada ((n - 1) pi, n pi)
+    def characteristic(lam):
+        return (1 - biot) * math.sin(lam) - lam * math.cos(lam)
+
+    for n in range(1, count + 1):
+        lower = 1e-9 if n == 1 else (n - 1) * math.pi
+        expected = brentq(characteristic, lower, n * math.pi, xtol=1e-15,
+                          rtol=4 * np.finfo(float).eps)
+        assert roots[n - 1] == pytest.approx(expected, rel=1e-12, abs=1e-14)
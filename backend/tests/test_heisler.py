@@ -0,0 +1,101 @@
+# backend/tests/test_heisler.py
+
+import json
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.calculations import heisler
+from app.calculations.heisler import ONE_TERM_FOURIER, HeislerTables
+from app.services.heisler_service import exact_point
+
+# Error de la interpolación en el centro: cúbica cercana a 1e-8 y bilineal a 1e-4 (README)
+TOLERANCE = {"cubic": 1e-7, "linear": 2e-4}
+# Fuera del centro domina la corrección de posición del primer término de las cartas: desde
+# Fo = ONE_TERM_FOURIER el error absoluto en theta es menor que 0.03 (el mayor, 0.027, en la placa
+# con Fo = 0.2, Bi ≈ 1.8 y x ≈ 0.8)
+POSITION_TOLERANCE = 0.03
+
+
+@pytest.fixture(scope="module")
+def tables(tmp_path_factory):
+    return HeislerTables(str(tmp_path_factory.mktemp("heisler")))
+
+
+@pytest.mark.parametrize("geometry", ["plate", "cylinder", "sphere"])
+@pytest.mark.parametrize("method", ["linear", "cubic"])
+def test_center_matches_exact_solution(tables, geometry, method):
+    rng = np.random.default_rng(1)
+    biot = 10 ** rng.uniform(-3, 3, 100)
+    fourier = 10 ** rng.uniform(-3, 3, 100)
+    values = tables.lookup(geometry, biot, fourier, np.zeros(100), method)
+    exact = np.array([exact_point(geometry, *point, 0.0) for point in zip(biot, fourier)])
+    assert values["on_grid"].all()
+    assert np.abs(values["theta_o"] - exact[:, 0]).max() < TOLERANCE[method]
+    assert np.abs(values["heat_ratio"] - exact[:, 2]).max() < TOLERANCE[method]
+
+    # La consulta de un punto da lo mismo que la vectorizada
+    point = tables.lookup_point(geometry, biot[0], fourier[0], 0.0, method)
+    assert point["theta_o"] == pytest.approx(values["theta_o"][0], rel=1e-12)
+
+
+@pytest.mark.parametrize("geometry", ["plate", "cylinder", "sphere"])
+def test_position_correction_within_chart_error(tables, geometry):
+    # El peor caso es el menor número de Fourier de la malla
+    log_biot, distance = np.meshgrid(np.linspace(-3, 3, 61), np.linspace(0, 1, 21))
+    biot, distance = 10 ** log_biot.ravel(), distance.ravel()
+    fourier = np.full(biot.size, ONE_TERM_FOURIER)
+    values = tables.lookup(geometry, biot, fourier, distance, "cubic")
+    exact = np.array([exact_point(geometry, *point)[1]
+                      for point in zip(biot, fourier, distance)])
+    assert values["on_grid"].all()
+    assert np.abs(values["theta"] - exact).max() < POSITION_TOLERANCE
+
+
+def test_off_grid_points_are_null_or_exact():
+    points = {"geometry": "plate", "biot": [1.0, 1e4, 1.0, 1.0],
+              "fourier": [0.5, 0.5, 1e-4, 0.1], "distance": [0.5, 0.0, 0.0, 0.5]}
+    client = TestClient(app)
+    data = client.post("/convection/heisler", json=points).json()["data"]
+    # Biot fuera de la malla, Fourier fuera de la malla y Fo < 0.2 fuera del centro
+    assert data["source"] == ["table", "off_grid", "off_grid", "off_grid"]
+    assert data["theta"][0] is not None
+    assert data["theta_o"][1:] == [None] * 3 and data["heat_ratio"][1:] == [None] * 3
+
+    data = client.post("/convection/heisler", json={**points, "exact_fallback": True}).json()["data"]
+    assert data["source"] == ["table", "exact", "exact", "exact"]
+    for index in range(1, 4):
+        expected = exact_point("plate", points["biot"][index], points["fourier"][index],
+                               points["distance"][index])
+        assert [data["theta_o"][index], data["theta"][index], data["heat_ratio"][index]] == \
+            pytest.approx(list(expected), abs=1e-12)
+
+
+def test_invalid_lookup_is_rejected():
+    response = TestClient(app).post("/convection/heisler", json={
+        "geometry": "plate", "biot": [1.0, 2.0], "fourier": [0.5, 0.6, 0.7]})
+    assert response.status_code == 400
+
+
+def test_outdated_tables_are_rebuilt(tmp_path, monkeypatch):
+    builds = []
+
+    def build_tables(geometry):
+        # Tablas pequeñas: solo importa cuándo se construyen
+        builds.append(geometry)
+        return {name: np.ones((4, 4)) for name in heisler.TABLE_NAMES}
+
+    monkeypatch.setattr(heisler, "build_tables", build_tables)
+    HeislerTables(str(tmp_path)).load("plate")
+    assert len(builds) == 3
+
+    # Otro proceso con las mismas tablas no las reconstruye
+    HeislerTables(str(tmp_path)).load("sphere")
+    assert len(builds) == 3
+
+    # Una malla o una versión distinta en metadata.json las reconstruye
+    metadata = json.loads((tmp_path / "metadata.json").read_text())
+    (tmp_path / "metadata.json").write_text(json.dumps({**metadata, "version": -1}))
+    HeislerTables(str(tmp_path)).load("plate")
+    assert len(builds) == 6
+    assert json.loads((tmp_path / "metadata.json").read_text()) == metadata
@@ -0,0 +1,72 @@
+# backend/tests/test_inverse.py
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.convection_models import ConvectionInput
+from app.models.inverse_models import TimeToTemperatureInput
+from app.services.convection_service import compute_convection_record, perform_time_to_temperature
+
+MATERIAL = dict(thickness=0.1, conductivity_coefficient=20.0, convection_coefficient=100.0,
+                initial_temperature=300.0, ambient_temperature=20.0, density=7800.0,
+                specific_heat=460.0, iterations=100)
+# Diferencia máxima entre la temperatura objetivo y la de /calculate en el tiempo encontrado (K)
+TOLERANCE = 1e-7
+
+
+def _temperature(material, geometry, distance, time):
+    # La misma entrada en /calculate, con la serie (el tiempo inverso no usa el modelo concentrado)
+    return compute_convection_record(ConvectionInput(
+        **material, geometry=geometry, distance=distance, time=time,
+        allow_lumped=False)).to_dict()["tem"]
+
+
+@pytest.mark.parametrize("geometry", ["plate", "cylinder", "sphere"])
+def test_crossings_round_trip_through_calculate(geometry):
+    rng = np.random.default_rng({"plate": 1, "cylinder": 2, "sphere": 3}[geometry])
+    for _ in range(20):
+        thickness = rng.uniform(0.01, 0.2)
+        material = {**MATERIAL, "thickness": thickness,
+                    "conductivity_coefficient": rng.uniform(5, 400),
+                    "convection_coefficient": 10 ** rng.uniform(0.5, 4)}
+        distance = rng.uniform(0, 1) * thickness / 2
+        targets = rng.uniform(21, 299, 3).tolist()
+        result = perform_time_to_temperature(TimeToTemperatureInput(
+            **material, geometry=geometry, distance=distance, target_temperature=targets))
+        for crossing in result["crossings"]:
+            assert crossing["error"] is None
+            assert crossing["time"] > 0
+            assert _temperature(material, geometry, distance, crossing["time"]) == \
+                pytest.approx(crossing["target_temperature"], abs=TOLERANCE)
+
+
+def test_targets_outside_the_range_are_errors():
+    response = TestClient(app).post("/convection/time-to-temperature", json={
+        **MATERIAL, "geometry": "plate", "distance": 0.02,
+        "target_temperature": [350.0, 10.0, 20.0, 300.0, 150.0]})
+    assert response.status_code == 200
+    crossings = response.json()["data"]["crossings"]
+    # Por encima de la inicial, por debajo de la ambiente y la ambiente misma (nunca se alcanza)
+    for crossing in crossings[:3]:
+        assert crossing["time"] is None and crossing["fourier"] is None
+        assert "no está entre la temperatura inicial y la ambiente" in crossing["error"]
+    # La temperatura inicial se tiene desde el principio
+    assert crossings[3]["error"] is None and crossings[3]["time"] == 0
+    assert crossings[4]["error"] is None and crossings[4]["time"] > 0
+
+
+@pytest.mark.parametrize("geometry", ["plate", "sphere"])
+def test_short_time_targets_use_the_semi_infinite_solution(geometry):
+    # Cerca de la superficie la temperatura baja antes de que la serie converja con pocos términos
+    distance = 0.049
+    result = perform_time_to_temperature(TimeToTemperatureInput(
+        **MATERIAL, geometry=geometry, distance=distance, target_temperature=290.0))
+    crossing = result["crossings"][0]
+    assert crossing["model"] == "semi_infinite"
+    assert 0 < crossing["model_error"] < 1e-8
+    assert crossing["fourier"] < 0.05
+    record = compute_convection_record(ConvectionInput(
+        **MATERIAL, geometry=geometry, distance=distance, time=crossing["time"])).to_dict()
+    assert record["model"] == "semi_infinite"
+    assert record["tem"] == pytest.approx(290.0, abs=TOLERANCE)
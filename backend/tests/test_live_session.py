@@ -0,0 +1,84 @@
+# backend/tests/test_live_session.py
+
+import asyncio
+import json
+from app.services import live_session
+from app.services.live_session import LiveSession
+
+INPUT = {"thickness": 0.1, "conductivity_coefficient": 20.0, "convection_coefficient": 100.0,
+         "initial_temperature": 300.0, "ambient_temperature": 20.0, "density": 7800.0,
+         "specific_heat": 460.0, "distance": 0.02, "time": 600.0, "iterations": 100,
+         "geometry": "plate"}
+
+
+def _update(**values):
+    return json.dumps({"type": "update", "input": values})
+
+
+def test_updates_during_a_calculation_are_coalesced(monkeypatch):
+    computed_times = []
+    release = asyncio.Event()
+
+    async def fake_compute_body(input_data):
+        computed_times.append(input_data.time)
+        # El primer cálculo queda bloqueado hasta que llegan las demás actualizaciones
+        if len(computed_times) == 1:
+            await release.wait()
+        return json.dumps({"message": "Success", "data": {"time": input_data.time}}).encode()
+
+    monkeypatch.setattr(live_session, "compute_body", fake_compute_body)
+    sent = []
+
+    async def send(text):
+        sent.append(json.loads(text))
+
+    async def scenario():
+        session = LiveSession(send)
+        loop = asyncio.ensure_future(session.run())
+        await session.receive(_update(**INPUT))
+        while not computed_times:
+            await asyncio.sleep(0)
+        # Cuatro movimientos del deslizador mientras se calcula la versión 1
+        for time in (700.0, 800.0, 900.0, 1000.0):
+            await session.receive(_update(time=time))
+        release.set()
+        while len(sent) < 2:
+            await asyncio.sleep(0)
+        loop.cancel()
+        return session
+
+    session = asyncio.run(scenario())
+    # Solo se calculan el estado en curso y el último
+    assert computed_times == [600.0, 1000.0]
+    assert session.version == 5
+    assert session.computed == 2
+    assert session.coalesced == 3
+
+    first, last = sent
+    assert first["type"] == "result" and first["version"] == 1
+    assert first["latest"] is False and first["coalesced"] == 0
+    assert first["data"] == {"time": 600.0}
+    assert last["type"] == "result" and last["version"] == 5
+    assert last["latest"] is True and last["coalesced"] == 3
+    assert last["data"] == {"time": 1000.0}
+
+
+def test_invalid_update_is_answered_without_computing(monkeypatch):
+    async def fake_compute_body(input_data):
+        raise AssertionError("no debe calcularse")
+
+    monkeypatch.setattr(live_session, "compute_body", fake_compute_body)
+    sent = []
+
+    async def send(text):
+        sent.append(json.loads(text))
+
+    async def scenario():
+        session = LiveSession(send)
+        await session.receive(_update(unknown_field=1.0))
+        return session
+
+    session = asyncio.run(scenario())
+    assert session.version == 0
+    assert sent[0]["type"] == "error"
+    assert "unknown_field" in sent[0]["detail"]
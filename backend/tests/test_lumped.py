@@ -0,0 +1,34 @@
+# backend/tests/test_lumped.py
+
+import pytest
+from app.models.convection_models import ConvectionInput
+from app.services.convection_service import LUMPED_BIOT_THRESHOLD, compute_convection_record
+
+# Aluminio con convección débil: Bi = 10 * 0.05 / 200 = 0.0025
+MATERIAL = dict(thickness=0.1, conductivity_coefficient=200.0, convection_coefficient=10.0,
+                initial_temperature=300.0, ambient_temperature=20.0, density=2700.0,
+                specific_heat=900.0, distance=0.02, time=3600.0, iterations=100)
+
+
+def _record(geometry, **kwargs):
+    return compute_convection_record(ConvectionInput(**{**MATERIAL, **kwargs},
+                                                     geometry=geometry)).to_dict()
+
+
+@pytest.mark.parametrize("geometry", ["plate", "cylinder", "sphere"])
+def test_small_biot_uses_the_lumped_model(geometry):
+    lumped = _record(geometry)
+    assert lumped["biot"] < LUMPED_BIOT_THRESHOLD
+    assert lumped["model"] == "lumped"
+    assert lumped["lamb"] is None and lumped["calc1"] is None
+
+    series = _record(geometry, allow_lumped=False)
+    assert series["model"] in ("series", "one_term")
+    # La estimación del error cubre la diferencia con la serie
+    assert abs(lumped["value_theta"] - series["value_theta"]) <= lumped["model_error"]
+    assert abs(lumped["value_q"] - series["value_q"]) <= lumped["model_error"]
+    assert lumped["model_error"] < 1e-2
+
+
+def test_large_biot_uses_the_series():
+    assert _record("plate", convection_coefficient=2000.0)["model"] in ("series", "one_term")
@@ -0,0 +1,45 @@
+# backend/tests/test_numerical.py
+
+import numpy as np
+import pytest
+from app.models.convection_models import GEOMETRIES
+from app.models.field_models import FieldInput
+from app.models.numerical_models import NumericalInput
+from app.services.convection_service import perform_field_calculation
+from app.services.numerical_service import perform_numerical_calculation
+
+MATERIAL = dict(thickness=0.1, conductivity_coefficient=20.0, convection_coefficient=100.0,
+                initial_temperature=300.0, ambient_temperature=20.0, density=7800.0,
+                specific_heat=460.0)
+DISTANCES = [0.0, 0.025, 0.05]
+TIMES = [60.0, 300.0, 1200.0]
+# Diferencia máxima con la serie en theta y en Q / Qmax con 401 nodos y 800 pasos
+TOLERANCE = 1e-5
+
+
+def _difference(geometry, nodes, steps):
+    numerical = perform_numerical_calculation(NumericalInput(
+        **MATERIAL, geometry=geometry, distances=DISTANCES, times=TIMES, nodes=nodes,
+        time_step=TIMES[-1] / steps))
+    series = perform_field_calculation(FieldInput(
+        **MATERIAL, geometry=geometry, distances=DISTANCES, times=TIMES, iterations=100))
+    difference = MATERIAL["initial_temperature"] - MATERIAL["ambient_temperature"]
+    theta = np.abs(np.array(numerical["temperature"]) -
+                   np.array(series["temperature"])).max() / difference
+    heat_ratio = np.abs(np.array(numerical["heat_ratio"]) - np.array(series["heat_ratio"])).max()
+    return theta, heat_ratio
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES)
+def test_crank_nicolson_matches_the_series(geometry):
+    theta, heat_ratio = _difference(geometry, 401, 800)
+    assert theta < TOLERANCE
+    assert heat_ratio < TOLERANCE
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES)
+def test_crank_nicolson_is_second_order(geometry):
+    coarse, _ = _difference(geometry, 101, 200)
+    fine, _ = _difference(geometry, 201, 400)
+    # Con la mitad de malla y de paso la diferencia baja unas cuatro veces
+    assert coarse / fine > 3.5
@@ -0,0 +1,43 @@
+# backend/tests/test_result_cache.py
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.services.calculation_pool import calculation_pool
+from app.services.result_cache import result_cache
+
+INPUT = {"thickness": 0.1, "conductivity_coefficient": 20.0, "convection_coefficient": 100.0,
+         "initial_temperature": 300.0, "ambient_temperature": 20.0, "density": 7800.0,
+         "specific_heat": 460.0, "distance": 0.02, "time": 600.0, "iterations": 100,
+         "geometry": "plate"}
+
+
+def test_matching_if_none_match_returns_304_without_calculating(monkeypatch):
+    result_cache.clear()
+    client = TestClient(app)
+    first = client.post("/convection/calculate", json=INPUT)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    async def run(function, *args):
+        raise AssertionError("no debe calcularse")
+
+    monkeypatch.setattr(calculation_pool, "run", run)
+    not_modified = client.post("/convection/calculate", json=INPUT,
+                               headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.content == b""
+    assert result_cache.stats()["not_modified"] == 1
+
+    # Una entrada equivalente (geometría en mayúsculas, enteros) comparte el ETag
+    equivalent = {**INPUT, "geometry": "PLATE", "time": 600}
+    assert client.post("/convection/calculate", json=equivalent,
+                       headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_other_etag_returns_the_result():
+    result_cache.clear()
+    client = TestClient(app)
+    response = client.post("/convection/calculate", json=INPUT, headers={"If-None-Match": '"x"'})
+    assert response.status_code == 200
+    assert response.json()["data"]["geometry"] == "plate"
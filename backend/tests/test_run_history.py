@@ -0,0 +1,84 @@
+# backend/tests/test_run_history.py
+
+import sqlite3
+from app.services.run_history import RunEntry, RunHistory
+
+
+def _entry(input_hash, geometry="plate", time=10.0, body=b'{"message":"Success","data":{}}'):
+    return RunEntry(input_hash=input_hash, created_at=0.0, geometry=geometry, time=time,
+                    distance=0.0, biot=1.0, input="{}", body=body)
+
+
+def _history(path, **kwargs):
+    return RunHistory(str(path), flush_interval=0.01, **kwargs)
+
+
+def test_lookup_returns_latest_body(tmp_path):
+    history = _history(tmp_path / "runs.db")
+    history.record(_entry("abc", body=b'{"v":1}'))
+    history.record(_entry("abc", body=b'{"v":2}'))
+    history.shutdown()
+    assert history.lookup("abc") == b'{"v":2}'
+    assert history.lookup("missing") is None
+
+
+def test_result_version_bump_misses(tmp_path):
+    path = tmp_path / "runs.db"
+    old = _history(path, result_version="1")
+    old.record(_entry("abc"))
+    old.shutdown()
+    assert old.lookup("abc") is not None
+
+    # El mismo archivo después de un despliegue que cambia los resultados
+    new = _history(path, result_version="2")
+    assert new.lookup("abc") is None
+    new.record(_entry("abc", body=b'{"v":"new"}'))
+    new.shutdown()
+    assert new.lookup("abc") == b'{"v":"new"}'
+
+
+def test_rows_without_version_are_not_served(tmp_path):
+    path = tmp_path / "runs.db"
+    # Base creada antes de la columna result_version
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, input_hash TEXT NOT NULL, "
+        "created_at REAL NOT NULL, geometry TEXT NOT NULL, time REAL, distance REAL, biot REAL, "
+        "input TEXT NOT NULL, body BLOB NOT NULL)")
+    connection.execute("INSERT INTO runs (input_hash, created_at, geometry, input, body) "
+                       "VALUES ('abc', 0, 'plate', '{}', ?)", (b'{"data":{}}',))
+    connection.commit()
+    connection.close()
+
+    history = _history(path)
+    assert history.lookup("abc") is None
+    assert history.get(1)["input_hash"] == "abc"
+
+
+def test_keyset_pagination_walks_all_runs(tmp_path):
+    history = _history(tmp_path / "runs.db")
+    for i in range(7):
+        history.record(_entry(f"h{i}", geometry="plate" if i % 2 else "sphere", time=float(i)))
+    history.shutdown()
+
+    # Las páginas siguen next_before desde la más reciente, sin repetir ni saltar filas
+    ids, before = [], None
+    while True:
+        page = history.query(limit=3, before=before)
+        assert len(page["runs"]) <= 3
+        ids += [run["id"] for run in page["runs"]]
+        before = page["next_before"]
+        if before is None:
+            break
+        assert before == ids[-1]
+    assert ids == list(range(7, 0, -1))
+
+    # Los filtros se combinan con el cursor
+    first = history.query(geometry="plate", limit=2)
+    assert [run["input_hash"] for run in first["runs"]] == ["h5", "h3"]
+    second = history.query(geometry="plate", limit=2, before=first["next_before"])
+    assert [run["input_hash"] for run in second["runs"]] == ["h1"]
+    assert second["next_before"] is None
+
+    window = history.query(time_min=2.0, time_max=4.0)
+    assert [run["time"] for run in window["runs"]] == [4.0, 3.0, 2.0]
@@ -0,0 +1,24 @@
+# backend/tests/test_series.py
+
+import numpy as np
+import pytest
+from app.calculations.eigenvalues import solve_eigenvalues
+from app.calculations.series import MAX_TERMS, evaluate_series, required_terms, truncation_bound
+from app.models.convection_models import GEOMETRIES
+
+
+@pytest.mark.parametrize("geometry", GEOMETRIES)
+@pytest.mark.parametrize("biot", [0.1, 1.0, 100.0])
+def test_required_terms_meet_the_accuracy(geometry, biot):
+    dimensionless_time = np.array([1e-3, 1e-2, 0.1, 1.0])
+    accuracy = 1e-8
+    # Referencia: la serie con todos los términos
+    reference = evaluate_series(geometry, solve_eigenvalues(geometry, biot, MAX_TERMS).roots,
+                                dimensionless_time, np.full(4, 0.5))
+    terms = required_terms(dimensionless_time, accuracy)
+    for index, count in enumerate(terms.tolist()):
+        tail = reference.value_theta[index, count:].sum()
+        heat_tail = reference.value_q[index, count:].sum()
+        bound = truncation_bound(count, dimensionless_time[index])
+        assert abs(tail) <= bound <= accuracy
+        assert abs(heat_tail) <= bound
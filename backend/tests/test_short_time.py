@@ -0,0 +1,85 @@
+# backend/tests/test_short_time.py
+
+import pytest
+from app.models.convection_models import ConvectionInput
+from app.models.inverse_models import TimeToTemperatureInput
+from app.models.multidimensional_models import MultidimensionalInput
+from app.services.convection_service import (
+    compute_convection_record,
+    perform_batch_convection_calculation,
+    perform_time_to_temperature
+)
+from app.services.multidimensional_service import perform_multidimensional_calculation
+
+MATERIAL = dict(thickness=0.1, conductivity_coefficient=20.0, convection_coefficient=100.0,
+                initial_temperature=300.0, ambient_temperature=20.0, density=7800.0,
+                specific_heat=460.0, iterations=100)
+# Fo = 0.0223 (tiempo corto) y Fo = 0.669
+SHORT_TIME, LONG_TIME = 10.0, 300.0
+
+
+def _input(geometry, time, distance=0.045, **kwargs):
+    return ConvectionInput(**MATERIAL, geometry=geometry, time=time, distance=distance, **kwargs)
+
+
+@pytest.mark.parametrize("geometry", ["plate", "sphere"])
+def test_short_times_use_the_semi_infinite_solution(geometry):
+    record = compute_convection_record(_input(geometry, SHORT_TIME)).to_dict()
+    assert record["model"] == "semi_infinite"
+    assert record["lamb"] is None
+    assert record["model_error"] <= 1e-8
+    assert compute_convection_record(_input(geometry, LONG_TIME)).to_dict()["model"] == "series"
+
+
+@pytest.mark.parametrize("geometry", ["plate", "sphere"])
+def test_semi_infinite_solution_matches_the_series(geometry):
+    short = compute_convection_record(_input(geometry, SHORT_TIME)).to_dict()
+    # Con una precisión mayor que la cota la serie se usa en el mismo punto
+    series = compute_convection_record(_input(geometry, SHORT_TIME, accuracy=1e-30)).to_dict()
+    assert series["model"] == "series"
+    assert short["value_theta"] == pytest.approx(series["value_theta"], abs=1e-8)
+    assert short["value_q"] == pytest.approx(series["value_q"], abs=1e-8)
+
+
+def test_cylinder_always_uses_the_series():
+    assert compute_convection_record(_input("cylinder", SHORT_TIME)).to_dict()["model"] == "series"
+
+
+def test_batch_rows_switch_like_the_scalar_calculation():
+    rows = [_input(geometry, time) for geometry in ("plate", "cylinder", "sphere")
+            for time in (0.0, SHORT_TIME, LONG_TIME)]
+    for row, result in zip(rows, perform_batch_convection_calculation(rows)):
+        data = result["data"]
+        if row.time == 0.0:
+            assert data["model"] == "series"
+            assert data["tem"] == 300.0
+            continue
+        expected = compute_convection_record(row).to_dict()
+        assert data["model"] == expected["model"]
+        assert data["tem"] == pytest.approx(expected["tem"], abs=1e-6)
+        if data["model"] == "semi_infinite":
+            assert data["lamb"] is None and data["terms"] is None
+            assert data["model_error"] == pytest.approx(expected["model_error"])
+
+
+def test_multidimensional_plate_factors_switch():
+    result = perform_multidimensional_calculation(MultidimensionalInput(
+        **{key: value for key, value in MATERIAL.items() if key != "thickness"},
+        geometry="short_cylinder", thicknesses=[0.1, 0.1], distances=[[0.0], [0.045]],
+        times=[SHORT_TIME, LONG_TIME]))
+    cylinder, plate = result["factors"]
+    assert cylinder["model"] == ["series", "series"]
+    assert plate["model"] == ["semi_infinite", "series"]
+
+
+@pytest.mark.parametrize("geometry", ["plate", "sphere"])
+def test_time_to_temperature_inverts_both_models(geometry):
+    targets = [compute_convection_record(_input(geometry, time)).tem
+               for time in (SHORT_TIME, LONG_TIME)]
+    result = perform_time_to_temperature(TimeToTemperatureInput(
+        **MATERIAL, geometry=geometry, distance=0.045, target_temperature=targets))
+    short, long = result["crossings"]
+    assert short["model"] == "semi_infinite"
+    assert long["model"] == "series"
+    assert short["time"] == pytest.approx(SHORT_TIME, rel=1e-6)
+    assert long["time"] == pytest.approx(LONG_TIME, rel=1e-6)
@@ -0,0 +1,82 @@
+# backend/tests/test_sweep.py
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.calculations.sweep import SweepAxis, evaluate_sweep_chunk
+from app.models.convection_models import ConvectionInput
+from app.models.sweep_models import SweepInput
+from app.services.convection_service import compute_convection_record
+from app.services.sweep_service import build_sweep_grid
+
+BASE = {"thickness": 0.1, "conductivity_coefficient": 20.0, "convection_coefficient": 100.0,
+        "initial_temperature": 300.0, "ambient_temperature": 20.0, "density": 7800.0,
+        "specific_heat": 460.0, "distance": 0.02, "iterations": 100}
+
+
+@pytest.mark.parametrize("start, stop, points", [(0.0, 1.0, 11), (0.1, 0.7, 7), (3.0, -2.5, 1000)])
+def test_range_axis_matches_linspace(start, stop, points):
+    axis = SweepAxis("time", start=start, stop=stop, points=points)
+    expected = np.linspace(start, stop, points)
+    assert np.array_equal(axis.take(np.arange(points)), expected)
+    # Índices sueltos, incluido el último, sin construir el eje
+    index = np.array([points - 1, 0, points // 2])
+    assert np.array_equal(axis.take(index), expected[index])
+    assert axis.take(np.array([points - 1]))[0] == stop
+
+
+def test_one_point_range():
+    axis = SweepAxis("time", start=5.0, stop=9.0, points=1)
+    assert axis.size == 1
+    assert np.array_equal(axis.take(np.array([0])), np.linspace(5.0, 9.0, 1))
+
+
+def test_axes_are_reordered_and_values_follow_the_grid():
+    grid = build_sweep_grid(SweepInput(base=BASE, parameters={
+        "time": {"start": 100.0, "stop": 600.0, "points": 3},
+        "geometry": ["plate", "sphere"],
+    }))
+    # La geometría va primero aunque se haya dado después
+    assert [axis.name for axis in grid.axes] == ["geometry", "time"]
+    assert grid.shape == (2, 3)
+    values = grid.values(0, grid.size)
+    assert values["geometry"].tolist() == ["plate"] * 3 + ["sphere"] * 3
+    assert values["time"].tolist() == [100.0, 350.0, 600.0] * 2
+
+
+def test_chunk_spanning_two_geometries():
+    grid = build_sweep_grid(SweepInput(base=BASE, parameters={
+        "geometry": ["plate", "sphere"],
+        "time": {"start": 100.0, "stop": 600.0, "points": 3},
+    }))
+    chunk = evaluate_sweep_chunk(grid, 2, 5)
+    assert chunk["parameters"]["geometry"].tolist() == ["plate", "sphere", "sphere"]
+    for offset, (geometry, time) in enumerate([("plate", 600.0), ("sphere", 100.0),
+                                               ("sphere", 350.0)]):
+        expected = compute_convection_record(ConvectionInput(
+            **BASE, geometry=geometry, time=time, allow_lumped=False)).to_dict()
+        assert chunk["tem"][offset] == pytest.approx(expected["tem"], abs=1e-6)
+        assert chunk["biot"][offset] == pytest.approx(expected["biot"])
+        assert chunk["model"][offset] == expected["model"]
+
+
+@pytest.mark.parametrize("base, parameters, detail", [
+    ({**BASE, "time": 10.0}, {"time": [1.0, 2.0]}, "no puede ser fijo y variable"),
+    ({**BASE, "time": 10.0}, {"geometry": {"start": 0, "stop": 1, "points": 2}},
+     "'geometry' solo admite una lista"),
+    ({**{key: value for key, value in BASE.items() if key != "distance"}, "geometry": "plate"},
+     {"time": {"start": 1.0, "stop": 2.0, "points": 10_000},
+      "distance": {"start": 0.0, "stop": 0.05, "points": 10_000}},
+     "demasiados puntos"),
+    ({**BASE, "geometry": "plate"}, {"time": {"start": 1.0, "stop": 2.0, "points": 0}},
+     "al menos un punto"),
+    ({**BASE, "time": 10.0}, {"geometry": ["plate", "cube"]}, "geometría incorrecta"),
+])
+def test_invalid_sweeps_are_rejected(base, parameters, detail):
+    with pytest.raises(ValueError, match=detail):
+        build_sweep_grid(SweepInput(base=base, parameters=parameters))
+    response = TestClient(app).post("/convection/sweep", json={"base": base,
+                                                               "parameters": parameters})
+    assert response.status_code == 400
+    assert detail in response.json()["detail"]
@@ -16,6 +16,10 @@ const ResultItem = ({ label, value }) => (
     </div>
 )
 
+// Nombre de cada modelo y su nota cuando no hay términos de la serie
+const MODEL_LABELS = { lumped: "Concentrado", semi_infinite: "Sólido semi-infinito", one_term: "Un término" }
+const CLOSED_FORM_NOTES = { lumped: "el modelo concentrado", semi_infinite: "la solución de sólido semi-infinito (tiempos cortos)" }
+
 const CalcSection = ({ calc, title }) => (
     <div className="space-y-3 sm:space-y-4">
         <h3 className="text-lg sm:text-xl font-semibold text-gray-200">{title}</h3>
@@ -71,30 +75,40 @@ export default function ResultadosDrawer({ data }) {
                                 <ResultItem label="Biot" value={data.biot} />
                                 <ResultItem label="Geometría" value={data.geometry} />
                                 <ResultItem label="Q Max" value={data.q_max} />
+                                <ResultItem label="Modelo" value={MODEL_LABELS[data.model] ?? "Serie"} />
                             </div>
                         </TabsContent>
                         <TabsContent value="calculos" className="mt-3 sm:mt-4">
-                            <div className="space-y-6 sm:space-y-8">
-                                <CalcSection calc={data.calc1} title="Cálculo 1" />
-                                <CalcSection calc={data.calc2} title="Cálculo 2" />
-                                <CalcSection calc={data.calc3} title="Cálculo 3" />
-                            </div>
+                            {data.calc1 ? (
+                                <div className="space-y-6 sm:space-y-8">
+                                    <CalcSection calc={data.calc1} title="Cálculo 1" />
+                                    {data.calc2 && <CalcSection calc={data.calc2} title="Cálculo 2" />}
+                                    {data.calc3 && <CalcSection calc={data.calc3} title="Cálculo 3" />}
+                                </div>
+                            ) : (
+                                <div className="text-gray-400">Calculado con {CLOSED_FORM_NOTES[data.model] ?? "el modelo concentrado"}, sin términos de la serie.</div>
+                            )}
                         </TabsContent>
                         <TabsContent value="lambda" className="mt-3 sm:mt-4">
-                            <div className="grid grid-cols-1 sm:grid-cols-3 gap-3 sm:gap-4">
-                                <ResultItem label="Lambda 1" value={data.lamb.lambda1} />
-                                <ResultItem label="Lambda 2" value={data.lamb.lambda2} />
-                                <ResultItem label="Lambda 3" value={data.lamb.lambda3} />
-                            </div>
+                            {data.lamb ? (
+                                <div className="grid grid-cols-1 sm:grid-cols-3 gap-3 sm:gap-4">
+                                    <ResultItem label="Lambda 1" value={data.lamb.lambda1} />
+                                    {data.lamb.lambda2 != null && <ResultItem label="Lambda 2" value={data.lamb.lambda2} />}
+                                    {data.lamb.lambda3 != null && <ResultItem label="Lambda 3" value={data.lamb.lambda3} />}
+                                </div>
+                            ) : (
+                                <div className="text-gray-400">Calculado con {CLOSED_FORM_NOTES[data.model] ?? "el modelo concentrado"}, sin valores lambda.</div>
+                            )}
                         </TabsContent>
                         <TabsContent value="final" className="mt-3 sm:mt-4">
                             <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-3 sm:gap-4">
-                                <ResultItem label="Valor A" value={data.value_a} />
+                                {data.value_a != null && <ResultItem label="Valor A" value={data.value_a} />}
                                 <ResultItem label="Valor Theta O" value={data.value_theta_o} />
                                 <ResultItem label="Valor Theta" value={data.value_theta} />
                                 <ResultItem label="Valor Q" value={data.value_q} />
                                 <ResultItem label="Temperatura" value={data.tem} />
                                 <ResultItem label="Q" value={data.q} />
+                                {data.model_error != null && <ResultItem label="Error del modelo" value={data.model_error} />}
                             </div>
                         </TabsContent>
                     </Tabs>